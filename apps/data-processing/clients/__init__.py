@@ -1,25 +1,43 @@
-from typing import Dict, Any
+from typing import Any, Dict, Optional
 
+from .base import BaseClient
 from .x_client import XClient
 from .raydium_client import RaydiumClient
 from .dex_screener_client import DexScreenerClient
 from .forum_client import ForumClient
+from .rate_limiter import RateLimiter, TokenBucket, RedisTokenBucket, create_rate_limiter
+from .cache import ResponseCache, create_response_cache
+from .json_stream import JSONArrayStream, iter_json_array
 
-__all__ = ['XClient', 'RaydiumClient', 'DexScreenerClient', 'ForumClient', 'create_clients']
+__all__ = [
+    'BaseClient', 'XClient', 'RaydiumClient', 'DexScreenerClient', 'ForumClient', 'create_clients',
+    'RateLimiter', 'TokenBucket', 'RedisTokenBucket', 'create_rate_limiter',
+    'ResponseCache', 'create_response_cache', 'JSONArrayStream', 'iter_json_array'
+]
 
-def create_clients(config: Dict[str, Any]) -> Dict[str, Any]:
+def create_clients(config: Dict[str, Any], redis_client: Any = None) -> Dict[str, Any]:
     """
     Create instances of all API clients.
     
     Args:
         config: Configuration dictionary containing settings for all clients
+        redis_client: Optional Redis connection used to share rate limits
+            and cached responses between pipeline workers
         
     Returns:
         Dictionary containing client instances
     """
+    api = config['api']
+    BaseClient.configure_http(api.get('http', {}))
+    BaseClient.configure_cache(create_response_cache(api.get('cache', {}), redis_client))
+    limiter_settings = api.get('rate_limiter', {})
+    
+    def limiter(name: str) -> Optional[RateLimiter]:
+        return create_rate_limiter(name, api[name], limiter_settings, redis_client)
+        
     return {
-        'x': XClient(config['api']['x']),
-        'raydium': RaydiumClient(config['api']['raydium']),
-        'dex_screener': DexScreenerClient(config['api']['dex_screener']),
+        'x': XClient(api['x'], limiter('x'), state_store=redis_client),
+        'raydium': RaydiumClient(api['raydium'], limiter('raydium')),
+        'dex_screener': DexScreenerClient(api['dex_screener'], limiter('dex_screener')),
         'forum': ForumClient(config['data'])
     } 
\ No newline at end of file
@@ -1,25 +1,108 @@
 from abc import ABC, abstractmethod
+import asyncio
 import logging
-import time
 from typing import Any, Dict, Optional
+from urllib.parse import urlparse
+import aiohttp
 import requests
-from tenacity import retry, stop_after_attempt, wait_exponential
+from tenacity import AsyncRetrying, Retrying, stop_after_attempt, wait_exponential
+
+from .cache import ResponseCache
+from .rate_limiter import RateLimiter, TokenBucket
 
 logger = logging.getLogger(__name__)
 
 class BaseClient(ABC):
     """Base class for all API clients with common functionality."""
     
-    def __init__(self, config: Dict[str, Any]):
+    # Async transport shared by every client, so all providers reuse one
+    # connection pool and its keep-alive connections.
+    _http_settings: Dict[str, Any] = {}
+    _async_session: Optional[aiohttp.ClientSession] = None
+    _async_session_loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    # HTTP response cache shared by every client
+    response_cache: Optional[ResponseCache] = None
+    
+    def __init__(self, config: Dict[str, Any], rate_limiter: Optional[RateLimiter] = None):
         """
         Initialize the base client.
         
         Args:
             config: Configuration dictionary containing API settings
+            rate_limiter: Optional rate limiter, e.g. one shared between workers.
+                Defaults to a local token bucket when ``rate_limit`` is configured.
         """
         self.config = config
         self.session = requests.Session()
+        self.retry_attempts = config.get('retry_attempts', 3)
+        self.cache_ttls = config.get('cache_ttls', {})
+        
+        if rate_limiter is None and config.get('rate_limit'):
+            rate_limiter = TokenBucket(config['rate_limit'], config.get('burst'))
+        self.rate_limiter = rate_limiter
+        
+    @classmethod
+    def configure_http(cls, settings: Dict[str, Any]):
+        """
+        Configure the shared async connection pool.
         
+        Takes effect the next time the shared session is created.
+        
+        Args:
+            settings: Connection pool settings (pool_size, pool_size_per_host,
+                keepalive_timeout, dns_cache_ttl, timeout)
+        """
+        BaseClient._http_settings = dict(settings or {})
+        
+    @classmethod
+    def configure_cache(cls, cache: Optional[ResponseCache]):
+        """
+        Set the HTTP response cache shared by all clients.
+        
+        Args:
+            cache: Response cache, or None to disable caching
+        """
+        BaseClient.response_cache = cache
+        
+    @classmethod
+    def get_async_session(cls) -> aiohttp.ClientSession:
+        """
+        Get the async HTTP session shared by all clients.
+        
+        The session is created lazily on the running event loop and recreated
+        if it was closed or belongs to a loop that is no longer running.
+        
+        Returns:
+            Shared aiohttp client session
+        """
+        loop = asyncio.get_running_loop()
+        session = BaseClient._async_session
+        if session is None or session.closed or BaseClient._async_session_loop is not loop:
+            settings = BaseClient._http_settings
+            connector = aiohttp.TCPConnector(
+                limit=settings.get('pool_size', 100),
+                limit_per_host=settings.get('pool_size_per_host', 20),
+                keepalive_timeout=settings.get('keepalive_timeout', 30),
+                ttl_dns_cache=settings.get('dns_cache_ttl', 300)
+            )
+            session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=settings.get('timeout', 30))
+            )
+            BaseClient._async_session = session
+            BaseClient._async_session_loop = loop
+        return session
+        
+    @classmethod
+    async def close_async_session(cls):
+        """Close the shared async HTTP session."""
+        session = BaseClient._async_session
+        BaseClient._async_session = None
+        BaseClient._async_session_loop = None
+        if session is not None and not session.closed:
+            await session.close()
+            
     @abstractmethod
     def validate_response(self, response: Dict[str, Any]) -> bool:
         """
@@ -33,7 +116,60 @@ class BaseClient(ABC):
         """
         pass
     
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10))
+    def _retry_policy(self) -> Dict[str, Any]:
+        """Retry settings shared by the sync and async request paths."""
+        return {
+            'stop': stop_after_attempt(self.retry_attempts),
+            'wait': wait_exponential(multiplier=1, min=4, max=10)
+        }
+        
+    def _back_off(self, retry_after: Optional[str]):
+        """
+        Make the rate limiter pause after the provider answered 429.
+        
+        Args:
+            retry_after: Value of the Retry-After header, if any
+        """
+        if self.rate_limiter is None:
+            return
+        try:
+            seconds = float(retry_after)
+        except (TypeError, ValueError):
+            seconds = 1.0
+        logger.warning(f"Rate limited by provider, backing off for {seconds:.1f}s")
+        self.rate_limiter.penalize(seconds)
+        
+    def _cache_key(self, method: str, url: str, params: Optional[Dict[str, Any]]) -> Optional[str]:
+        """Get the cache key of a request, or None if it is not cacheable."""
+        if self.response_cache is None or method.upper() != 'GET':
+            return None
+        return self.response_cache.make_key(method, url, params)
+        
+    def _cache_ttl(self, url: str) -> float:
+        """
+        Get the fallback freshness lifetime for an endpoint.
+        
+        Uses the longest ``cache_ttls`` path fragment contained in the URL
+        path, then the client-wide ``cache_ttl``, then 0 (revalidate always).
+        
+        Args:
+            url: Request URL
+            
+        Returns:
+            Freshness lifetime in seconds
+        """
+        path = urlparse(url).path
+        matches = [fragment for fragment in self.cache_ttls if fragment in path]
+        if matches:
+            return self.cache_ttls[max(matches, key=len)]
+        return self.config.get('cache_ttl', 0)
+        
+    def _lookup_cache(self, cache_key: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Get the cached entry for a request, fresh or stale."""
+        if cache_key is None:
+            return None
+        return self.response_cache.get(cache_key)
+        
     def _make_request(self, 
                      method: str, 
                      url: str, 
@@ -41,7 +177,13 @@ class BaseClient(ABC):
                      params: Optional[Dict[str, Any]] = None,
                      data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
-        Make an HTTP request with retry logic.
+        Make an HTTP request with rate limiting and retry logic.
+        
+        Every attempt takes a token from the client's rate limiter and the
+        number of attempts follows the ``retry_attempts`` setting. GET
+        responses go through the shared response cache: fresh entries are
+        served without a request, stale ones are revalidated with
+        If-None-Match / If-Modified-Since.
         
         Args:
             method: HTTP method (GET, POST, etc.)
@@ -54,8 +196,32 @@ class BaseClient(ABC):
             Dict containing the response data
             
         Raises:
-            requests.exceptions.RequestException: If request fails after retries
+            tenacity.RetryError: If request fails after retries
         """
+        cache_key = self._cache_key(method, url, params)
+        cached = self._lookup_cache(cache_key)
+        if cached is not None and ResponseCache.is_fresh(cached):
+            return cached['data']
+            
+        for attempt in Retrying(**self._retry_policy()):
+            with attempt:
+                return self._send_request(method, url, headers, params, data, cache_key, cached)
+                
+    def _send_request(self,
+                      method: str,
+                      url: str,
+                      headers: Optional[Dict[str, str]] = None,
+                      params: Optional[Dict[str, Any]] = None,
+                      data: Optional[Dict[str, Any]] = None,
+                      cache_key: Optional[str] = None,
+                      cached: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Send a single request attempt on the blocking session."""
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+            
+        if cached is not None:
+            headers = {**(headers or {}), **ResponseCache.conditional_headers(cached)}
+            
         try:
             response = self.session.request(
                 method=method,
@@ -65,18 +231,105 @@ class BaseClient(ABC):
                 json=data,
                 timeout=30
             )
+            if response.status_code == 304 and cached is not None:
+                entry = self.response_cache.refresh(cache_key, cached, response.headers, self._cache_ttl(url))
+                return entry['data']
+            if response.status_code == 429:
+                self._back_off(response.headers.get('Retry-After'))
             response.raise_for_status()
             
             data = response.json()
             if not self.validate_response(data):
                 raise ValueError("Invalid response format")
                 
+            if cache_key is not None:
+                self.response_cache.store(cache_key, data, response.headers, self._cache_ttl(url))
+                
             return data
             
         except requests.exceptions.RequestException as e:
             logger.error(f"Request failed: {str(e)}")
             raise
             
+    async def _make_request_async(self,
+                                  method: str,
+                                  url: str,
+                                  headers: Optional[Dict[str, str]] = None,
+                                  params: Optional[Dict[str, Any]] = None,
+                                  data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Make an HTTP request on the shared async session with retry logic.
+        
+        Async counterpart of ``_make_request`` with the same rate limiting,
+        caching, retry and validation semantics.
+        
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            url: Request URL
+            headers: Optional request headers
+            params: Optional query parameters
+            data: Optional request body
+            
+        Returns:
+            Dict containing the response data
+            
+        Raises:
+            tenacity.RetryError: If request fails after retries
+        """
+        cache_key = self._cache_key(method, url, params)
+        cached = self._lookup_cache(cache_key)
+        if cached is not None and ResponseCache.is_fresh(cached):
+            return cached['data']
+            
+        async for attempt in AsyncRetrying(**self._retry_policy()):
+            with attempt:
+                return await self._send_request_async(method, url, headers, params, data, cache_key, cached)
+                
+    async def _send_request_async(self,
+                                  method: str,
+                                  url: str,
+                                  headers: Optional[Dict[str, str]] = None,
+                                  params: Optional[Dict[str, Any]] = None,
+                                  data: Optional[Dict[str, Any]] = None,
+                                  cache_key: Optional[str] = None,
+                                  cached: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Send a single request attempt on the shared async session."""
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire_async()
+            
+        if cached is not None:
+            headers = {**(headers or {}), **ResponseCache.conditional_headers(cached)}
+            
+        session = self.get_async_session()
+        try:
+            async with session.request(
+                method=method,
+                url=url,
+                headers=headers,
+                params=params,
+                json=data
+            ) as response:
+                if response.status == 304 and cached is not None:
+                    entry = self.response_cache.refresh(cache_key, cached, response.headers, self._cache_ttl(url))
+                    return entry['data']
+                if response.status == 429:
+                    self._back_off(response.headers.get('Retry-After'))
+                response.raise_for_status()
+                data = await response.json(content_type=None)
+                response_headers = response.headers
+                
+            if not self.validate_response(data):
+                raise ValueError("Invalid response format")
+                
+            if cache_key is not None:
+                self.response_cache.store(cache_key, data, response_headers, self._cache_ttl(url))
+                
+            return data
+            
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.error(f"Request failed: {str(e)}")
+            raise
+            
     def close(self):
         """Close the client session."""
         self.session.close() 
\ No newline at end of file
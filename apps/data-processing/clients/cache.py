@@ -0,0 +1,250 @@
+from collections import OrderedDict
+import hashlib
+import json
+import logging
+import threading
+import time
+from typing import Any, Dict, Mapping, Optional
+
+logger = logging.getLogger(__name__)
+
+def parse_cache_control(value: Optional[str]) -> Dict[str, Optional[str]]:
+    """
+    Parse a Cache-Control header into its directives.
+    
+    Args:
+        value: Raw header value
+    
+    Returns:
+        Dictionary mapping lower-cased directive names to their values
+    """
+    directives = {}
+    for part in (value or '').split(','):
+        name, _, argument = part.strip().partition('=')
+        if name:
+            directives[name.lower()] = argument.strip('"') or None
+    return directives
+
+
+class ResponseCache:
+    """
+    HTTP response cache shared by the API clients.
+    
+    Entries live in an in-process LRU and, optionally, in Redis so that other
+    workers and later runs can reuse them. Each entry keeps the decoded body
+    together with its ETag/Last-Modified validators and freshness deadline.
+    Entries are held JSON encoded, so every lookup returns a copy callers may
+    modify, and bodies larger than ``max_body_bytes`` are not cached at all.
+    Streamed responses such as the Raydium pools listing never reach it.
+    """
+    
+    def __init__(self,
+                 max_entries: int = 1024,
+                 stale_ttl: int = 86400,
+                 redis_client: Any = None,
+                 key_prefix: str = 'httpcache',
+                 max_body_bytes: int = 1048576):
+        """
+        Initialize the response cache.
+        
+        Args:
+            max_entries: Maximum number of entries kept in process
+            stale_ttl: Seconds to keep entries with validators after they went
+                stale, so they can still be revalidated with a 304
+            redis_client: Optional Redis client backing the in-process LRU
+            key_prefix: Prefix for Redis keys
+            max_body_bytes: Largest JSON encoded entry that is cached
+        """
+        self.max_entries = max_entries
+        self.stale_ttl = stale_ttl
+        self.redis_client = redis_client
+        self.key_prefix = key_prefix
+        self.max_body_bytes = max_body_bytes
+        self._entries: 'OrderedDict[str, str]' = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def make_key(self, method: str, url: str, params: Optional[Mapping[str, Any]] = None) -> str:
+        """
+        Build the cache key for a request.
+        
+        Args:
+            method: HTTP method
+            url: Request URL
+            params: Optional query parameters
+        
+        Returns:
+            Cache key
+        """
+        query = json.dumps(sorted((params or {}).items()), default=str)
+        digest = hashlib.sha1(f"{method.upper()} {url} {query}".encode('utf-8')).hexdigest()
+        return f"{self.key_prefix}:{digest}"
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached entry, fresh or stale.
+        
+        Args:
+            key: Cache key
+        
+        Returns:
+            Copy of the cache entry if present, None otherwise
+        """
+        with self._lock:
+            raw = self._entries.get(key)
+            if raw is not None:
+                self._entries.move_to_end(key)
+        
+        if raw is None and self.redis_client is not None:
+            try:
+                raw = self.redis_client.get(key)
+            except Exception as e:
+                logger.error(f"Error reading HTTP cache: {str(e)}")
+                return None
+            if raw:
+                raw = raw.decode('utf-8') if isinstance(raw, bytes) else raw
+                self._remember(key, raw)
+        
+        return json.loads(raw) if raw else None
+    
+    def store(self,
+              key: str,
+              data: Any,
+              headers: Mapping[str, str],
+              default_ttl: float = 0) -> Optional[Dict[str, Any]]:
+        """
+        Store a response body according to its caching headers.
+        
+        ``max-age`` from Cache-Control wins over the configured endpoint TTL;
+        ``no-store`` skips caching and ``no-cache`` forces revalidation.
+        Bodies over ``max_body_bytes`` once encoded are not cached.
+        
+        Args:
+            key: Cache key
+            data: Decoded response body
+            headers: Response headers
+            default_ttl: Freshness lifetime used when the provider sends none
+        
+        Returns:
+            The stored entry, or None if the response must not be cached
+        """
+        directives = parse_cache_control(headers.get('Cache-Control'))
+        if 'no-store' in directives:
+            return None
+        
+        ttl = default_ttl
+        if 'no-cache' in directives:
+            ttl = 0
+        else:
+            for name in ('s-maxage', 'max-age'):
+                value = directives.get(name)
+                if value and value.isdigit():
+                    ttl = int(value)
+                    break
+        
+        entry = {
+            'data': data,
+            'etag': headers.get('ETag'),
+            'last_modified': headers.get('Last-Modified'),
+            'expires_at': time.time() + ttl
+        }
+        has_validators = bool(entry['etag'] or entry['last_modified'])
+        if ttl <= 0 and not has_validators:
+            return None
+        
+        raw = json.dumps(entry)
+        if len(raw) > self.max_body_bytes:
+            logger.debug(f"Not caching {len(raw)} byte response over the {self.max_body_bytes} byte limit")
+            with self._lock:
+                self._entries.pop(key, None)
+            return None
+        
+        self._remember(key, raw)
+        
+        if self.redis_client is not None:
+            retention = ttl + (self.stale_ttl if has_validators else 0)
+            try:
+                self.redis_client.set(key, raw, ex=max(1, int(retention)))
+            except Exception as e:
+                logger.error(f"Error writing HTTP cache: {str(e)}")
+        
+        return entry
+    
+    def refresh(self, key: str, entry: Dict[str, Any], headers: Mapping[str, str], default_ttl: float = 0) -> Dict[str, Any]:
+        """
+        Renew a stale entry after the provider answered 304 Not Modified.
+        
+        Args:
+            key: Cache key
+            entry: The revalidated entry
+            headers: Headers of the 304 response
+            default_ttl: Freshness lifetime used when the provider sends none
+        
+        Returns:
+            The renewed entry
+        """
+        merged = {
+            'ETag': headers.get('ETag') or entry.get('etag'),
+            'Last-Modified': headers.get('Last-Modified') or entry.get('last_modified'),
+            'Cache-Control': headers.get('Cache-Control')
+        }
+        merged = {name: value for name, value in merged.items() if value}
+        return self.store(key, entry['data'], merged, default_ttl) or entry
+    
+    @staticmethod
+    def is_fresh(entry: Dict[str, Any]) -> bool:
+        """Check whether an entry can be served without contacting the provider."""
+        return entry['expires_at'] > time.time()
+    
+    @staticmethod
+    def conditional_headers(entry: Dict[str, Any]) -> Dict[str, str]:
+        """
+        Build the validator headers for revalidating an entry.
+        
+        Args:
+            entry: Stale cache entry
+        
+        Returns:
+            If-None-Match / If-Modified-Since headers
+        """
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+    
+    def _remember(self, key: str, raw: str):
+        """Insert an encoded entry into the in-process LRU, evicting the oldest ones."""
+        with self._lock:
+            self._entries[key] = raw
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+def create_response_cache(settings: Dict[str, Any], redis_client: Any = None) -> Optional[ResponseCache]:
+    """
+    Create the response cache shared by the API clients.
+    
+    Args:
+        settings: Cache settings (enabled, backend, max_entries, stale_ttl,
+            key_prefix, max_body_bytes)
+        redis_client: Connected Redis client, used by the redis backend
+    
+    Returns:
+        Response cache, or None if caching is disabled
+    """
+    if not settings.get('enabled', True):
+        return None
+    
+    use_redis = settings.get('backend', 'memory') == 'redis'
+    if use_redis and redis_client is None:
+        logger.warning("No Redis connection for the HTTP cache, keeping it in memory only")
+    
+    return ResponseCache(
+        max_entries=settings.get('max_entries', 1024),
+        stale_ttl=settings.get('stale_ttl', 86400),
+        redis_client=redis_client if use_redis else None,
+        key_prefix=settings.get('key_prefix', 'httpcache'),
+        max_body_bytes=settings.get('max_body_bytes', 1048576)
+    )
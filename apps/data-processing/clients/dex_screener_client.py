@@ -1,25 +1,30 @@
+import asyncio
 import logging
-from typing import Any, Dict, List
-import time
+from typing import Any, Dict, Iterable, List, Optional
 
 from .base import BaseClient
+from .rate_limiter import RateLimiter
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of comma-separated addresses accepted by /tokens
+MAX_TOKENS_PER_REQUEST = 30
+
 class DexScreenerClient(BaseClient):
     """Client for fetching token metrics from DexScreener."""
     
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self, config: Dict[str, Any], rate_limiter: Optional[RateLimiter] = None):
         """
         Initialize the DexScreener client.
         
         Args:
             config: Configuration dictionary containing DexScreener API settings
+            rate_limiter: Optional rate limiter shared with other workers
         """
-        super().__init__(config)
+        super().__init__(config, rate_limiter)
         self.endpoint = config['endpoint']
-        self.rate_limit = config['rate_limit']
-        self.last_request_time = 0
+        self.batch_size = min(config.get('batch_size', MAX_TOKENS_PER_REQUEST), MAX_TOKENS_PER_REQUEST)
+        self.max_concurrency = config.get('max_concurrency', 10)
         
     def validate_response(self, response: Dict[str, Any]) -> bool:
         """
@@ -48,14 +53,6 @@ class DexScreenerClient(BaseClient):
                 
         return True
         
-    def _rate_limit(self):
-        """Implement rate limiting."""
-        current_time = time.time()
-        elapsed = current_time - self.last_request_time
-        if elapsed < 1.0 / self.rate_limit:
-            time.sleep(1.0 / self.rate_limit - elapsed)
-        self.last_request_time = time.time()
-        
     def get_token_metrics(self, token_address: str) -> Dict[str, Any]:
         """
         Fetch metrics for a specific token.
@@ -69,13 +66,157 @@ class DexScreenerClient(BaseClient):
         Raises:
             ValueError: If token is not found
         """
-        self._rate_limit()
-        
         response = self._make_request(
             method='GET',
             url=f"{self.endpoint}/tokens/{token_address}"
         )
         
+        return self._parse_token_metrics(token_address, response)
+        
+    async def get_token_metrics_async(self, token_address: str) -> Dict[str, Any]:
+        """
+        Fetch metrics for a specific token on the shared async session.
+        
+        Args:
+            token_address: The address of the token to fetch metrics for
+            
+        Returns:
+            Token metrics dictionary
+            
+        Raises:
+            ValueError: If token is not found
+        """
+        response = await self._make_request_async(
+            method='GET',
+            url=f"{self.endpoint}/tokens/{token_address}"
+        )
+        
+        return self._parse_token_metrics(token_address, response)
+        
+    def _chunk_addresses(self, addresses: Iterable[str]) -> List[List[str]]:
+        """
+        Deduplicate addresses and split them into provider-sized chunks.
+        
+        Args:
+            addresses: Token addresses
+            
+        Returns:
+            List of address chunks of at most ``batch_size`` addresses
+        """
+        unique = list(dict.fromkeys(addresses))
+        return [unique[i:i + self.batch_size] for i in range(0, len(unique), self.batch_size)]
+        
+    def _split_token_metrics(self, addresses: List[str], response: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """
+        Split a multi-token response back out into per-token metrics.
+        
+        A pair belongs to every requested token that is its base or quote token,
+        exactly like the pairs returned by a single-token request.
+        
+        Args:
+            addresses: Token addresses requested in the chunk
+            response: DexScreener tokens response for the chunk
+            
+        Returns:
+            Dictionary mapping token address to its metrics
+        """
+        requested = {address.lower(): address for address in addresses}
+        pairs_by_token: Dict[str, List[Dict[str, Any]]] = {address: [] for address in addresses}
+        
+        for pair in response.get('pairs') or []:
+            matched = set()
+            for side in ('baseToken', 'quoteToken'):
+                address = requested.get(str(pair[side].get('address', '')).lower())
+                if address is not None and address not in matched:
+                    pairs_by_token[address].append(pair)
+                    matched.add(address)
+                    
+        metrics = {}
+        for address, pairs in pairs_by_token.items():
+            if not pairs:
+                logger.warning(f"No pairs found for token {address}")
+                continue
+            metrics[address] = self._parse_token_metrics(address, {'pairs': pairs})
+            
+        return metrics
+        
+    def get_tokens_metrics(self, addresses: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch metrics for many tokens using comma-separated batch requests.
+        
+        A chunk that keeps failing is logged and skipped so the other chunks
+        still count, as in ``get_tokens_metrics_async``.
+        
+        Args:
+            addresses: Token addresses to fetch metrics for
+            
+        Returns:
+            Dictionary mapping token address to its metrics, in request order.
+            Tokens without pairs are left out.
+        """
+        metrics = {}
+        for chunk in self._chunk_addresses(addresses):
+            try:
+                response = self._make_request(
+                    method='GET',
+                    url=f"{self.endpoint}/tokens/{','.join(chunk)}"
+                )
+            except Exception as e:
+                logger.warning(f"Skipping {len(chunk)} tokens after failed batch request: {str(e)}")
+                continue
+            metrics.update(self._split_token_metrics(chunk, response))
+            
+        return metrics
+        
+    async def get_tokens_metrics_async(self, addresses: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch metrics for many tokens with concurrent batch requests.
+        
+        Chunks run concurrently, at most ``max_concurrency`` at a time, while
+        the rate limiter spaces out the actual requests. A chunk that keeps
+        failing is logged and skipped so the other chunks still count.
+        
+        Args:
+            addresses: Token addresses to fetch metrics for
+            
+        Returns:
+            Dictionary mapping token address to its metrics, in request order.
+            Tokens without pairs are left out.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def fetch(chunk: List[str]) -> Dict[str, Dict[str, Any]]:
+            async with semaphore:
+                try:
+                    response = await self._make_request_async(
+                        method='GET',
+                        url=f"{self.endpoint}/tokens/{','.join(chunk)}"
+                    )
+                except Exception as e:
+                    logger.warning(f"Skipping {len(chunk)} tokens after failed batch request: {str(e)}")
+                    return {}
+                return self._split_token_metrics(chunk, response)
+                
+        metrics = {}
+        for chunk_metrics in await asyncio.gather(*(fetch(chunk) for chunk in self._chunk_addresses(addresses))):
+            metrics.update(chunk_metrics)
+            
+        return metrics
+        
+    def _parse_token_metrics(self, token_address: str, response: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Aggregate the pairs of a token response into token metrics.
+        
+        Args:
+            token_address: The address of the token the pairs belong to
+            response: DexScreener tokens response
+            
+        Returns:
+            Token metrics dictionary
+            
+        Raises:
+            ValueError: If token is not found
+        """
         if not response.get('pairs'):
             raise ValueError(f"No pairs found for token {token_address}")
             
@@ -102,8 +243,14 @@ class DexScreenerClient(BaseClient):
         # Calculate average price change
         avg_price_change = sum(price_changes) / len(price_changes) if price_changes else 0
         
+        # Symbol and name of the token on whichever side of the pair it is
+        first_pair = response['pairs'][0]
+        side = 'quoteToken' if str(first_pair.get('quoteToken', {}).get('address', '')).lower() == token_address.lower() else 'baseToken'
+        
         metrics = {
             'address': token_address,
+            'symbol': first_pair.get(side, {}).get('symbol'),
+            'name': first_pair.get(side, {}).get('name'),
             'volume_24h': total_volume,
             'liquidity_usd': total_liquidity,
             'price_change_pct': avg_price_change,
@@ -126,8 +273,6 @@ class DexScreenerClient(BaseClient):
         Returns:
             List of trading pair dictionaries
         """
-        self._rate_limit()
-        
         response = self._make_request(
             method='GET',
             url=f"{self.endpoint}/pairs/trending",
@@ -88,7 +88,10 @@ class ForumClient(BaseClient):
                     'confidence': float(call.get('confidence', 0.5)),
                     'targets': call.get('targets', []),
                     'stop_loss': call.get('stop_loss'),
-                    'take_profit': call.get('take_profit')
+                    'take_profit': call.get('take_profit'),
+                    'token': call.get('token'),
+                    'action': call.get('action') or self.parse_trading_action(call['content'])['action'],
+                    'entry_price': float(call['entry_price']) if call.get('entry_price') is not None else None
                 }
                 calls.append(processed_call)
                 
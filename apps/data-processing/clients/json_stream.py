@@ -0,0 +1,188 @@
+import json
+import re
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+# Only these bytes change the parser state; everything else is copied as is
+_STRUCTURAL = re.compile(rb'["\\{}\[\]:]')
+
+class JSONArrayStream:
+    """
+    Incremental parser for the array under a top-level key of a JSON object.
+    
+    Bytes are pushed in as they arrive and every completed array item is
+    decoded on its own, so memory stays bounded by the largest single item
+    rather than by the whole payload. Items must be JSON objects or arrays,
+    which is what the pool listings return. Top-level numbers, booleans and
+    nulls seen before the end of the array are kept in ``fields``.
+    """
+    
+    def __init__(self, key: str = 'data', success_key: Optional[str] = None):
+        """
+        Initialize the parser.
+        
+        Args:
+            key: Top-level key holding the array to stream
+            success_key: Top-level flag the payload reports failure with by
+                setting it to false, e.g. 'success'
+        """
+        self.key = key.encode('utf-8')
+        self.success_key = success_key
+        self.fields: Dict[str, Any] = {}
+        self.value_buffer = None
+        self.depth = 0
+        self.in_string = False
+        self.escape_next = False
+        self.string_buffer = bytearray()
+        self.last_string = b''
+        self.pending_key = None
+        self.array_depth = None
+        self.done = False
+        self.item_buffer = bytearray()
+        self.item_start = None
+    
+    def feed(self, chunk: bytes) -> List[Any]:
+        """
+        Push the next chunk of the payload.
+        
+        Args:
+            chunk: Next bytes of the response body
+        
+        Returns:
+            Items completed by this chunk, decoded
+            
+        Raises:
+            ValueError: If the payload reports failure through ``success_key``
+                or a top-level value is not valid JSON
+        """
+        items = []
+        if self.done or not chunk:
+            return items
+        
+        position = 0
+        if self.escape_next:
+            # First byte of this chunk is escaped by a trailing backslash
+            self.escape_next = False
+            if self.in_string and self.depth == 1:
+                self.string_buffer += chunk[:1]
+            position = 1
+        
+        string_start = position if self.in_string else None
+        value_start = position if self.value_buffer is not None else None
+        if self.item_start is not None:
+            self.item_start = 0
+        
+        for match in _STRUCTURAL.finditer(chunk, position):
+            index = match.start()
+            char = chunk[index:index + 1]
+            
+            if self.in_string:
+                if index < position:
+                    continue
+                if char == b'\\':
+                    if index + 1 >= len(chunk):
+                        self.escape_next = True
+                    position = index + 2
+                elif char == b'"':
+                    self.in_string = False
+                    if self.depth == 1:
+                        self.string_buffer += chunk[string_start:index]
+                        self.last_string = bytes(self.string_buffer)
+                        self.string_buffer.clear()
+                continue
+            
+            # Any structure after a top-level scalar ends it
+            if self.value_buffer is not None:
+                self._end_value(chunk[value_start:index])
+                
+            if char == b'"':
+                self.in_string = True
+                string_start = index + 1
+            elif char == b':':
+                if self.depth == 1:
+                    self.pending_key = self.last_string
+                    self.value_buffer = bytearray()
+                    value_start = index + 1
+            elif char in (b'{', b'['):
+                self.depth += 1
+                if self.array_depth is None:
+                    if char == b'[' and self.depth == 2 and self.pending_key == self.key:
+                        self.array_depth = self.depth
+                elif self.depth == self.array_depth + 1 and self.item_start is None:
+                    self.item_start = index
+            elif char in (b'}', b']'):
+                self.depth -= 1
+                if self.depth == 1:
+                    self.pending_key = None
+                if self.array_depth is not None:
+                    if self.depth == self.array_depth and self.item_start is not None:
+                        self.item_buffer += chunk[self.item_start:index + 1]
+                        items.append(json.loads(bytes(self.item_buffer)))
+                        self.item_buffer.clear()
+                        self.item_start = None
+                    elif self.depth < self.array_depth:
+                        self.done = True
+                        break
+        
+        if self.in_string and self.depth == 1 and string_start is not None:
+            self.string_buffer += chunk[string_start:len(chunk) - (1 if self.escape_next else 0)]
+            if self.escape_next:
+                self.string_buffer += chunk[-1:]
+        if self.item_start is not None:
+            self.item_buffer += chunk[self.item_start:]
+        if self.value_buffer is not None:
+            self.value_buffer += chunk[value_start:]
+        
+        return items
+    
+    def _end_value(self, tail: bytes):
+        """
+        Decode the top-level value read since the last colon, if it is a scalar.
+        
+        Args:
+            tail: Bytes of the value in the current chunk
+        """
+        text = bytes(self.value_buffer + tail).strip().rstrip(b',').strip()
+        self.value_buffer = None
+        if not text:
+            return
+        field = self.pending_key.decode('utf-8', 'replace')
+        self.fields[field] = json.loads(text)
+        if field == self.success_key and self.fields[field] is False:
+            raise ValueError(f"Payload reports failure: {field} is false")
+    
+    def close(self):
+        """
+        Check that the payload did not end before the array was complete.
+        
+        Raises:
+            ValueError: If the array was missing or cut off
+        """
+        if not self.done:
+            raise ValueError(f"Payload ended before the end of the '{self.key.decode('utf-8')}' array")
+
+
+def iter_json_array(chunks: Iterable[bytes],
+                    key: str = 'data',
+                    success_key: Optional[str] = None) -> Iterator[Any]:
+    """
+    Yield the items of a top-level JSON array from a stream of byte chunks.
+    
+    Args:
+        chunks: Response body chunks, e.g. ``response.iter_content()``
+        key: Top-level key holding the array
+        success_key: Top-level flag the payload reports failure with by
+            setting it to false, e.g. 'success'
+    
+    Returns:
+        Iterator over the decoded array items
+    
+    Raises:
+        ValueError: If the payload reports failure, or the stream ends before
+            the array is complete
+    """
+    parser = JSONArrayStream(key, success_key)
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+        if parser.done:
+            break
+    parser.close()
@@ -0,0 +1,216 @@
+from abc import ABC, abstractmethod
+import asyncio
+import logging
+import threading
+import time
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Atomically refills the bucket from the Redis server clock and reserves the
+# requested tokens. The balance may go negative; the caller then waits until
+# its reservation is covered. In penalty mode the balance is pushed below zero
+# so every worker backs off (e.g. after a 429 with Retry-After).
+_RESERVE_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local requested = tonumber(ARGV[3])
+local penalty = ARGV[4] == '1'
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+if penalty then
+    tokens = math.min(tokens, 0) - requested
+else
+    tokens = tokens - requested
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('EXPIRE', KEYS[1], math.ceil((capacity - tokens) / rate) + 60)
+if tokens < 0 then
+    return tostring(-tokens / rate)
+end
+return '0'
+"""
+
+
+class RateLimiter(ABC):
+    """Token bucket rate limiter usable from threads and coroutines."""
+    
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        """
+        Initialize the rate limiter.
+        
+        Args:
+            rate: Sustained rate in requests per second
+            burst: Bucket capacity, i.e. how many requests may be sent at once
+                after an idle period (defaults to one second worth of requests)
+        """
+        if rate <= 0:
+            raise ValueError("Rate limit must be positive")
+        self.rate = float(rate)
+        self.capacity = float(burst if burst is not None else max(rate, 1))
+    
+    @abstractmethod
+    def _reserve(self, tokens: float) -> float:
+        """
+        Take tokens from the bucket.
+        
+        Args:
+            tokens: Number of tokens to take
+        
+        Returns:
+            Seconds to wait until the reservation is covered
+        """
+        pass
+    
+    @abstractmethod
+    def penalize(self, seconds: float):
+        """
+        Stop handing out tokens for the given number of seconds.
+        
+        Args:
+            seconds: Back-off period, e.g. a provider's Retry-After value
+        """
+        pass
+    
+    def acquire(self, tokens: float = 1):
+        """
+        Block the calling thread until the tokens are available.
+        
+        Args:
+            tokens: Number of tokens to take
+        """
+        delay = self._reserve(tokens)
+        if delay > 0:
+            time.sleep(delay)
+    
+    async def acquire_async(self, tokens: float = 1):
+        """
+        Wait without blocking the event loop until the tokens are available.
+        
+        Args:
+            tokens: Number of tokens to take
+        """
+        delay = self._reserve(tokens)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class TokenBucket(RateLimiter):
+    """In-process token bucket shared by all threads and coroutines of a client."""
+    
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        """
+        Initialize the token bucket.
+        
+        Args:
+            rate: Sustained rate in requests per second
+            burst: Bucket capacity
+        """
+        super().__init__(rate, burst)
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _refill(self, now: float):
+        """Add the tokens accumulated since the last update."""
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+    
+    def _reserve(self, tokens: float) -> float:
+        with self._lock:
+            self._refill(time.monotonic())
+            self.tokens -= tokens
+            return -self.tokens / self.rate if self.tokens < 0 else 0.0
+    
+    def penalize(self, seconds: float):
+        with self._lock:
+            self._refill(time.monotonic())
+            self.tokens = min(self.tokens, 0.0) - seconds * self.rate
+
+
+class RedisTokenBucket(RateLimiter):
+    """
+    Token bucket stored in Redis so several pipeline workers share one quota.
+    
+    Falls back to an in-process bucket while Redis is unreachable.
+    """
+    
+    def __init__(self, redis_client: Any, key: str, rate: float, burst: Optional[float] = None):
+        """
+        Initialize the Redis token bucket.
+        
+        Args:
+            redis_client: Connected Redis client
+            key: Redis key holding the bucket state
+            rate: Sustained rate in requests per second
+            burst: Bucket capacity
+        """
+        super().__init__(rate, burst)
+        self.redis_client = redis_client
+        self.key = key
+        self.fallback = TokenBucket(rate, burst)
+        self._script = redis_client.register_script(_RESERVE_SCRIPT)
+    
+    def _call(self, tokens: float, penalty: bool) -> float:
+        result = self._script(
+            keys=[self.key],
+            args=[self.rate, self.capacity, tokens, '1' if penalty else '0']
+        )
+        return float(result)
+    
+    def _reserve(self, tokens: float) -> float:
+        try:
+            return self._call(tokens, penalty=False)
+        except Exception as e:
+            logger.warning(f"Shared rate limiter {self.key} unavailable, using local bucket: {str(e)}")
+            return self.fallback._reserve(tokens)
+    
+    def penalize(self, seconds: float):
+        try:
+            self._call(seconds * self.rate, penalty=True)
+        except Exception as e:
+            logger.warning(f"Shared rate limiter {self.key} unavailable, using local bucket: {str(e)}")
+            self.fallback.penalize(seconds)
+    
+    async def acquire_async(self, tokens: float = 1):
+        # The script round-trip is a blocking Redis call, keep it off the loop
+        delay = await asyncio.to_thread(self._reserve, tokens)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+def create_rate_limiter(name: str,
+                        config: Dict[str, Any],
+                        settings: Optional[Dict[str, Any]] = None,
+                        redis_client: Any = None) -> Optional[RateLimiter]:
+    """
+    Create the rate limiter for an API client.
+    
+    Args:
+        name: Provider name, used for the shared Redis key
+        config: Client configuration containing ``rate_limit`` and optional ``burst``
+        settings: Limiter settings (backend: local or redis, key_prefix)
+        redis_client: Connected Redis client, required for the redis backend
+    
+    Returns:
+        Rate limiter, or None if the client has no rate limit configured
+    """
+    if not config.get('rate_limit'):
+        return None
+    
+    settings = settings or {}
+    rate = config['rate_limit']
+    burst = config.get('burst')
+    
+    if settings.get('backend', 'local') == 'redis':
+        if redis_client is None:
+            logger.warning(f"No Redis connection for shared rate limiter {name}, using local bucket")
+        else:
+            key = f"{settings.get('key_prefix', 'ratelimit')}:{name}"
+            return RedisTokenBucket(redis_client, key, rate, burst)
+    
+    return TokenBucket(rate, burst)
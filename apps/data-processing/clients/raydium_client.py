@@ -1,25 +1,26 @@
 import logging
-from typing import Any, Dict, List
-import time
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
 
 from .base import BaseClient
+from .json_stream import JSONArrayStream
+from .rate_limiter import RateLimiter
 
 logger = logging.getLogger(__name__)
 
 class RaydiumClient(BaseClient):
     """Client for fetching Raydium liquidity pool data."""
     
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self, config: Dict[str, Any], rate_limiter: Optional[RateLimiter] = None):
         """
         Initialize the Raydium client.
         
         Args:
             config: Configuration dictionary containing Raydium API settings
+            rate_limiter: Optional rate limiter shared with other workers
         """
-        super().__init__(config)
+        super().__init__(config, rate_limiter)
         self.endpoint = config['endpoint']
-        self.rate_limit = config['rate_limit']
-        self.last_request_time = 0
+        self.stream_chunk_size = config.get('stream_chunk_size', 65536)
         
     def validate_response(self, response: Dict[str, Any]) -> bool:
         """
@@ -44,20 +45,41 @@ class RaydiumClient(BaseClient):
         if not isinstance(response['data'], list):
             return False
             
-        for pool in response['data']:
-            required_pool_fields = ['id', 'mintA', 'mintB', 'tvl', 'price']
-            if not all(field in pool for field in required_pool_fields):
-                return False
-                
-        return True
-        
-    def _rate_limit(self):
-        """Implement rate limiting."""
-        current_time = time.time()
-        elapsed = current_time - self.last_request_time
-        if elapsed < 1.0 / self.rate_limit:
-            time.sleep(1.0 / self.rate_limit - elapsed)
-        self.last_request_time = time.time()
+        return all(self.validate_pool(pool) for pool in response['data'])
+        
+    def validate_pool(self, pool: Any) -> bool:
+        """
+        Validate a single pool entry of the pools listing.
+        
+        Args:
+            pool: Raw pool data to validate
+            
+        Returns:
+            bool: True if valid, False otherwise
+        """
+        required_pool_fields = ['id', 'mintA', 'mintB', 'tvl', 'price']
+        return isinstance(pool, dict) and all(field in pool for field in required_pool_fields)
+        
+    def _parse_pool(self, pool: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Convert a raw Raydium pool into the normalized pool format.
+        
+        Args:
+            pool: Raw pool data from the API
+            
+        Returns:
+            Pool data dictionary
+        """
+        return {
+            'id': pool['id'],
+            'mintA': pool['mintA'],
+            'mintB': pool['mintB'],
+            'tvl': float(pool['tvl']),
+            'price': float(pool['price']),
+            'volume_24h': float(pool.get('volume24h', 0)),
+            'fee_24h': float(pool.get('fee24h', 0)),
+            'apy': float(pool.get('apy', 0))
+        }
         
     def get_pools(self) -> List[Dict[str, Any]]:
         """
@@ -66,30 +88,100 @@ class RaydiumClient(BaseClient):
         Returns:
             List of liquidity pools with their metadata
         """
-        self._rate_limit()
-        
         response = self._make_request(
             method='GET',
             url=f"{self.endpoint}/pools"
         )
         
-        pools = []
-        for pool in response['data']:
-            processed_pool = {
-                'id': pool['id'],
-                'mintA': pool['mintA'],
-                'mintB': pool['mintB'],
-                'tvl': float(pool['tvl']),
-                'price': float(pool['price']),
-                'volume_24h': float(pool.get('volume24h', 0)),
-                'fee_24h': float(pool.get('fee24h', 0)),
-                'apy': float(pool.get('apy', 0))
-            }
-            pools.append(processed_pool)
+        pools = [self._parse_pool(pool) for pool in response['data']]
+            
+        logger.info(f"Fetched {len(pools)} liquidity pools")
+        return pools
+        
+    async def get_pools_async(self) -> List[Dict[str, Any]]:
+        """
+        Fetch all liquidity pools on the shared async session.
+        
+        Returns:
+            List of liquidity pools with their metadata
+        """
+        response = await self._make_request_async(
+            method='GET',
+            url=f"{self.endpoint}/pools"
+        )
+        
+        pools = [self._parse_pool(pool) for pool in response['data']]
             
         logger.info(f"Fetched {len(pools)} liquidity pools")
         return pools
         
+    def iter_pools(self) -> Iterator[Dict[str, Any]]:
+        """
+        Stream all liquidity pools, yielding each one as soon as it is received.
+        
+        The pools listing is parsed incrementally, so memory stays flat however
+        many pools Raydium returns. Streaming bypasses the response cache and is
+        not retried once pools have been yielded; invalid entries are skipped.
+        
+        Returns:
+            Iterator over normalized pools
+            
+        Raises:
+            ValueError: If Raydium reports failure or the listing is cut off
+        """
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+            
+        parser = JSONArrayStream('data', success_key='success')
+        count = 0
+        with self.session.get(f"{self.endpoint}/pools", stream=True, timeout=30) as response:
+            response.raise_for_status()
+            for chunk in response.iter_content(chunk_size=self.stream_chunk_size):
+                for pool in parser.feed(chunk):
+                    if not self.validate_pool(pool):
+                        logger.warning(f"Skipping invalid pool entry: {str(pool)[:200]}")
+                        continue
+                    count += 1
+                    yield self._parse_pool(pool)
+                if parser.done:
+                    break
+                    
+        # A cut-off body would otherwise look like a shorter listing
+        parser.close()
+        logger.info(f"Streamed {count} liquidity pools")
+        
+    async def iter_pools_async(self) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream all liquidity pools on the shared async session.
+        
+        Returns:
+            Async iterator over normalized pools
+            
+        Raises:
+            ValueError: If Raydium reports failure or the listing is cut off
+        """
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire_async()
+            
+        parser = JSONArrayStream('data', success_key='success')
+        count = 0
+        session = self.get_async_session()
+        async with session.get(f"{self.endpoint}/pools") as response:
+            response.raise_for_status()
+            async for chunk in response.content.iter_chunked(self.stream_chunk_size):
+                for pool in parser.feed(chunk):
+                    if not self.validate_pool(pool):
+                        logger.warning(f"Skipping invalid pool entry: {str(pool)[:200]}")
+                        continue
+                    count += 1
+                    yield self._parse_pool(pool)
+                if parser.done:
+                    break
+                    
+        # A cut-off body would otherwise look like a shorter listing
+        parser.close()
+        logger.info(f"Streamed {count} liquidity pools")
+        
     def get_pool_by_id(self, pool_id: str) -> Dict[str, Any]:
         """
         Fetch a specific liquidity pool by ID.
@@ -103,8 +195,6 @@ class RaydiumClient(BaseClient):
         Raises:
             ValueError: If pool is not found
         """
-        self._rate_limit()
-        
         response = self._make_request(
             method='GET',
             url=f"{self.endpoint}/pools/{pool_id}"
@@ -113,14 +203,4 @@ class RaydiumClient(BaseClient):
         if not response['success'] or not response['data']:
             raise ValueError(f"Pool {pool_id} not found")
             
-        pool = response['data']
-        return {
-            'id': pool['id'],
-            'mintA': pool['mintA'],
-            'mintB': pool['mintB'],
-            'tvl': float(pool['tvl']),
-            'price': float(pool['price']),
-            'volume_24h': float(pool.get('volume24h', 0)),
-            'fee_24h': float(pool.get('fee24h', 0)),
-            'apy': float(pool.get('apy', 0))
-        } 
\ No newline at end of file
+        return self._parse_pool(response['data'])
\ No newline at end of file
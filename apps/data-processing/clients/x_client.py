@@ -1,27 +1,45 @@
+import asyncio
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 import json
 
 from .base import BaseClient
+from .rate_limiter import RateLimiter
 
 logger = logging.getLogger(__name__)
 
 class XClient(BaseClient):
     """Client for fetching tweets using Nitter."""
     
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self,
+                 config: Dict[str, Any],
+                 rate_limiter: Optional[RateLimiter] = None,
+                 state_store: Any = None):
         """
         Initialize the X client.
         
         Args:
             config: Configuration dictionary containing X API settings
+            rate_limiter: Optional rate limiter shared with other workers
+            state_store: Optional Redis client persisting the ``since_id``
+                high-water mark and unfinished pagination between runs
         """
-        super().__init__(config)
+        super().__init__(config, rate_limiter)
         self.bearer_token = config['bearer_token']
         self.endpoint = config['endpoint']
         self.query = config['query']
         self.max_results = config['max_results']
+        self.max_pages = config.get('max_pages', 10)
+        self.state_key = config.get('state_key', 'x:since_id')
+        self.state_store = state_store
+        self._since_id: Optional[str] = None
+        self._backlog: Optional[Dict[str, str]] = None
+        
+        # Pagination token left when the last fetch stopped at max_pages, and
+        # what the last poll leaves to commit
+        self.next_token: Optional[str] = None
+        self._pending: Optional[Dict[str, Optional[str]]] = None
         
     def validate_response(self, response: Dict[str, Any]) -> bool:
         """
@@ -33,6 +51,10 @@ class XClient(BaseClient):
         Returns:
             bool: True if valid, False otherwise
         """
+        # A search without matches has no data or includes at all
+        if response.get('meta', {}).get('result_count') == 0:
+            return True
+            
         required_fields = ['data', 'includes']
         if not all(field in response for field in required_fields):
             return False
@@ -46,18 +68,105 @@ class XClient(BaseClient):
                 
         return True
         
-    def get_tweets(self, 
-                  start_time: Optional[datetime] = None, 
-                  end_time: Optional[datetime] = None) -> List[Dict[str, Any]]:
+    def get_since_id(self) -> Optional[str]:
+        """
+        Get the id of the newest tweet already ingested.
+        
+        Returns:
+            The high-water mark, or None before the first run
+        """
+        if self.state_store is not None:
+            try:
+                since_id = self.state_store.get(self.state_key)
+                if since_id:
+                    return since_id.decode() if isinstance(since_id, bytes) else since_id
+            except Exception as e:
+                logger.error(f"Error reading tweet high-water mark: {str(e)}")
+        return self._since_id
+        
+    def get_backlog(self) -> Optional[Dict[str, str]]:
+        """
+        Get the tweets a truncated poll left to fetch.
+        
+        Returns:
+            The 'until_id' of the oldest tweet fetched so far and the
+            'newest_id' fetched since the high-water mark, or None
         """
-        Fetch tweets matching the configured query.
+        if self.state_store is not None:
+            try:
+                backlog = self.state_store.get(f"{self.state_key}:backlog")
+                if backlog:
+                    return json.loads(backlog)
+            except Exception as e:
+                logger.error(f"Error reading tweet backlog: {str(e)}")
+        return self._backlog
+        
+    def _save_backlog(self, backlog: Optional[Dict[str, str]]):
+        """Persist the tweets left to fetch, or clear them once fetched."""
+        self._backlog = backlog
+        if self.state_store is not None:
+            try:
+                if backlog is None:
+                    self.state_store.delete(f"{self.state_key}:backlog")
+                else:
+                    self.state_store.set(f"{self.state_key}:backlog", json.dumps(backlog))
+            except Exception as e:
+                logger.error(f"Error saving tweet backlog: {str(e)}")
+                
+    def commit_since_id(self, tweets: List[Dict[str, Any]]):
+        """
+        Advance the high-water mark past the given tweets.
+        
+        Call this once the tweets are stored, so a failed run is fetched again.
+        When the poll stopped paginating at ``max_pages``, the high-water mark
+        stays where it is and the older tweets still to fetch are recorded
+        instead, so the next polls fetch them before moving on.
         
         Args:
-            start_time: Optional start time for tweet search
+            tweets: Tweets returned by the last poll
+        """
+        pending, self._pending = self._pending, None
+        if pending is not None and pending['until_id']:
+            self._save_backlog({'until_id': pending['until_id'], 'newest_id': pending['newest_id']})
+            return
+        if pending is not None:
+            self._save_backlog(None)
+            newest_id = pending['newest_id']
+        else:
+            newest_id = max((tweet['id'] for tweet in tweets), key=int, default=None)
+        if newest_id is None:
+            return
+            
+        current = self.get_since_id()
+        if current is not None and int(current) >= int(newest_id):
+            return
+            
+        self._since_id = newest_id
+        if self.state_store is not None:
+            try:
+                self.state_store.set(self.state_key, newest_id)
+            except Exception as e:
+                logger.error(f"Error saving tweet high-water mark: {str(e)}")
+                
+    def _build_request(self,
+                       start_time: Optional[datetime] = None,
+                       end_time: Optional[datetime] = None,
+                       since_id: Optional[str] = None,
+                       next_token: Optional[str] = None,
+                       until_id: Optional[str] = None) -> Tuple[Dict[str, str], Dict[str, Any]]:
+        """
+        Build headers and query parameters for a recent search request.
+        
+        Args:
+            start_time: Optional start time for tweet search, ignored when
+                ``since_id`` is given
             end_time: Optional end time for tweet search
+            since_id: Optional id of the newest tweet already ingested
+            next_token: Optional pagination token of the next result page
+            until_id: Optional id of a tweet, only older tweets are returned
             
         Returns:
-            List of tweets with their metadata
+            Tuple of request headers and query parameters
         """
         params = {
             'query': self.query,
@@ -67,27 +176,36 @@ class XClient(BaseClient):
             'expansions': 'author_id'
         }
         
-        if start_time:
+        if since_id:
+            params['since_id'] = since_id
+        elif start_time:
             params['start_time'] = start_time.isoformat() + 'Z'
         if end_time:
             params['end_time'] = end_time.isoformat() + 'Z'
+        if until_id:
+            params['until_id'] = until_id
+        if next_token:
+            params['next_token'] = next_token
             
         headers = {
             'Authorization': f'Bearer {self.bearer_token}'
         }
+        return headers, params
         
-        response = self._make_request(
-            method='GET',
-            url=self.endpoint,
-            headers=headers,
-            params=params
-        )
+    def _parse_tweets(self, response: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Enrich the tweets of a search response with their author data.
         
-        # Process and enrich tweet data
+        Args:
+            response: X API search response
+            
+        Returns:
+            List of tweets with their metadata
+        """
         tweets = []
-        users = {user['id']: user for user in response['includes']['users']}
+        users = {user['id']: user for user in response.get('includes', {}).get('users', [])}
         
-        for tweet in response['data']:
+        for tweet in response.get('data', []):
             user = users.get(tweet['author_id'], {})
             enriched_tweet = {
                 'id': tweet['id'],
@@ -103,5 +221,173 @@ class XClient(BaseClient):
             }
             tweets.append(enriched_tweet)
             
-        logger.info(f"Fetched {len(tweets)} tweets")
-        return tweets 
\ No newline at end of file
+        return tweets
+        
+    def _collect_page(self,
+                      tweets: Dict[str, Dict[str, Any]],
+                      response: Dict[str, Any],
+                      page: int) -> Optional[str]:
+        """
+        Add the tweets of a result page and find the next page to fetch.
+        
+        Sets ``next_token`` to the page left unfetched when stopping at
+        ``max_pages``, and to None otherwise.
+        
+        Args:
+            tweets: Tweets collected so far, keyed by id
+            response: X API search response
+            page: Number of pages fetched so far
+            
+        Returns:
+            Pagination token of the next page, or None when done
+        """
+        for tweet in self._parse_tweets(response):
+            tweets.setdefault(tweet['id'], tweet)
+            
+        next_token = response.get('meta', {}).get('next_token')
+        self.next_token = None
+        if next_token and page >= self.max_pages:
+            logger.warning(f"Stopped paginating after {page} pages, older tweets are left for the next poll")
+            self.next_token = next_token
+            return None
+        return next_token
+        
+    def _poll_request(self, lookback: timedelta) -> Dict[str, Any]:
+        """
+        Search bounds of the next poll.
+        
+        Args:
+            lookback: Search window used while there is no high-water mark yet
+            
+        Returns:
+            Keyword arguments of ``get_tweets``
+        """
+        since_id = self.get_since_id()
+        request: Dict[str, Any] = {'since_id': since_id} if since_id else {'start_time': datetime.utcnow() - lookback}
+        
+        # Finish the tweets a truncated poll left behind before newer ones
+        backlog = self.get_backlog()
+        if backlog:
+            request['until_id'] = backlog['until_id']
+        return request
+        
+    def _finish_poll(self, request: Dict[str, Any], tweets: List[Dict[str, Any]]):
+        """
+        Record what committing the tweets of a poll should save.
+        
+        Args:
+            request: Search bounds of the poll
+            tweets: Tweets fetched by the poll
+        """
+        ids = [tweet['id'] for tweet in tweets]
+        backlog = self.get_backlog() if 'until_id' in request else None
+        if backlog:
+            ids.append(backlog['newest_id'])
+        self._pending = {
+            'newest_id': max(ids, key=int, default=None),
+            'until_id': min((tweet['id'] for tweet in tweets), key=int) if self.next_token and tweets else None
+        }
+        
+    def get_tweets(self, 
+                  start_time: Optional[datetime] = None, 
+                  end_time: Optional[datetime] = None,
+                  since_id: Optional[str] = None,
+                  until_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Fetch tweets matching the configured query, following result pages.
+        
+        Args:
+            start_time: Optional start time for tweet search
+            end_time: Optional end time for tweet search
+            since_id: Optional id of the newest tweet already ingested
+            until_id: Optional id of a tweet, only older tweets are fetched
+            
+        Returns:
+            List of tweets with their metadata, newest first
+        """
+        tweets: Dict[str, Dict[str, Any]] = {}
+        next_token = None
+        page = 0
+        
+        while True:
+            headers, params = self._build_request(start_time, end_time, since_id, next_token, until_id)
+            response = self._make_request(
+                method='GET',
+                url=self.endpoint,
+                headers=headers,
+                params=params
+            )
+            page += 1
+            next_token = self._collect_page(tweets, response, page)
+            if not next_token:
+                break
+                
+        logger.info(f"Fetched {len(tweets)} tweets in {page} pages")
+        return list(tweets.values())
+        
+    async def get_tweets_async(self,
+                               start_time: Optional[datetime] = None,
+                               end_time: Optional[datetime] = None,
+                               since_id: Optional[str] = None,
+                               until_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Fetch tweets matching the configured query on the shared async session.
+        
+        Args:
+            start_time: Optional start time for tweet search
+            end_time: Optional end time for tweet search
+            since_id: Optional id of the newest tweet already ingested
+            until_id: Optional id of a tweet, only older tweets are fetched
+            
+        Returns:
+            List of tweets with their metadata, newest first
+        """
+        tweets: Dict[str, Dict[str, Any]] = {}
+        next_token = None
+        page = 0
+        
+        while True:
+            headers, params = self._build_request(start_time, end_time, since_id, next_token, until_id)
+            response = await self._make_request_async(
+                method='GET',
+                url=self.endpoint,
+                headers=headers,
+                params=params
+            )
+            page += 1
+            next_token = self._collect_page(tweets, response, page)
+            if not next_token:
+                break
+                
+        logger.info(f"Fetched {len(tweets)} tweets in {page} pages")
+        return list(tweets.values())
+        
+    def poll_tweets(self, lookback: timedelta = timedelta(hours=24)) -> List[Dict[str, Any]]:
+        """
+        Fetch only the tweets posted since the last committed poll.
+        
+        Args:
+            lookback: Search window used while there is no high-water mark yet
+            
+        Returns:
+            List of new tweets with their metadata
+        """
+        request = self._poll_request(lookback)
+        tweets = self.get_tweets(**request)
+        self._finish_poll(request, tweets)
+        return tweets
+        
+    async def poll_tweets_async(self, lookback: timedelta = timedelta(hours=24)) -> List[Dict[str, Any]]:
+        """
+        Fetch only the tweets posted since the last committed poll, asynchronously.
+        
+        Args:
+            lookback: Search window used while there is no high-water mark yet
+            
+        Returns:
+            List of new tweets with their metadata
+        """
+        request = await asyncio.to_thread(self._poll_request, lookback)
+        tweets = await self.get_tweets_async(**request)
+        await asyncio.to_thread(self._finish_poll, request, tweets)
+        return tweets
\ No newline at end of file
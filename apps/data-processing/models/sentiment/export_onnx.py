@@ -0,0 +1,120 @@
+"""Export the DistilBERT sentiment model to int8 ONNX and check its parity
+
+Run from apps/data-processing:
+
+    python -m models.sentiment.export_onnx --output models/sentiment/onnx/distilbert-sst2-int8
+    python -m models.sentiment.export_onnx --check-only --output models/sentiment/onnx/distilbert-sst2-int8
+
+The parity check scores data/sentiment_dataset.csv with the exported model
+and compares it with the labels and scores recorded from the current
+TensorFlow/transformers backend.
+"""
+
+import argparse
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+MODEL_NAME = "distilbert-base-uncased-finetuned-sst-2-english"
+DATASET_PATH = "data/sentiment_dataset.csv"
+
+
+def export_model(model_name, output_dir, opset=14):
+    '''Export the model to ONNX, returns the path of the fp32 graph'''
+    import torch
+    from transformers import AutoModelForSequenceClassification, AutoTokenizer
+
+    os.makedirs(output_dir, exist_ok=True)
+    tokenizer = AutoTokenizer.from_pretrained(model_name)
+    model = AutoModelForSequenceClassification.from_pretrained(model_name)
+    model.eval()
+
+    sample = tokenizer(["export sample"], return_tensors="pt")
+    fp32_path = os.path.join(output_dir, "model.onnx")
+    with torch.no_grad():
+        torch.onnx.export(
+            model,
+            (sample["input_ids"], sample["attention_mask"]),
+            fp32_path,
+            input_names=["input_ids", "attention_mask"],
+            output_names=["logits"],
+            dynamic_axes={
+                "input_ids": {0: "batch", 1: "sequence"},
+                "attention_mask": {0: "batch", 1: "sequence"},
+                "logits": {0: "batch"}
+            },
+            opset_version=opset
+        )
+
+    # Tokenizer files and config.json (id2label) are loaded by the backend
+    tokenizer.save_pretrained(output_dir)
+    model.config.save_pretrained(output_dir)
+    return fp32_path
+
+
+def quantize_model(fp32_path, output_dir):
+    '''Apply int8 dynamic quantization to the weights, returns the quantized path'''
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    int8_path = os.path.join(output_dir, "model.int8.onnx")
+    quantize_dynamic(fp32_path, int8_path, weight_type=QuantType.QInt8)
+    return int8_path
+
+
+def check_parity(model_dir, dataset_path=DATASET_PATH, batch_size=32, max_length=128):
+    '''Compare the exported model with the reference backend on the dataset'''
+    from processors.sentiment_onnx import OnnxSentimentAnalyzer
+
+    dataset = pd.read_csv(dataset_path).dropna(subset=["text"])
+    analyzer = OnnxSentimentAnalyzer(model_dir, batch_size=batch_size, max_length=max_length)
+    batch = analyzer.analyze_batch(dataset["text"])
+
+    # Reference probability of the positive class, as the backends report it
+    reference_labels = dataset["sentiment_label"].str.lower().to_numpy()
+    reference_scores = np.where(
+        reference_labels == "negative",
+        1 - dataset["sentiment_score"].to_numpy(),
+        dataset["sentiment_score"].to_numpy()
+    )
+
+    report = {
+        "texts": len(dataset),
+        "label_agreement": float(np.mean(batch.labels == reference_labels)),
+        "mean_abs_score_diff": float(np.mean(np.abs(batch.scores - reference_scores))),
+        "max_abs_score_diff": float(np.max(np.abs(batch.scores - reference_scores)))
+    }
+    if "binary_label" in dataset:
+        predicted = (batch.scores > 0.5).astype(int)
+        report["accuracy"] = float(np.mean(predicted == dataset["binary_label"].to_numpy()))
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model", default=MODEL_NAME, help="Pre-trained model to export")
+    parser.add_argument("--output", default="models/sentiment/onnx/distilbert-sst2-int8", help="Artifact directory")
+    parser.add_argument("--dataset", default=DATASET_PATH, help="Dataset for the parity check")
+    parser.add_argument("--check-only", action="store_true", help="Skip the export, only check parity")
+    parser.add_argument("--min-agreement", type=float, default=0.98, help="Minimum label agreement")
+    args = parser.parse_args()
+
+    if not args.check_only:
+        fp32_path = export_model(args.model, args.output)
+        int8_path = quantize_model(fp32_path, args.output)
+        print(f"✅ Exported {args.model}: {os.path.getsize(fp32_path) / 1e6:.1f} MB fp32, "
+              f"{os.path.getsize(int8_path) / 1e6:.1f} MB int8")
+
+    report = check_parity(args.output, args.dataset)
+    for name, value in report.items():
+        print(f"{name}: {value:.4f}" if isinstance(value, float) else f"{name}: {value}")
+
+    if report["label_agreement"] < args.min_agreement:
+        print(f"❌ Label agreement below {args.min_agreement}")
+        sys.exit(1)
+    print("✅ Parity check passed")
+
+
+if __name__ == "__main__":
+    main()
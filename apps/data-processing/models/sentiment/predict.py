@@ -1,25 +1,38 @@
-import pickle
-from tensorflow.keras.models import load_model
+import argparse
+import os
+import sys
+from functools import lru_cache
+from typing import List, Tuple
 
+# Make the processors package importable when run as a plain script
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
-# Load Model
-model = load_model("sentiment_lstm_model.h5")
+from processors.sentiment import LSTMSentimentAnalyzer
 
-# Load Vectorizer
-with open("text_vectorizer.pkl", "rb") as f:
-    vectorizer = pickle.load(f)
 
-# Function to predict sentiment on new text
-def predict_sentiment(text):
-    '''func to predict sentiment on new text'''
-    text_seq = vectorizer([text]).numpy()  # Convert text to sequence
-    prediction = model.predict(text_seq)[0][0]  # Get probability score
-    label = "POSITIVE" if prediction > 0.5 else "NEGATIVE"
-    return label, prediction
+# Load Model and Vectorizer on first use
+@lru_cache(maxsize=None)
+def get_analyzer(model_path="sentiment_lstm_model.h5", vectorizer_path="text_vectorizer.pkl"):
+    '''func to load the trained model once'''
+    return LSTMSentimentAnalyzer(model_path=model_path, vectorizer_path=vectorizer_path)
+
+# Function to predict sentiment on new texts
+def predict_sentiments(texts: List[str], analyzer=None) -> List[Tuple[str, float]]:
+    '''func to predict sentiment on a batch of new texts'''
+    results = (analyzer or get_analyzer()).analyze_batch(texts)
+    return [(label.upper(), score) for label, score in zip(results.labels, results.scores.tolist())]
 
-# Example
-NEW_TEXT = "Markets are highly volatile and uncertain today."
-sentiment, score = predict_sentiment(NEW_TEXT)
+def predict_sentiment(text, analyzer=None):
+    '''func to predict sentiment on new text'''
+    return predict_sentiments([text], analyzer)[0]
 
-print(f"Text: {NEW_TEXT}")
-print(f"Predicted Sentiment: {sentiment} (Score: {score:.4f})")
\ No newline at end of file
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Predict sentiment with the trained LSTM model")
+    parser.add_argument('texts', nargs='*', default=["Markets are highly volatile and uncertain today."])
+    parser.add_argument('--model', default="sentiment_lstm_model.h5")
+    parser.add_argument('--vectorizer', default="text_vectorizer.pkl")
+    args = parser.parse_args()
+    
+    for text, (sentiment, score) in zip(args.texts, predict_sentiments(args.texts, get_analyzer(args.model, args.vectorizer))):
+        print(f"Text: {text}")
+        print(f"Predicted Sentiment: {sentiment} (Score: {score:.4f})")
\ No newline at end of file
@@ -1,5 +1,5 @@
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 import json
 from datetime import datetime, timedelta
 import psycopg2
@@ -281,6 +281,140 @@ class Storage:
             logger.error(f"Error getting cached data: {str(e)}")
             return None
             
+    def cache_many(self, items: Dict[str, Any], ttl: Optional[int] = None):
+        """
+        Cache several entries in Redis in one round-trip.
+        
+        Args:
+            items: Mapping of cache keys to data
+            ttl: Optional TTL in seconds (defaults to configured TTL)
+        """
+        if not items:
+            return
+            
+        try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            for key, data in items.items():
+                pipe.set(key, json.dumps(data), ex=ttl or self.cache_ttl)
+            pipe.execute()
+        except Exception as e:
+            logger.error(f"Error caching data: {str(e)}")
+            
+    def get_cached_many(self, keys: List[str]) -> List[Optional[Any]]:
+        """
+        Get several cached entries from Redis in one round-trip.
+        
+        Args:
+            keys: Cache keys
+            
+        Returns:
+            Cached data for each key, None where not found
+        """
+        if not keys:
+            return []
+            
+        try:
+            values = self.redis_client.mget(keys)
+            return [json.loads(value) if value else None for value in values]
+        except Exception as e:
+            logger.error(f"Error getting cached data: {str(e)}")
+            return [None] * len(keys)
+    
+    def patch_cached_hash(self,
+                          key: str,
+                          items: Dict[str, Any],
+                          removed: Iterable[str] = (),
+                          ttl: Optional[int] = None,
+                          replace: bool = False):
+        """
+        Update fields of a cached Redis hash atomically, leaving the others as they are.
+        
+        Args:
+            key: Hash key
+            items: Mapping of fields to data, stored as JSON
+            removed: Fields to delete
+            ttl: Optional TTL in seconds of the hash (defaults to configured TTL)
+            replace: Drop every other field of the hash
+        """
+        removed = list(removed)
+        if not items and not removed and not replace:
+            return
+        
+        try:
+            pipe = self.redis_client.pipeline(transaction=True)
+            if replace:
+                pipe.delete(key)
+            if removed:
+                pipe.hdel(key, *removed)
+            if items:
+                pipe.hset(key, mapping={field: json.dumps(data) for field, data in items.items()})
+            pipe.expire(key, ttl or self.cache_ttl)
+            pipe.execute()
+        except Exception as e:
+            logger.error(f"Error caching data: {str(e)}")
+    
+    def get_cached_hash(self, key: str) -> Dict[str, Any]:
+        """
+        Get every field of a cached Redis hash.
+        
+        Args:
+            key: Hash key
+        
+        Returns:
+            Cached data by field, empty if not found
+        """
+        try:
+            return {field: json.loads(value) for field, value in self.redis_client.hgetall(key).items()}
+        except Exception as e:
+            logger.error(f"Error getting cached data: {str(e)}")
+            return {}
+    
+    def increment_hashes(self, increments: Dict[str, Dict[str, float]], ttl: Optional[int] = None):
+        """
+        Add to float fields of Redis hashes in one round-trip.
+        
+        Args:
+            increments: Mapping of hash keys to the amounts added to their fields
+            ttl: Optional TTL in seconds of the hashes (defaults to configured TTL)
+        """
+        if not increments:
+            return
+            
+        try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            for key, fields in increments.items():
+                for field, amount in fields.items():
+                    pipe.hincrbyfloat(key, field, amount)
+                pipe.expire(key, ttl or self.cache_ttl)
+            pipe.execute()
+        except Exception as e:
+            logger.error(f"Error incrementing hashes: {str(e)}")
+            
+    def get_hashes(self, keys: List[str]) -> List[Dict[str, float]]:
+        """
+        Get several Redis hashes of float fields in one round-trip.
+        
+        Args:
+            keys: Hash keys
+            
+        Returns:
+            Fields of each hash, empty where not found
+        """
+        if not keys:
+            return []
+            
+        try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            for key in keys:
+                pipe.hgetall(key)
+            return [
+                {field: float(value) for field, value in fields.items()}
+                for fields in pipe.execute()
+            ]
+        except Exception as e:
+            logger.error(f"Error getting hashes: {str(e)}")
+            return [{} for _ in keys]
+            
     def close(self):
         """Close database connections."""
         if self.pg_conn:
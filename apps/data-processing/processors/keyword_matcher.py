@@ -0,0 +1,124 @@
+import re
+from collections import Counter, deque
+from typing import Dict, Iterable, List
+
+# Words as the matcher sees them, so keywords only match whole words
+_WORD = re.compile(r'\w+')
+
+def tokenize(text: str) -> List[str]:
+    """Split a text into lowercase words."""
+    return _WORD.findall(text.lower())
+
+
+class KeywordMatcher:
+    """
+    Aho-Corasick automaton over words, matching named keyword groups at once.
+    
+    Keywords are single words or phrases. The automaton reads a text word by
+    word, so one linear pass finds every keyword of every group and matches
+    never start or end inside a word.
+    """
+    
+    def __init__(self, groups: Dict[str, Iterable[str]]):
+        """
+        Compile the keyword groups.
+        
+        Args:
+            groups: Keywords by group name, a keyword may belong to several groups
+        """
+        self.groups: Dict[str, List[str]] = {}
+        self.keyword_groups: Dict[str, List[str]] = {}
+        for name, keywords in groups.items():
+            self.groups[name] = []
+            for keyword in keywords:
+                keyword = ' '.join(tokenize(keyword))
+                if keyword:
+                    self.groups[name].append(keyword)
+                    self.keyword_groups.setdefault(keyword, []).append(name)
+        
+        # Trie of the keywords' words
+        self._goto: List[Dict[str, int]] = [{}]
+        self._output: List[List[str]] = [[]]
+        for keyword in self.keyword_groups:
+            node = 0
+            for word in keyword.split(' '):
+                if word not in self._goto[node]:
+                    self._goto.append({})
+                    self._output.append([])
+                    self._goto[node][word] = len(self._goto) - 1
+                node = self._goto[node][word]
+            self._output[node].append(keyword)
+        
+        # Failure links, breadth first so shorter suffixes are linked first
+        self._fail = [0] * len(self._goto)
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for word, child in self._goto[node].items():
+                fallback = self._fail[node]
+                while fallback and word not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(word, 0)
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+                queue.append(child)
+    
+    def find(self, text: str) -> List[str]:
+        """
+        Find all keyword occurrences in a text.
+        
+        Args:
+            text: Text to scan
+        
+        Returns:
+            Matched keywords in order of their end, repeated for every occurrence
+        """
+        goto, fail, output = self._goto, self._fail, self._output
+        found: List[str] = []
+        node = 0
+        for word in tokenize(text):
+            while node and word not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(word, 0)
+            if output[node]:
+                found.extend(output[node])
+        return found
+    
+    def find_many(self, texts: Iterable[str]) -> List[List[str]]:
+        """
+        Find all keyword occurrences in several texts.
+        
+        Args:
+            texts: Texts to scan
+        
+        Returns:
+            Matched keywords of each text
+        """
+        return [self.find(text) for text in texts]
+    
+    def match(self, text: str) -> Dict[str, Dict[str, int]]:
+        """
+        Count the keyword occurrences of every group in a text.
+        
+        Args:
+            text: Text to scan
+        
+        Returns:
+            Keyword counts by group name, every group is present
+        """
+        matches: Dict[str, Dict[str, int]] = {name: {} for name in self.groups}
+        for keyword, count in Counter(self.find(text)).items():
+            for name in self.keyword_groups[keyword]:
+                matches[name][keyword] = count
+        return matches
+    
+    def match_many(self, texts: Iterable[str]) -> List[Dict[str, Dict[str, int]]]:
+        """
+        Count the keyword occurrences of every group in several texts.
+        
+        Args:
+            texts: Texts to scan
+        
+        Returns:
+            Keyword counts by group name of each text
+        """
+        return [self.match(text) for text in texts]
@@ -0,0 +1,200 @@
+import asyncio
+import logging
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+import yaml
+
+logger = logging.getLogger(__name__)
+
+# Tells the worker to stop
+_STOP = object()
+
+# Serving settings used where the pipeline configuration leaves them out
+SERVING_DEFAULTS = {
+    'max_batch_size': 64,
+    'max_wait_ms': 5,
+    'max_request_texts': 1000
+}
+
+def load_serving_config(path: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Read the serving settings of the sentiment endpoints.
+    
+    Both HTTP apps take their batching limits from ``sentiment.serving`` of
+    the pipeline configuration, so they are tuned in one place.
+    
+    Args:
+        path: Pipeline configuration file, defaults to $PIPELINE_CONFIG or config/pipeline.yaml
+    
+    Returns:
+        Serving settings, with defaults for the ones not configured
+    """
+    path = path or os.environ.get('PIPELINE_CONFIG', 'config/pipeline.yaml')
+    try:
+        with open(path, 'r') as f:
+            config = yaml.safe_load(f) or {}
+    except FileNotFoundError:
+        logger.warning(f"Pipeline configuration {path} not found, using default serving settings")
+        config = {}
+    return {**SERVING_DEFAULTS, **(config.get('sentiment') or {}).get('serving', {})}
+
+class MicroBatcher:
+    """
+    Coalesce concurrent single-text requests into batches.
+    
+    Request threads submit texts and wait on a future while one worker thread
+    collects them into a batch. A batch is scored as soon as it holds
+    ``max_batch_size`` texts or its first text has waited ``max_wait_ms``,
+    so the added latency is bounded and throughput rises with load.
+    """
+    
+    def __init__(self,
+                 batch_fn: Callable[[List[str]], Sequence[Any]],
+                 max_batch_size: int = 64,
+                 max_wait_ms: float = 5):
+        """
+        Initialize the batcher and start its worker.
+        
+        Args:
+            batch_fn: Function scoring a list of texts, returning one result per text
+            max_batch_size: Most texts scored together
+            max_wait_ms: Longest time a text waits for others to join its batch
+        
+        Raises:
+            ValueError: If the batch size is not positive or the wait is negative
+        """
+        if max_batch_size <= 0:
+            raise ValueError(f"max_batch_size must be positive, got {max_batch_size}")
+        if max_wait_ms < 0:
+            raise ValueError(f"max_wait_ms must not be negative, got {max_wait_ms}")
+        
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.batches = 0
+        self.items = 0
+        
+        self._queue: queue.Queue = queue.Queue()
+        self._closed = False
+        self._worker = threading.Thread(target=self._run, name='micro-batcher', daemon=True)
+        self._worker.start()
+    
+    def submit(self, text: str) -> Future:
+        """
+        Queue a text for the next batch.
+        
+        Args:
+            text: Text to score
+        
+        Returns:
+            Future resolved with the text's result
+        
+        Raises:
+            RuntimeError: If the batcher is closed
+        """
+        if self._closed:
+            raise RuntimeError("MicroBatcher is closed")
+        future: Future = Future()
+        self._queue.put((text, future))
+        return future
+    
+    def analyze(self, text: str, timeout: Optional[float] = None) -> Any:
+        """
+        Score one text as part of a batch, blocking until it is done.
+        
+        Args:
+            text: Text to score
+            timeout: Seconds to wait for the result
+        
+        Returns:
+            Result of the text
+        """
+        return self.submit(text).result(timeout)
+    
+    def analyze_many(self, texts: List[str], timeout: Optional[float] = None) -> List[Any]:
+        """
+        Score several texts, sharing batches with concurrent requests.
+        
+        Args:
+            texts: Texts to score
+            timeout: Seconds to wait for each result
+        
+        Returns:
+            Results in the order of the texts
+        """
+        futures = [self.submit(text) for text in texts]
+        return [future.result(timeout) for future in futures]
+    
+    async def analyze_async(self, text: str) -> Any:
+        """
+        Score one text from a coroutine without blocking the event loop.
+        
+        Args:
+            text: Text to score
+        
+        Returns:
+            Result of the text
+        """
+        return await asyncio.wrap_future(self.submit(text))
+    
+    def close(self):
+        """Score the texts already queued, then stop the worker."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)
+        self._worker.join()
+    
+    def _collect(self, first: Tuple[str, Future]) -> Tuple[List[Tuple[str, Future]], bool]:
+        """Gather texts joining the first one's batch until it is full or its wait is over."""
+        batch = [first]
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is _STOP:
+                return batch, True
+            batch.append(item)
+        return batch, False
+    
+    def _run(self):
+        """Worker loop scoring one batch at a time."""
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is _STOP:
+                break
+            batch, stopping = self._collect(item)
+            
+            # Cancelled requests are not scored
+            batch = [(text, future) for text, future in batch if future.set_running_or_notify_cancel()]
+            if not batch:
+                continue
+            
+            try:
+                results = list(self.batch_fn([text for text, _ in batch]))
+                if len(results) != len(batch):
+                    raise RuntimeError(f"Batch function returned {len(results)} results for {len(batch)} texts")
+            except Exception as e:
+                logger.error(f"Error scoring batch of {len(batch)} texts: {str(e)}")
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+            
+            self.batches += 1
+            self.items += len(batch)
+            for (_, future), result in zip(batch, results):
+                future.set_result(result)
+        
+        # Fail texts submitted while closing instead of leaving them waiting
+        while not self._queue.empty():
+            item = self._queue.get_nowait()
+            if item is not _STOP and item[1].set_running_or_notify_cancel():
+                item[1].set_exception(RuntimeError("MicroBatcher is closed"))
@@ -1,17 +1,24 @@
 import logging
 import yaml
-from typing import Any, Dict, List
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Set, Tuple
 from datetime import datetime, timedelta
+import functools
+import time
 import os
+from signal import SIGINT, SIGTERM
 import asyncio
 from prometheus_client import start_http_server, Counter, Gauge, Histogram
 import sentry_sdk
 
-from clients import create_clients
+from clients import BaseClient, create_clients
 from processors.validation import DataValidator
 from processors.sentiment import CompositeSentimentAnalyzer
+from processors.sentiment_rollup import SentimentRollup
 from processors.profitability import ProfitabilityCalculator
-from processors.signal_aggregator import SignalAggregator
+from processors.signal_aggregator import SignalAggregator, symbol_addresses
+from processors.token_index import TokenIndex
+from processors.scheduler import Scheduler
+from processors.stages import END, chunks, consume, emit, run_stages
 from models.storage import Storage
 
 logger = logging.getLogger(__name__)
@@ -25,6 +32,17 @@ GENERATED_SIGNALS = Counter('generated_signals_total', 'Number of trading signal
 PROCESSING_TIME = Histogram('processing_time_seconds', 'Time spent processing data')
 SIGNAL_SCORE = Gauge('signal_score', 'Trading signal score', ['token', 'category'])
 
+# Seconds between refreshes of each source in daemon mode
+DEFAULT_SCHEDULE = {
+    'tweets': 60,
+    'pools': 300,
+    'forum_calls': 3600
+}
+
+def tweet_engagement(tweet: Dict[str, Any]) -> float:
+    """Engagement of a tweet, weighting comments over retweets over likes."""
+    return tweet['likes'] + tweet['retweets'] * 2 + tweet['comments'] * 3
+
 class Pipeline:
     """Main pipeline orchestrator."""
     
@@ -45,208 +63,553 @@ class Pipeline:
             environment=self.config['monitoring']['sentry']['environment']
         )
         
+        # Connect to databases
+        self.storage = Storage(self.config['storage'])
+        self.storage.connect()
+        
         # Initialize components
-        self.clients = create_clients(self.config)
+        self.clients = create_clients(self.config, redis_client=self.storage.redis_client)
         self.validator = DataValidator()
-        self.sentiment_analyzer = CompositeSentimentAnalyzer(self.config['sentiment'])
+        self.sentiment_analyzer = CompositeSentimentAnalyzer(self.config['sentiment'], storage=self.storage)
         self.profitability_calculator = ProfitabilityCalculator()
         self.signal_aggregator = SignalAggregator(self.config['signal'])
-        self.storage = Storage(self.config['storage'])
+        token_config = self.config.get('token_index', {})
+        self.token_index = TokenIndex(
+            min_symbol_length=token_config.get('min_symbol_length', 3),
+            min_liquidity=token_config.get('min_liquidity', 0.0)
+        )
         
-        # Connect to databases
-        self.storage.connect()
+        # Until the pools stage has built the token index once, the tweets
+        # stage waits for a pool refresh running alongside it
+        self._token_index_built = False
+        self._pools_refreshed: Optional[asyncio.Event] = None
+        
+        # Latest results of every source, combined when any of them is refreshed
+        self.snapshot: Dict[str, Any] = {
+            'token_metrics': [],
+            'forum_calls': []
+        }
+        
+        # Tokens with new tweets, metrics or calls since their signals were
+        # generated, and the latest signal of every token
+        self.dirty_tokens: Set[str] = set()
+        self.latest_signals: Dict[str, Dict[str, Any]] = {}
+        self._signals_published = False
+        self._cycle_lock = asyncio.Lock()
+        
+        # Bounded queues between stages keep memory flat under backpressure
+        self.stages_config = self.config.get('stages', {})
+        self.queue_size = self.stages_config.get('queue_size', 1000)
+        self.batch_size = self.stages_config.get('batch_size', 100)
+        
+        # Running per-asset sentiment, persisted to Redis if configured
+        self.sentiment_rollup = SentimentRollup(
+            bucket_seconds=self.stages_config.get('rollup_bucket_seconds', 60),
+            retention=self.stages_config.get('sentiment_window', 86400),
+            storage=self.storage if self.stages_config.get('rollup_backend', 'redis') == 'redis' else None
+        )
+        self.sentiment_rollup.restore()
         
         # Start Prometheus server
         start_http_server(self.config['monitoring']['prometheus']['port'])
         
-    async def ingest_data(self) -> Dict[str, Any]:
+    async def ingest_tweets(self) -> Dict[str, Any]:
         """
-        Ingest data from all sources.
+        Ingest the tweets posted since the last stored run.
         
         Returns:
-            Dictionary containing ingested data
+            Dictionary containing the new tweets
         """
-        try:
-            # Get tweets
-            tweets = await asyncio.to_thread(
-                self.clients['x'].get_tweets,
-                start_time=datetime.utcnow() - timedelta(hours=24)
-            )
-            PROCESSED_TWEETS.inc(len(tweets))
+        tweets = await self.clients['x'].poll_tweets_async(
+            lookback=timedelta(hours=24)
+        )
+        PROCESSED_TWEETS.inc(len(tweets))
+        return {'tweets': tweets}
+        
+    async def ingest_forum_calls(self) -> Dict[str, Any]:
+        """
+        Ingest forum calls from the last week.
+        
+        Returns:
+            Dictionary containing forum calls
+        """
+        forum_calls = await asyncio.to_thread(
+            self.clients['forum'].get_calls,
+            start_time=datetime.utcnow() - timedelta(days=7)
+        )
+        PROCESSED_CALLS.inc(len(forum_calls))
+        return {'forum_calls': forum_calls}
+        
+    async def tweet_stage(self, writer: asyncio.Queue) -> Dict[str, Any]:
+        """
+        Fetch new tweets, score them and queue them for storage in batches.
+        
+        The whole poll is scored at once, so a sentiment analyzer sharded
+        across worker processes gets enough texts to split.
+        Until the token index has been built once, token extraction waits
+        for a pool refresh of the same cycle, so tokens mentioned by name are
+        recognised and not just cashtags.
+        
+        Args:
+            writer: Queue of the storage stage
             
-            # Get liquidity pools
-            pools = await asyncio.to_thread(self.clients['raydium'].get_pools)
-            PROCESSED_POOLS.inc(len(pools))
+        Returns:
+            Dictionary containing the fetched tweets, their sentiments and
+            their rollup records, added by ``run_cycle`` once stored
+        """
+        tweets = (await self.ingest_tweets())['tweets']
+        valid_tweets = [tweet for tweet in tweets if self.validator.validate_tweet(tweet)]
+        sentiments = await asyncio.to_thread(
+            self.sentiment_analyzer.analyze_tweets,
+            valid_tweets
+        )
+        # An empty index only recognises cashtags, so names and bare symbols
+        # wait for the first pool refresh to compile it
+        if not self._token_index_built and self._pools_refreshed is not None:
+            await self._pools_refreshed.wait()
             
-            # Get token metrics for each pool
-            token_metrics = []
-            for pool in pools:
-                metrics = await asyncio.to_thread(
-                    self.clients['dex_screener'].get_token_metrics,
-                    pool['mintA']
-                )
-                token_metrics.append(metrics)
+        # Token recognition scans every text, so it runs off the event loop too
+        tokens = await asyncio.to_thread(
+            self.token_index.extract_many,
+            [tweet['text'] for tweet in valid_tweets]
+        )
+        
+        # Store each tweet together with its score, and keep the tokens
+        # and engagement the signals are joined and weighted on
+        by_id = {result['tweet_id']: result for result in sentiments}
+        for tweet, tweet_tokens in zip(valid_tweets, tokens):
+            if tweet['id'] in by_id:
+                result = by_id[tweet['id']]
+                tweet['sentiment'] = result['sentiment']
+                result['tokens'] = tweet_tokens
+                result['engagement'] = tweet_engagement(tweet)
                 
-            # Get forum calls
-            forum_calls = await asyncio.to_thread(
-                self.clients['forum'].get_calls,
-                start_time=datetime.utcnow() - timedelta(days=7)
-            )
-            PROCESSED_CALLS.inc(len(forum_calls))
-            
-            return {
-                'tweets': tweets,
-                'pools': pools,
-                'token_metrics': token_metrics,
-                'forum_calls': forum_calls
-            }
+        for batch in chunks(valid_tweets, self.batch_size):
+            await writer.put((self.storage.store_tweets, batch))
             
-        except Exception as e:
-            logger.error(f"Error ingesting data: {str(e)}")
-            sentry_sdk.capture_exception(e)
-            raise
+        logger.info(f"Scored {len(sentiments)}/{len(tweets)} tweets")
+        return {
+            'tweets': tweets,
+            'sentiments': sentiments,
+            'rollup': list(self.rollup_records(valid_tweets, tokens))
+        }
+        
+    def rollup_records(self,
+                       tweets: List[Dict[str, Any]],
+                       tokens: List[List[str]]) -> Iterable[Tuple[str, float, float, Optional[float]]]:
+        """
+        Turn scored tweets into sentiment rollup records, one per mentioned token.
+        
+        Args:
+            tweets: Tweets with their sentiment attached
+            tokens: Tokens each tweet mentions, as returned by ``TokenIndex.extract_many``
             
-    async def process_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        Returns:
+            (asset, text score, engagement, posting time) tuples
+        """
+        for tweet, tweet_tokens in zip(tweets, tokens):
+            if 'sentiment' not in tweet:
+                continue
+            score = min(1.0, max(0.0, tweet['sentiment']['components']['text']['score']))
+            engagement = tweet_engagement(tweet)
+            try:
+                timestamp = datetime.fromisoformat(tweet['created_at'].replace('Z', '+00:00')).timestamp()
+            except (AttributeError, ValueError):
+                timestamp = None
+            for asset in tweet_tokens:
+                yield asset, score, engagement, timestamp
+                
+    async def pool_source(self) -> AsyncIterator[Dict[str, Any]]:
         """
-        Process ingested data.
+        Yield liquidity pools, streamed as they are downloaded if enabled.
+        
+        Returns:
+            Async iterator over normalized pools
+        """
+        raydium = self.clients['raydium']
+        if self.stages_config.get('stream_pools', True):
+            async for pool in raydium.iter_pools_async():
+                PROCESSED_POOLS.inc()
+                yield pool
+        else:
+            pools = await raydium.get_pools_async()
+            PROCESSED_POOLS.inc(len(pools))
+            for pool in pools:
+                yield pool
+                
+    async def pool_stage(self, writer: asyncio.Queue) -> Dict[str, Any]:
+        """
+        Stream pools into the token metrics lookups and queue metrics for storage.
         
         Args:
-            data: Dictionary containing ingested data
+            writer: Queue of the storage stage
             
         Returns:
-            Dictionary containing processed data
+            Dictionary containing the token metrics
         """
+        pools = asyncio.Queue(maxsize=self.queue_size)
         try:
-            # Validate data
-            valid_data = self.validator.filter_valid_data(
-                tweets=data['tweets'],
-                pools=data['pools'],
-                token_metrics=data['token_metrics'],
-                forum_calls=data['forum_calls']
+            _, token_metrics = await run_stages(
+                emit(pools, self.pool_source()),
+                self.fetch_token_metrics(pools, writer)
             )
+        finally:
+            # Release tweets waiting for the index, built or not
+            if self._pools_refreshed is not None:
+                self._pools_refreshed.set()
+        return {'token_metrics': token_metrics}
+        
+    async def fetch_token_metrics(self, pools: asyncio.Queue, writer: asyncio.Queue) -> List[Dict[str, Any]]:
+        """
+        Fetch DexScreener metrics for the tokens of the pools on a queue.
+        
+        Repeated ``mintA`` values are collapsed so every distinct token is
+        looked up once per cycle. As soon as a batch of new tokens is complete
+        its lookup starts, while pools are still arriving; at most
+        ``max_concurrency`` lookups run at once, which also holds back the pool
+        stream once the lookups fall behind.
+        
+        Args:
+            pools: Queue of pools fed by the pool source
+            writer: Queue of the storage stage
             
-            # Analyze sentiment
-            sentiments = await asyncio.to_thread(
-                self.sentiment_analyzer.analyze_tweets,
-                valid_data['tweets']
-            )
+        Returns:
+            List of valid token metrics
+        """
+        dex_screener = self.clients['dex_screener']
+        slots = asyncio.Semaphore(dex_screener.max_concurrency)
+        token_metrics = []
+        lookups = []
+        seen = set()
+        pending = []
+        
+        async def lookup(addresses: List[str]):
+            try:
+                metrics = await dex_screener.get_tokens_metrics_async(addresses)
+                valid_metrics = [
+                    metrics[address] for address in addresses
+                    if address in metrics and self.validator.validate_token_metrics(metrics[address])
+                ]
+                token_metrics.extend(valid_metrics)
+                self.token_index.add_many(valid_metrics, rebuild=False)
+                await writer.put((self.storage.store_market_metrics, valid_metrics))
+            finally:
+                slots.release()
+                
+        async def start_lookup(addresses: List[str]):
+            await slots.acquire()
+            lookups.append(asyncio.create_task(lookup(addresses)))
             
-            # Calculate profitability
-            # Create price lookup from token metrics
-            current_prices = {
-                metric['address']: metric['price_usd']
-                for metric in valid_data['token_metrics']
-            }
+        try:
+            async for pool in consume(pools):
+                if not self.validator.validate_pool(pool) or pool['mintA'] in seen:
+                    continue
+                seen.add(pool['mintA'])
+                pending.append(pool['mintA'])
+                if len(pending) >= dex_screener.batch_size:
+                    await start_lookup(pending)
+                    pending = []
+                    
+            if pending:
+                await start_lookup(pending)
+            await asyncio.gather(*lookups)
             
-            profitability = await asyncio.to_thread(
-                self.profitability_calculator.calculate_calls_profitability,
-                valid_data['forum_calls'],
-                current_prices
-            )
+            # Compile the token automaton once for the whole universe
+            await asyncio.to_thread(self.token_index.rebuild)
+            self._token_index_built = True
             
-            # Generate signals
-            signals = await asyncio.to_thread(
-                self.signal_aggregator.generate_signals,
-                sentiments=sentiments,
-                market_metrics={m['address']: m for m in valid_data['token_metrics']},
-                profitability={p['token']: [p] for p in profitability}
-            )
+        finally:
+            for task in lookups:
+                task.cancel()
+                
+        logger.info(f"Fetched metrics for {len(token_metrics)}/{len(seen)} tokens")
+        return token_metrics
+        
+    async def forum_call_stage(self, writer: asyncio.Queue) -> Dict[str, Any]:
+        """
+        Fetch forum calls and queue the valid ones for storage.
+        
+        Args:
+            writer: Queue of the storage stage
             
-            GENERATED_SIGNALS.inc(len(signals))
+        Returns:
+            Dictionary containing the valid forum calls
+        """
+        forum_calls = (await self.ingest_forum_calls())['forum_calls']
+        valid_calls = [call for call in forum_calls if self.validator.validate_forum_call(call)]
+        await writer.put((self.storage.store_forum_calls, valid_calls))
+        return {'forum_calls': valid_calls}
+        
+    async def storage_stage(self, writer: asyncio.Queue):
+        """
+        Write queued rows as they are produced.
+        
+        A single writer keeps database access sequential. Failed batches are
+        reported and skipped so producers never block on a dead writer.
+        
+        Args:
+            writer: Queue of (store method, rows) pairs
             
-            # Update Prometheus metrics
-            for signal in signals:
-                SIGNAL_SCORE.labels(
-                    token=signal['token'],
-                    category=signal['category']
-                ).set(signal['score'])
+        Raises:
+            RuntimeError: If any batch could not be stored
+        """
+        failures = 0
+        async for store, rows in consume(writer):
+            if not rows:
+                continue
+            try:
+                await asyncio.to_thread(store, rows)
+            except Exception as e:
+                failures += 1
+                logger.error(f"Error storing data: {str(e)}")
+                sentry_sdk.capture_exception(e)
                 
-            return {
-                'valid_data': valid_data,
-                'sentiments': sentiments,
-                'profitability': profitability,
-                'signals': signals
-            }
+        if failures:
+            raise RuntimeError(f"{failures} storage batches failed")
             
-        except Exception as e:
-            logger.error(f"Error processing data: {str(e)}")
-            sentry_sdk.capture_exception(e)
-            raise
-            
-    async def store_data(self, data: Dict[str, Any]):
+    def update_snapshot(self, result: Dict[str, Any]):
         """
-        Store processed data.
+        Merge the results of a stage into the latest data of every source.
+        
+        Tweets are polled incrementally and their sentiment is kept in the
+        rollup, which covers the last ``sentiment_window`` seconds. Tokens with
+        new sentiments or sentiments leaving the window, and tokens whose
+        metrics or forum calls changed, are marked dirty for signal generation.
         
         Args:
-            data: Dictionary containing processed data
+            result: Results returned by a stage
         """
-        try:
-            # Store in PostgreSQL
-            await asyncio.to_thread(
-                self.storage.store_tweets,
-                data['valid_data']['tweets']
-            )
-            
-            await asyncio.to_thread(
-                self.storage.store_market_metrics,
-                data['valid_data']['token_metrics']
-            )
+        now = time.time()
+        for key, value in result.items():
+            if key == 'sentiments':
+                for sentiment in value:
+                    self.dirty_tokens.update(sentiment.get('tokens', []))
+                self.dirty_tokens.update(self.sentiment_rollup.prune(now))
+            elif key == 'token_metrics':
+                previous = {metric['address']: metric for metric in self.snapshot['token_metrics']}
+                current = {metric['address']: metric for metric in value}
+                for address in previous.keys() | current.keys():
+                    if previous.get(address) != current.get(address):
+                        self.dirty_tokens.add(address)
+                        # Signals keyed by the symbol before the address was known
+                        symbol = (current.get(address) or previous[address]).get('symbol')
+                        if symbol:
+                            self.dirty_tokens.add(symbol.upper())
+                self.snapshot[key] = value
+            elif key == 'forum_calls':
+                previous = {call['post_id']: call.get('token') for call in self.snapshot['forum_calls']}
+                current = {call['post_id']: call.get('token') for call in value}
+                self.dirty_tokens.update(token for _, token in previous.items() ^ current.items() if token)
+                self.snapshot[key] = value
+            elif key in self.snapshot:
+                self.snapshot[key] = value
+                
+    async def generate_signals(self) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """
+        Regenerate the signals of the dirty tokens from the latest data of every source.
+        
+        Signals of the other tokens are unchanged and stay in ``latest_signals``.
+        Dirty tokens left without any data lose their signal.
+        
+        Returns:
+            Regenerated trading signals and the tokens whose signals were dropped
+        """
+        dirty, self.dirty_tokens = self.dirty_tokens, set()
+        if not dirty:
+            return [], []
             
-            await asyncio.to_thread(
-                self.storage.store_forum_calls,
-                data['valid_data']['forum_calls']
-            )
+        token_metrics = self.snapshot['token_metrics']
+        market_metrics = {metric['address']: metric for metric in token_metrics}
+        
+        # Symbols resolve to the token the index attributes tweets to, the
+        # most liquid one sharing them
+        addresses = {**symbol_addresses(market_metrics), **self.token_index.symbols}
+        
+        # Calculate profitability
+        # Create price lookup from token metrics, calls may name a token by
+        # its address or its symbol
+        current_prices = {
+            address: metric['price_usd']
+            for address, metric in market_metrics.items()
+        }
+        for symbol, address in addresses.items():
+            if address in market_metrics:
+                current_prices[symbol] = market_metrics[address]['price_usd']
+                
+        # Windowed sentiment of the dirty tokens only, under both their
+        # address and the symbol cashtags named them by before it was known
+        symbols = {metric['address']: metric['symbol'].upper() for metric in token_metrics if metric.get('symbol')}
+        keys = dirty | {symbols[token] for token in dirty if token in symbols}
+        keys |= {addresses[token] for token in dirty if token in addresses}
+        sentiments = {token: self.sentiment_rollup.window(token) for token in keys}
+        
+        profitability = await asyncio.to_thread(
+            self.profitability_calculator.calculate_calls_profitability,
+            self.snapshot['forum_calls'],
+            current_prices
+        )
+        
+        # Every measured call of a token counts towards its signal
+        calls_by_token: Dict[str, List[Dict[str, Any]]] = {}
+        for record in profitability:
+            calls_by_token.setdefault(record['token'], []).append(record)
             
-            await asyncio.to_thread(
-                self.storage.store_signals,
-                data['signals']
-            )
+        # Generate signals
+        signals = await asyncio.to_thread(
+            self.signal_aggregator.generate_signals,
+            sentiments=sentiments,
+            market_metrics=market_metrics,
+            profitability=calls_by_token,
+            tokens=dirty,
+            symbols=addresses
+        )
+        
+        GENERATED_SIGNALS.inc(len(signals))
+        
+        # Update Prometheus metrics, dropping series of previous categories
+        for signal in signals:
+            previous = self.latest_signals.get(signal['token'])
+            if previous and previous['category'] != signal['category']:
+                SIGNAL_SCORE.remove(signal['token'], previous['category'])
+            SIGNAL_SCORE.labels(
+                token=signal['token'],
+                category=signal['category']
+            ).set(signal['score'])
+            self.latest_signals[signal['token']] = signal
             
-            # Cache in Redis
-            self.storage.cache_data(
-                'latest_signals',
-                data['signals'],
-                ttl=3600  # 1 hour
-            )
+        fresh = {signal['token'] for signal in signals}
+        removed = [token for token in dirty if token not in fresh and token in self.latest_signals]
+        for token in removed:
+            SIGNAL_SCORE.remove(token, self.latest_signals.pop(token)['category'])
             
-            self.storage.cache_data(
-                'latest_market_metrics',
-                {m['address']: m for m in data['valid_data']['token_metrics']},
-                ttl=300  # 5 minutes
-            )
+        logger.info(f"Regenerated {len(signals)}/{len(self.latest_signals)} signals for {len(dirty)} dirty tokens")
+        return signals, removed
+        
+    async def store_signals(self, signals: List[Dict[str, Any]], removed: Iterable[str] = ()):
+        """
+        Store regenerated signals and refresh the Redis caches.
+        
+        ``latest_signals`` is a Redis hash with one field per token, patched
+        with the regenerated and dropped signals only. The first write of a
+        run replaces it whole so signals of a previous run do not linger.
+        
+        Args:
+            signals: List of regenerated trading signals
+            removed: Tokens whose signals were dropped
+        """
+        if signals:
+            await asyncio.to_thread(self.storage.store_signals, signals)
             
-        except Exception as e:
-            logger.error(f"Error storing data: {str(e)}")
-            sentry_sdk.capture_exception(e)
-            raise
+        # Cache in Redis
+        replace = not self._signals_published
+        self.storage.patch_cached_hash(
+            'latest_signals',
+            self.latest_signals if replace else {signal['token']: signal for signal in signals},
+            removed=() if replace else removed,
+            ttl=3600,  # 1 hour
+            replace=replace
+        )
+        self._signals_published = True
+        
+        self.storage.cache_data(
+            'latest_market_metrics',
+            {m['address']: m for m in self.snapshot['token_metrics']},
+            ttl=300  # 5 minutes
+        )
+        
+    async def run_cycle(self, sources: Optional[Iterable[str]] = None):
+        """
+        Refresh the given sources and regenerate signals from the latest data.
+        
+        The sources run as concurrent stages connected by bounded queues:
+        tweets are scored while pools are still streaming in, token lookups
+        start as soon as a batch of tokens is known, and a single writer
+        stores rows as they are produced. Signal generation then combines the
+        fresh results with the most recent data of the other sources.
+        
+        Args:
+            sources: Names of the sources to refresh (tweets, pools,
+                forum_calls), defaults to all of them
+        """
+        stages = {
+            'tweets': self.tweet_stage,
+            'pools': self.pool_stage,
+            'forum_calls': self.forum_call_stage
+        }
+        sources = list(sources or stages)
+        if 'pools' in sources:
+            self._pools_refreshed = asyncio.Event()
             
-    async def run(self):
-        """Run the pipeline."""
         try:
             with PROCESSING_TIME.time():
-                # Ingest data
-                logger.info("Starting data ingestion")
-                data = await self.ingest_data()
-                logger.info("Data ingestion complete")
-                
-                # Process data
-                logger.info("Starting data processing")
-                processed = await self.process_data(data)
-                logger.info("Data processing complete")
-                
-                # Store results
-                logger.info("Starting data storage")
-                await self.store_data(processed)
-                logger.info("Data storage complete")
+                logger.info(f"Starting cycle: {', '.join(sources)}")
+                writer = asyncio.Queue(maxsize=self.queue_size)
+                storage = asyncio.create_task(self.storage_stage(writer))
+                try:
+                    results = await run_stages(*(stages[source](writer) for source in sources))
+                finally:
+                    await writer.put(END)
+                    await storage
+                    
+                # Only poll for newer tweets once these are stored, and only
+                # count them in the rollup then, so a failed cycle fetching
+                # them again does not count them twice
+                for result in results:
+                    if 'tweets' in result:
+                        self.clients['x'].commit_since_id(result['tweets'])
+                        self.sentiment_rollup.add_many(result['rollup'])
+                        
+                async with self._cycle_lock:
+                    for result in results:
+                        self.update_snapshot(result)
+                    signals, removed = await self.generate_signals()
+                    await self.store_signals(signals, removed)
+                logger.info(f"Cycle complete: {len(signals)} signals regenerated, {len(self.latest_signals)} current")
                 
         except Exception as e:
-            logger.error(f"Pipeline run failed: {str(e)}")
+            logger.error(f"Pipeline cycle failed: {str(e)}")
             sentry_sdk.capture_exception(e)
             raise
             
+    async def run(self):
+        """Run the pipeline once."""
+        try:
+            await self.run_cycle()
+        finally:
+            await self.close()
+            
+    async def run_forever(self):
+        """
+        Run the pipeline as a daemon until SIGINT or SIGTERM.
+        
+        Each source is refreshed on its own interval from the ``schedule``
+        configuration, reusing the loaded models, HTTP sessions and database
+        connections across cycles.
+        """
+        schedule = {**DEFAULT_SCHEDULE, **self.config.get('schedule', {})}
+        scheduler = Scheduler()
+        for source in ('tweets', 'pools', 'forum_calls'):
+            scheduler.add_job(source, schedule[source], functools.partial(self.run_cycle, [source]))
+            
+        loop = asyncio.get_running_loop()
+        for sig in (SIGINT, SIGTERM):
+            try:
+                loop.add_signal_handler(sig, scheduler.stop)
+            except (NotImplementedError, RuntimeError):
+                # Signal handlers are only available in the main thread on Unix
+                pass
+                
+        try:
+            await scheduler.run()
         finally:
-            self.storage.close()
+            await self.close()
             
+    async def close(self):
+        """Close database connections, HTTP sessions and sentiment workers."""
+        self.sentiment_analyzer.close()
+        self.storage.close()
+        await BaseClient.close_async_session()
+        
     @classmethod
     async def create_and_run(cls, config_path: str):
         """
@@ -257,6 +620,17 @@ class Pipeline:
         """
         pipeline = cls(config_path)
         await pipeline.run()
+        
+    @classmethod
+    async def create_and_run_forever(cls, config_path: str):
+        """
+        Create pipeline instance and run it as a daemon.
+        
+        Args:
+            config_path: Path to pipeline configuration file
+        """
+        pipeline = cls(config_path)
+        await pipeline.run_forever()
 
 if __name__ == '__main__':
     # Configure logging
@@ -268,5 +642,8 @@ if __name__ == '__main__':
     # Get config path
     config_path = os.getenv('PIPELINE_CONFIG', 'config/pipeline.yaml')
     
-    # Run pipeline
-    asyncio.run(Pipeline.create_and_run(config_path)) 
\ No newline at end of file
+    # Run pipeline once, or continuously with PIPELINE_MODE=daemon
+    if os.getenv('PIPELINE_MODE', 'once') == 'daemon':
+        asyncio.run(Pipeline.create_and_run_forever(config_path))
+    else:
+        asyncio.run(Pipeline.create_and_run(config_path)) 
\ No newline at end of file
@@ -1 +1,58 @@
- 
\ No newline at end of file
+import logging
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+class ProfitabilityCalculator:
+    """Measures how forum trading calls performed against current prices."""
+    
+    def calculate_return(self, action: Optional[str], entry_price: float, current_price: float) -> float:
+        """
+        Calculate the percentage return of a call.
+        
+        Args:
+            action: 'buy' or 'sell', sell calls profit when the price drops
+            entry_price: Price the call was made at
+            current_price: Current price of the token
+        
+        Returns:
+            Return in percent
+        """
+        change = (current_price - entry_price) / entry_price * 100
+        return -change if action == 'sell' else change
+    
+    def calculate_calls_profitability(self,
+                                      calls: List[Dict[str, Any]],
+                                      prices: Dict[str, float]) -> List[Dict[str, Any]]:
+        """
+        Calculate the profitability of forum calls.
+        
+        Calls without a token, a positive entry price or a current price for
+        their token are skipped.
+        
+        Args:
+            calls: Forum calls with 'token', 'entry_price' and 'action'
+            prices: Current USD prices by token
+        
+        Returns:
+            List of profitability records, one per measured call
+        """
+        results = []
+        for call in calls:
+            token = call.get('token')
+            entry_price = call.get('entry_price')
+            current_price = prices.get(token) if token else None
+            if not entry_price or entry_price <= 0 or current_price is None:
+                continue
+            
+            results.append({
+                'post_id': call.get('post_id'),
+                'token': token,
+                'action': call.get('action'),
+                'entry_price': entry_price,
+                'current_price': current_price,
+                'return_pct': self.calculate_return(call.get('action'), entry_price, current_price)
+            })
+        
+        logger.info(f"Calculated profitability of {len(results)}/{len(calls)} forum calls")
+        return results
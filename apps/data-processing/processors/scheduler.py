@@ -0,0 +1,88 @@
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Dict, Optional
+import sentry_sdk
+
+logger = logging.getLogger(__name__)
+
+class Scheduler:
+    """
+    Runs asynchronous jobs on fixed intervals until stopped.
+    
+    Every job loops in its own task, so a slow or failing job never delays the
+    others. A job is not started again before its previous run has finished;
+    if a run takes longer than its interval the next one starts right away.
+    """
+    
+    def __init__(self):
+        """Initialize the scheduler."""
+        self.jobs: Dict[str, Dict] = {}
+        self._stop_event: Optional[asyncio.Event] = None
+    
+    def add_job(self, name: str, interval: float, job: Callable[[], Awaitable]):
+        """
+        Register a job.
+        
+        Args:
+            name: Job name used in logs
+            interval: Seconds between the starts of consecutive runs
+            job: Coroutine function to run
+        
+        Raises:
+            ValueError: If the interval is not positive
+        """
+        if interval <= 0:
+            raise ValueError(f"Interval of job {name} must be positive")
+        self.jobs[name] = {'interval': float(interval), 'job': job}
+    
+    def stop(self):
+        """Ask all jobs to stop after their current run."""
+        if self._stop_event is not None:
+            self._stop_event.set()
+    
+    @property
+    def stopping(self) -> bool:
+        """Whether the scheduler has been asked to stop."""
+        return self._stop_event is not None and self._stop_event.is_set()
+    
+    async def _loop(self, name: str, interval: float, job: Callable[[], Awaitable]):
+        """Run one job on its interval until the scheduler stops."""
+        while not self.stopping:
+            started = time.monotonic()
+            try:
+                await job()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Scheduled job {name} failed: {str(e)}")
+                sentry_sdk.capture_exception(e)
+            
+            elapsed = time.monotonic() - started
+            delay = max(0.0, interval - elapsed)
+            if elapsed > interval:
+                logger.warning(f"Scheduled job {name} took {elapsed:.1f}s, longer than its {interval:.0f}s interval")
+            
+            try:
+                await asyncio.wait_for(self._stop_event.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+    
+    async def run(self):
+        """Run all jobs until ``stop`` is called."""
+        self._stop_event = asyncio.Event()
+        tasks = [
+            asyncio.create_task(self._loop(name, spec['interval'], spec['job']), name=name)
+            for name, spec in self.jobs.items()
+        ]
+        logger.info(f"Scheduler started with jobs: {', '.join(self.jobs)}")
+        
+        try:
+            await self._stop_event.wait()
+            # Let in-flight runs finish so no cycle is left half stored
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            logger.info("Scheduler stopped")
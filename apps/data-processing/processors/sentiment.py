@@ -1,16 +1,186 @@
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+import importlib
+from itertools import chain
+import multiprocessing
+import numbers
+import pickle
+import re
 import numpy as np
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
-import tensorflow as tf
-from transformers import pipeline
+from processors.keyword_matcher import KeywordMatcher
+from processors.sentiment_cache import SentimentCache
 
 logger = logging.getLogger(__name__)
 
+def as_texts(texts: Iterable[Any]) -> List[str]:
+    """Turn a list or pandas Series of texts into a list of strings."""
+    if hasattr(texts, 'tolist'):
+        texts = texts.tolist()
+    return [text if isinstance(text, str) else '' for text in texts]
+
+
+def _label_scores(scores: np.ndarray, upper: float = 0.6, lower: float = 0.4) -> np.ndarray:
+    """Label [0, 1] scores as positive, negative or neutral."""
+    return np.select([scores > upper, scores < lower], ['positive', 'negative'], 'neutral').astype(object)
+
+
+def length_buckets(texts: List[str], batch_size: int) -> Iterable[List[int]]:
+    """
+    Group text indices into batches of similar length.
+    
+    Batching texts of similar length keeps padding, and so wasted model
+    compute, to a minimum.
+    
+    Args:
+        texts: Texts to batch
+        batch_size: Maximum number of texts per batch
+        
+    Returns:
+        Iterable of index lists, shortest texts first
+    """
+    order = sorted(range(len(texts)), key=lambda index: len(texts[index]))
+    for start in range(0, len(order), batch_size):
+        yield order[start:start + batch_size]
+
+
+def prediction_to_result(prediction: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Convert a binary classifier prediction into a sentiment result.
+    
+    Args:
+        prediction: Label and score predicted by the classifier
+        
+    Returns:
+        Dictionary containing sentiment scores
+    """
+    # Convert label to score (0-1)
+    score = prediction['score']
+    if prediction['label'].lower() == 'negative':
+        score = 1 - score
+        
+    return {
+        'score': score,
+        'label': 'positive' if score > 0.5 else 'negative',
+        'raw_scores': prediction
+    }
+
+
+class SentimentBatch:
+    """
+    Columnar sentiment results for a batch of texts.
+    
+    Scores and labels are NumPy arrays aligned with the input texts, and the
+    backend's raw scores are kept as one array per field. The per-text
+    dictionaries returned by ``analyze`` are available as a view through
+    indexing or ``to_dicts``.
+    """
+    
+    def __init__(self, scores: np.ndarray, labels: np.ndarray, raw_scores: Optional[Dict[str, np.ndarray]] = None):
+        """
+        Initialize the batch.
+        
+        Args:
+            scores: Sentiment scores in [0, 1]
+            labels: Sentiment labels
+            raw_scores: Backend scores, one array per field
+        """
+        self.scores = np.asarray(scores, dtype=float)
+        self.labels = np.asarray(labels, dtype=object)
+        self.raw_scores = raw_scores or {}
+        
+    @classmethod
+    def from_dicts(cls, results: List[Dict[str, Any]]) -> 'SentimentBatch':
+        """
+        Build a batch from per-text results.
+        
+        Args:
+            results: Results as returned by ``analyze``
+            
+        Returns:
+            Sentiment batch
+        """
+        fields = results[0]['raw_scores'].keys() if results else []
+        return cls(
+            scores=np.array([result['score'] for result in results], dtype=float),
+            labels=np.array([result['label'] for result in results], dtype=object),
+            raw_scores={
+                field: np.array([result['raw_scores'][field] for result in results])
+                for field in fields
+            }
+        )
+        
+    @classmethod
+    def concat(cls, batches: List['SentimentBatch']) -> 'SentimentBatch':
+        """
+        Join batches into one, keeping their order.
+        
+        Args:
+            batches: Batches to join
+            
+        Returns:
+            Sentiment batch
+        """
+        batches = [batch for batch in batches if len(batch)]
+        if not batches:
+            return cls(np.empty(0), np.empty(0, dtype=object))
+        return cls(
+            scores=np.concatenate([batch.scores for batch in batches]),
+            labels=np.concatenate([batch.labels for batch in batches]),
+            raw_scores={
+                field: np.concatenate([batch.raw_scores[field] for batch in batches])
+                for field in batches[0].raw_scores
+            }
+        )
+        
+    def __len__(self) -> int:
+        return len(self.scores)
+        
+    def __getitem__(self, index: int) -> Dict[str, Any]:
+        return {
+            'score': self.scores[index].item(),
+            'label': self.labels[index],
+            'raw_scores': {field: values[index].item() for field, values in self.raw_scores.items()}
+        }
+        
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """
+        Get the results as one dictionary per text.
+        
+        Returns:
+            List of sentiment analysis results, as returned by ``analyze``
+        """
+        scores = self.scores.tolist()
+        labels = self.labels.tolist()
+        raw = {field: values.tolist() for field, values in self.raw_scores.items()}
+        return [
+            {
+                'score': scores[index],
+                'label': labels[index],
+                'raw_scores': {field: values[index] for field, values in raw.items()}
+            }
+            for index in range(len(scores))
+        ]
+
+
 class SentimentAnalyzer(ABC):
     """Base class for sentiment analyzers."""
     
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> 'SentimentAnalyzer':
+        """
+        Create the analyzer from the sentiment configuration.
+        
+        Args:
+            config: Configuration dictionary containing sentiment settings
+            
+        Returns:
+            Sentiment analyzer
+        """
+        return cls()
+    
     @abstractmethod
     def analyze(self, text: str) -> Dict[str, Any]:
         """
@@ -23,6 +193,24 @@ class SentimentAnalyzer(ABC):
             Dictionary containing sentiment analysis results
         """
         pass
+    
+    def analyze_batch(self, texts: Iterable[str]) -> SentimentBatch:
+        """
+        Analyze sentiment of several texts.
+        
+        Backends with a faster batched path override this.
+        
+        Args:
+            texts: List or pandas Series of texts to analyze
+            
+        Returns:
+            Columnar results, in the order of the texts
+        """
+        return SentimentBatch.from_dicts([self.analyze(text) for text in as_texts(texts)])
+    
+    def close(self):
+        """Release resources held by the analyzer."""
+        pass
 
 class VaderSentimentAnalyzer(SentimentAnalyzer):
     """VADER sentiment analyzer."""
@@ -41,36 +229,66 @@ class VaderSentimentAnalyzer(SentimentAnalyzer):
         Returns:
             Dictionary containing sentiment scores
         """
-        scores = self.analyzer.polarity_scores(text)
+        return self.analyze_batch([text])[0]
         
-        # Convert compound score to [0, 1] range
-        normalized_score = (scores['compound'] + 1) / 2
+    def analyze_batch(self, texts: Iterable[str]) -> SentimentBatch:
+        """
+        Analyze sentiment of several texts using VADER.
         
-        # Determine sentiment label
-        if normalized_score > 0.6:
-            label = 'positive'
-        elif normalized_score < 0.4:
-            label = 'negative'
-        else:
-            label = 'neutral'
+        VADER's lexicon scoring runs per text; normalization and labelling
+        run on the whole batch.
+        
+        Args:
+            texts: List or pandas Series of texts to analyze
             
-        return {
-            'score': normalized_score,
-            'label': label,
-            'raw_scores': scores
-        }
+        Returns:
+            Columnar results, in the order of the texts
+        """
+        fields = ('neg', 'neu', 'pos', 'compound')
+        polarity = np.array(
+            [[scores[field] for field in fields]
+             for scores in map(self.analyzer.polarity_scores, as_texts(texts))],
+            dtype=float
+        ).reshape(-1, len(fields))
+        
+        # Convert compound score to [0, 1] range
+        normalized_scores = (polarity[:, 3] + 1) / 2
+        
+        return SentimentBatch(
+            scores=normalized_scores,
+            labels=_label_scores(normalized_scores),
+            raw_scores={field: polarity[:, index] for index, field in enumerate(fields)}
+        )
 
 class TensorFlowSentimentAnalyzer(SentimentAnalyzer):
     """TensorFlow-based sentiment analyzer using pre-trained model."""
     
-    def __init__(self, model_name: str = "distilbert-base-uncased-finetuned-sst-2-english"):
+    def __init__(self,
+                 model_name: str = "distilbert-base-uncased-finetuned-sst-2-english",
+                 batch_size: int = 32,
+                 max_length: int = 128):
         """
         Initialize TensorFlow sentiment analyzer.
         
         Args:
             model_name: Name of pre-trained model to use
+            batch_size: Number of texts per forward pass
+            max_length: Maximum number of tokens per text, longer texts are truncated
         """
+        # Imported here so other backends never load the ML frameworks
+        from transformers import pipeline
+        
         self.classifier = pipeline("sentiment-analysis", model=model_name)
+        self.batch_size = batch_size
+        self.max_length = max_length
+        
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> 'TensorFlowSentimentAnalyzer':
+        return cls(
+            model_name=config.get('model_name', "distilbert-base-uncased-finetuned-sst-2-english"),
+            batch_size=config.get('batch_size', 32),
+            max_length=config.get('max_length', 128)
+        )
         
     def analyze(self, text: str) -> Dict[str, Any]:
         """
@@ -82,18 +300,182 @@ class TensorFlowSentimentAnalyzer(SentimentAnalyzer):
         Returns:
             Dictionary containing sentiment scores
         """
-        result = self.classifier(text)[0]
+        return self.analyze_batch([text])[0]
+        
+    def analyze_batch(self, texts: Iterable[str]) -> SentimentBatch:
+        """
+        Analyze sentiment of several texts with batched forward passes.
         
-        # Convert label to score (0-1)
-        score = result['score']
-        if result['label'].lower() == 'negative':
-            score = 1 - score
+        Texts are sorted by length before batching so each batch is padded
+        to similar lengths, then the results are put back in input order.
+        
+        Args:
+            texts: List or pandas Series of texts to analyze
             
-        return {
-            'score': score,
-            'label': 'positive' if score > 0.5 else 'negative',
-            'raw_scores': result
-        }
+        Returns:
+            Columnar results, in the order of the texts
+        """
+        texts = as_texts(texts)
+        results: List[Optional[Dict[str, Any]]] = [None] * len(texts)
+        
+        for bucket in length_buckets(texts, self.batch_size):
+            predictions = self.classifier(
+                [texts[index] for index in bucket],
+                batch_size=len(bucket),
+                truncation=True,
+                max_length=self.max_length
+            )
+            for index, prediction in zip(bucket, predictions):
+                results[index] = prediction_to_result(prediction)
+                
+        return SentimentBatch.from_dicts(results)
+
+class LSTMSentimentAnalyzer(SentimentAnalyzer):
+    """
+    Sentiment from the BiLSTM trained by ``models/sentiment/tf_sentiment.py``.
+    
+    Texts get the same cleanup as the training corpus, then vectorization and
+    the model run together in one compiled function. Its input signature takes
+    a batch of strings of any size, so it is traced once and reused.
+    """
+    
+    # Cleanup applied to the training corpus in models/sentiment/tf_sentiment.py,
+    # in the same order: these patterns, lower-casing, emoji names, whitespace,
+    # then the word patterns, tokenizing and stop-word removal. The retweet
+    # pattern runs on lower-cased text there as well, so it is kept as is.
+    CLEANUP = [
+        (re.compile(r'http\S+|www\S+|https\S+'), ''),
+        (re.compile(r'@\w+'), ''),
+        (re.compile(r'#'), '')
+    ]
+    EMOJI_NAMES = re.compile(r':[a-z_]+:')
+    WORD_CLEANUP = [
+        (re.compile(r'^RT\s+'), ''),
+        (re.compile(r'(.)\1+'), r'\1\1'),
+        (re.compile(r'\d+'), ''),
+        (re.compile(r'[^\w\s]'), '')
+    ]
+    
+    # Training kept at most this many words per tweet
+    MAX_WORDS = 512
+    
+    # Files written by models/sentiment/tf_sentiment.py
+    MODEL_PATH = "models/sentiment/sentiment_lstm_model.h5"
+    VECTORIZER_PATH = "data/text_vectorizer.pkl"
+    
+    def __init__(self,
+                 model_path: str = MODEL_PATH,
+                 vectorizer_path: str = VECTORIZER_PATH,
+                 batch_size: int = 256):
+        """
+        Initialize the LSTM sentiment analyzer.
+        
+        Args:
+            model_path: Saved Keras model
+            vectorizer_path: Pickled TextVectorization layer fitted with the model
+            batch_size: Number of texts per forward pass
+        """
+        # Imported here so other backends never load the ML frameworks
+        import tensorflow as tf
+        
+        self.load_cleanup()
+        self.tf = tf
+        self.model = tf.keras.models.load_model(model_path, compile=False)
+        with open(vectorizer_path, 'rb') as f:
+            self.vectorizer = pickle.load(f)
+        self.batch_size = batch_size
+        
+        self._predict = tf.function(
+            self._forward,
+            input_signature=[tf.TensorSpec(shape=[None], dtype=tf.string)]
+        )
+        
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> 'LSTMSentimentAnalyzer':
+        return cls(
+            model_path=config.get('lstm_model_path', cls.MODEL_PATH),
+            vectorizer_path=config.get('lstm_vectorizer_path', cls.VECTORIZER_PATH),
+            batch_size=config.get('lstm_batch_size', 256)
+        )
+        
+    def _forward(self, texts):
+        """Vectorize a batch of strings and return the positive probabilities."""
+        tokens = self.vectorizer(texts)
+        return self.tf.reshape(self.model(tokens, training=False), [-1])
+        
+    def load_cleanup(self):
+        """
+        Load the emoji names, tokenizer and stop-words the training corpus was cleaned with.
+        
+        Raises:
+            LookupError: If the NLTK stopwords or punkt data are not downloaded
+        """
+        # Imported here as only the lstm backend needs them
+        import emoji
+        from nltk.corpus import stopwords
+        from nltk.tokenize import word_tokenize
+        
+        self.demojize = emoji.demojize
+        self.tokenize = word_tokenize
+        self.stop_words = frozenset(stopwords.words('english'))
+        
+    def clean(self, text: str) -> str:
+        """
+        Clean a text the way the training corpus was cleaned.
+        
+        Args:
+            text: Raw text
+            
+        Returns:
+            Cleaned text
+        """
+        for pattern, replacement in self.CLEANUP:
+            text = pattern.sub(replacement, text)
+        text = self.EMOJI_NAMES.sub('', self.demojize(text.lower()))
+        text = ' '.join(text.split())
+        for pattern, replacement in self.WORD_CLEANUP:
+            text = pattern.sub(replacement, text)
+            
+        words = [
+            word.lower() for word in self.tokenize(text)
+            if word.isalpha() and word not in self.stop_words
+        ]
+        return ' '.join(words[:self.MAX_WORDS])
+        
+    def analyze(self, text: str) -> Dict[str, Any]:
+        """
+        Analyze sentiment using the LSTM model.
+        
+        Args:
+            text: Text to analyze
+            
+        Returns:
+            Dictionary containing sentiment scores
+        """
+        return self.analyze_batch([text])[0]
+        
+    def analyze_batch(self, texts: Iterable[str]) -> SentimentBatch:
+        """
+        Analyze sentiment of several texts with batched forward passes.
+        
+        Args:
+            texts: List or pandas Series of texts to analyze
+            
+        Returns:
+            Columnar results, in the order of the texts
+        """
+        texts = [self.clean(text) for text in as_texts(texts)]
+        probabilities = [
+            self._predict(self.tf.constant(texts[start:start + self.batch_size])).numpy()
+            for start in range(0, len(texts), self.batch_size)
+        ]
+        scores = np.concatenate(probabilities).astype(float) if probabilities else np.zeros(0)
+        
+        return SentimentBatch(
+            scores=scores,
+            labels=np.where(scores > 0.5, 'positive', 'negative').astype(object),
+            raw_scores={'probability': scores}
+        )
 
 class KeywordSentimentAnalyzer(SentimentAnalyzer):
     """Keyword-based sentiment analyzer."""
@@ -113,6 +495,16 @@ class KeywordSentimentAnalyzer(SentimentAnalyzer):
             'crash': 0.8, 'scam': 0.8
         }
         
+        # Precompiled keyword -> weight lookup
+        self.matcher = KeywordMatcher({
+            'positive': self.positive_keywords,
+            'negative': self.negative_keywords
+        })
+        keywords = list(self.matcher.keyword_groups)
+        self.token_ids = {keyword: index for index, keyword in enumerate(keywords)}
+        self.positive_weights = np.array([self.positive_keywords.get(keyword, 0.0) for keyword in keywords])
+        self.negative_weights = np.array([self.negative_keywords.get(keyword, 0.0) for keyword in keywords])
+        
     def analyze(self, text: str) -> Dict[str, Any]:
         """
         Analyze sentiment using keyword matching.
@@ -123,59 +515,284 @@ class KeywordSentimentAnalyzer(SentimentAnalyzer):
         Returns:
             Dictionary containing sentiment scores
         """
-        text = text.lower()
-        words = text.split()
+        return self.analyze_batch([text])[0]
+        
+    def analyze_batch(self, texts: Iterable[str]) -> SentimentBatch:
+        """
+        Analyze sentiment of several texts using keyword matching.
+        
+        Keywords are found with one scan per text, mapped to keyword ids and
+        their weights summed per text with ``np.bincount``.
+        
+        Args:
+            texts: List or pandas Series of texts to analyze
+            
+        Returns:
+            Columnar results, in the order of the texts
+        """
+        found = self.matcher.find_many(as_texts(texts))
+        count = len(found)
+        lengths = np.fromiter(map(len, found), dtype=np.intp, count=count)
+        flat_keywords = list(chain.from_iterable(found))
+        ids = np.fromiter(
+            (self.token_ids[keyword] for keyword in flat_keywords),
+            dtype=np.intp,
+            count=len(flat_keywords)
+        )
+        owners = np.repeat(np.arange(count), lengths)
         
         # Calculate positive and negative scores
-        pos_score = sum(self.positive_keywords[word] for word in words if word in self.positive_keywords)
-        neg_score = sum(self.negative_keywords[word] for word in words if word in self.negative_keywords)
+        pos_scores = np.bincount(owners, weights=self.positive_weights[ids], minlength=count)
+        neg_scores = np.bincount(owners, weights=self.negative_weights[ids], minlength=count)
         
-        # Normalize scores
-        total = pos_score + neg_score
-        if total > 0:
-            score = pos_score / total
-        else:
-            score = 0.5  # Neutral if no keywords found
+        # Normalize scores, neutral if no keywords found
+        totals = pos_scores + neg_scores
+        scores = np.full(count, 0.5)
+        np.divide(pos_scores, totals, out=scores, where=totals > 0)
+        
+        return SentimentBatch(
+            scores=scores,
+            labels=_label_scores(scores),
+            raw_scores={
+                'positive_score': pos_scores,
+                'negative_score': neg_scores
+            }
+        )
+
+class CachedSentimentAnalyzer(SentimentAnalyzer):
+    """Serves repeated texts from a sentiment cache instead of the model."""
+    
+    def __init__(self, analyzer: SentimentAnalyzer, cache: SentimentCache):
+        """
+        Initialize the cached analyzer.
+        
+        Args:
+            analyzer: Backend analyzer scoring unseen texts
+            cache: Cache of previously scored texts
+        """
+        self.analyzer = analyzer
+        self.cache = cache
+        
+    def analyze(self, text: str) -> Dict[str, Any]:
+        """
+        Analyze sentiment, using the cache when the text was seen before.
+        
+        Args:
+            text: Text to analyze
             
-        # Determine label
-        if score > 0.6:
-            label = 'positive'
-        elif score < 0.4:
-            label = 'negative'
-        else:
-            label = 'neutral'
+        Returns:
+            Dictionary containing sentiment scores
+        """
+        return self.analyze_batch([text])[0]
+        
+    def analyze_batch(self, texts: Iterable[str]) -> SentimentBatch:
+        """
+        Analyze sentiment of several texts, scoring each distinct unseen text once.
+        
+        Args:
+            texts: List or pandas Series of texts to analyze
             
-        return {
-            'score': score,
-            'label': label,
-            'raw_scores': {
-                'positive_score': pos_score,
-                'negative_score': neg_score
-            }
-        }
+        Returns:
+            Columnar results, in the order of the texts
+        """
+        texts = as_texts(texts)
+        keys = [self.cache.make_key(text) for text in texts]
+        
+        # First text of every distinct key
+        unique = {}
+        for key, text in zip(keys, texts):
+            unique.setdefault(key, text)
+        found = self.cache.get_many(list(unique))
+        
+        missing = [key for key in unique if key not in found]
+        if missing:
+            scored = self.analyzer.analyze_batch([unique[key] for key in missing]).to_dicts()
+            computed = dict(zip(missing, scored))
+            self.cache.set_many(computed)
+            found.update(computed)
+            
+        logger.debug(f"Sentiment cache: {len(texts) - len(missing)}/{len(texts)} texts served without the model")
+        return SentimentBatch.from_dicts([found[key] for key in keys])
+        
+    def close(self):
+        """Release resources held by the backend analyzer."""
+        self.analyzer.close()
+
+# Analyzer class of every backend as "module:class", imported only when the
+# backend is selected so heavy frameworks load on demand
+SENTIMENT_BACKENDS: Dict[str, str] = {
+    'vader': 'processors.sentiment:VaderSentimentAnalyzer',
+    'tensorflow': 'processors.sentiment:TensorFlowSentimentAnalyzer',
+    'keyword': 'processors.sentiment:KeywordSentimentAnalyzer',
+    'lstm': 'processors.sentiment:LSTMSentimentAnalyzer',
+    'onnx': 'processors.sentiment_onnx:OnnxSentimentAnalyzer'
+}
+
+def register_backend(name: str, path: str):
+    """
+    Register a sentiment backend.
+    
+    Args:
+        name: Backend name used in the ``sentiment.backend`` setting
+        path: Analyzer class as "module:class"
+    """
+    SENTIMENT_BACKENDS[name] = path
+
+def create_analyzer(config: Dict[str, Any]) -> SentimentAnalyzer:
+    """
+    Create the backend analyzer selected in the sentiment configuration.
+    
+    Unknown backends fall back to keyword matching.
+    
+    Args:
+        config: Configuration dictionary containing sentiment settings
+        
+    Returns:
+        Sentiment analyzer
+    """
+    backend = config['backend']
+    if backend not in SENTIMENT_BACKENDS:
+        logger.warning(f"Unknown sentiment backend {backend}, using keyword matching")
+        backend = 'keyword'
+        
+    module_name, class_name = SENTIMENT_BACKENDS[backend].split(':')
+    analyzer_class = getattr(importlib.import_module(module_name), class_name)
+    return analyzer_class.from_config(config)
+
+# Backend loaded once by every process pool worker
+_worker_analyzer: Optional[SentimentAnalyzer] = None
+
+def _init_worker(config: Dict[str, Any]):
+    """Load the configured backend in a pool worker."""
+    global _worker_analyzer
+    _worker_analyzer = create_analyzer(config)
+
+def _analyze_shard(texts: List[str]) -> SentimentBatch:
+    """Score one shard of texts in a pool worker."""
+    return _worker_analyzer.analyze_batch(texts)
+
+class ParallelSentimentAnalyzer(SentimentAnalyzer):
+    """
+    Shards sentiment scoring across a process pool.
+    
+    VADER and keyword scoring are pure Python and hold the GIL, so threads
+    do not help; each worker process loads the backend once and scores
+    contiguous shards of the input, which are joined back in order.
+    """
+    
+    def __init__(self, config: Dict[str, Any], workers: int):
+        """
+        Initialize the parallel analyzer.
+        
+        Args:
+            config: Configuration dictionary containing sentiment settings
+            workers: Number of worker processes
+        """
+        self.workers = workers
+        self.min_shard_size = config.get('min_shard_size', 256)
+        self.executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context(config.get('start_method', 'spawn')),
+            initializer=_init_worker,
+            initargs=(config,)
+        )
+        
+    def analyze(self, text: str) -> Dict[str, Any]:
+        """
+        Analyze sentiment of a single text in a worker.
+        
+        Args:
+            text: Text to analyze
+            
+        Returns:
+            Dictionary containing sentiment scores
+        """
+        return self.analyze_batch([text])[0]
+        
+    def analyze_batch(self, texts: Iterable[str]) -> SentimentBatch:
+        """
+        Analyze sentiment of several texts across the worker processes.
+        
+        Args:
+            texts: List or pandas Series of texts to analyze
+            
+        Returns:
+            Columnar results, in the order of the texts
+        """
+        texts = as_texts(texts)
+        if not texts:
+            return SentimentBatch.concat([])
+            
+        shards = min(self.workers, -(-len(texts) // self.min_shard_size))
+        size = -(-len(texts) // shards)
+        batches = self.executor.map(
+            _analyze_shard,
+            [texts[start:start + size] for start in range(0, len(texts), size)]
+        )
+        return SentimentBatch.concat(list(batches))
+        
+    def close(self):
+        """Shut down the worker processes."""
+        self.executor.shutdown(wait=True, cancel_futures=True)
+
+
+def cache_namespace(config: Dict[str, Any]) -> str:
+    """
+    Name the cached scores of the configured model.
+    
+    Scores cached for another backend, model version or model files are
+    never served, so switching models does not return stale scores.
+    
+    Args:
+        config: Configuration dictionary containing sentiment settings
+        
+    Returns:
+        Cache namespace
+    """
+    backend = config['backend']
+    namespace = f"{backend}:{config.get('model_version', 'v1')}"
+    if backend in ('tensorflow', 'onnx'):
+        namespace += f":{config.get('model_name', 'default')}"
+    elif backend == 'lstm':
+        namespace += (
+            f":{config.get('lstm_model_path', LSTMSentimentAnalyzer.MODEL_PATH)}"
+            f":{config.get('lstm_vectorizer_path', LSTMSentimentAnalyzer.VECTORIZER_PATH)}"
+        )
+    return namespace
 
 class CompositeSentimentAnalyzer:
     """Combines multiple sentiment analyzers with weighted voting."""
     
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self, config: Dict[str, Any], storage: Any = None):
         """
         Initialize composite sentiment analyzer.
         
         Args:
             config: Configuration dictionary containing sentiment settings
+            storage: Optional connected ``Storage`` backing the sentiment cache
         """
         self.config = config
         self.backend = config['backend']
         self.weights = config['weights']
         self.thresholds = config['thresholds']
         
-        # Initialize backend analyzer
-        if self.backend == 'vader':
-            self.analyzer = VaderSentimentAnalyzer()
-        elif self.backend == 'tensorflow':
-            self.analyzer = TensorFlowSentimentAnalyzer()
+        # Initialize backend analyzer, sharded across processes if configured
+        workers = config.get('workers', 1)
+        if workers > 1:
+            self.analyzer = ParallelSentimentAnalyzer(config, workers)
         else:
-            self.analyzer = KeywordSentimentAnalyzer()
+            self.analyzer = create_analyzer(config)
+            
+        # Memoize scores of repeated texts such as reposts and shills
+        cache_config = config.get('cache', {})
+        if cache_config.get('enabled', True):
+            self.analyzer = CachedSentimentAnalyzer(self.analyzer, SentimentCache(
+                namespace=cache_namespace(config),
+                max_entries=cache_config.get('max_entries', 100000),
+                storage=storage if cache_config.get('backend', 'memory') == 'redis' else None,
+                ttl=cache_config.get('ttl'),
+                key_prefix=cache_config.get('key_prefix', 'sentiment')
+            ))
             
     def analyze_tweet(self, tweet: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -188,58 +805,85 @@ class CompositeSentimentAnalyzer:
             Dictionary containing sentiment analysis results
         """
         # Analyze text sentiment
-        text_sentiment = self.analyzer.analyze(tweet['text'])
-        text_score = text_sentiment['score']
+        text_sentiments = self.analyzer.analyze_batch([tweet['text']])
+        return self._combine_batch([tweet], text_sentiments.scores)[0]
+        
+    def _combine_batch(self, tweets: List[Dict[str, Any]], text_scores: np.ndarray) -> List[Dict[str, Any]]:
+        """
+        Weigh the text sentiment of tweets with their engagement metrics.
+        
+        Args:
+            tweets: Tweet dictionaries containing metrics
+            text_scores: Sentiment scores of the tweet texts
+            
+        Returns:
+            List of sentiment analysis results
+        """
+        metrics = np.array(
+            [[tweet['likes'], tweet['retweets'], tweet['comments']] for tweet in tweets],
+            dtype=float
+        ).reshape(-1, 3)
         
         # Calculate metric-based scores
-        likes_score = min(tweet['likes'] / 1000, 1.0)  # Normalize to [0, 1]
-        retweets_score = min(tweet['retweets'] / 500, 1.0)
-        comments_score = min(tweet['comments'] / 200, 1.0)
+        likes_scores = np.minimum(metrics[:, 0] / 1000, 1.0)  # Normalize to [0, 1]
+        retweets_scores = np.minimum(metrics[:, 1] / 500, 1.0)
+        comments_scores = np.minimum(metrics[:, 2] / 200, 1.0)
         
         # Calculate weighted average
-        weighted_score = (
-            self.weights['text'] * text_score +
-            self.weights['likes'] * likes_score +
-            self.weights['retweets'] * retweets_score +
-            self.weights['comments'] * comments_score
+        weighted_scores = (
+            self.weights['text'] * text_scores +
+            self.weights['likes'] * likes_scores +
+            self.weights['retweets'] * retweets_scores +
+            self.weights['comments'] * comments_scores
         )
         
         # Determine sentiment category
-        if weighted_score >= self.thresholds['strong_positive']:
-            category = 'strong_positive'
-        elif weighted_score >= self.thresholds['positive']:
-            category = 'positive'
-        elif weighted_score >= self.thresholds['neutral']:
-            category = 'neutral'
-        elif weighted_score >= self.thresholds['negative']:
-            category = 'negative'
-        else:
-            category = 'strong_negative'
-            
-        return {
-            'score': weighted_score,
-            'category': category,
-            'components': {
-                'text': {
-                    'score': text_score,
-                    'weight': self.weights['text']
-                },
-                'metrics': {
-                    'likes': {
-                        'score': likes_score,
-                        'weight': self.weights['likes']
-                    },
-                    'retweets': {
-                        'score': retweets_score,
-                        'weight': self.weights['retweets']
+        categories = np.select(
+            [
+                weighted_scores >= self.thresholds['strong_positive'],
+                weighted_scores >= self.thresholds['positive'],
+                weighted_scores >= self.thresholds['neutral'],
+                weighted_scores >= self.thresholds['negative']
+            ],
+            ['strong_positive', 'positive', 'neutral', 'negative'],
+            'strong_negative'
+        ).tolist()
+        
+        columns = zip(
+            weighted_scores.tolist(),
+            categories,
+            np.asarray(text_scores, dtype=float).tolist(),
+            likes_scores.tolist(),
+            retweets_scores.tolist(),
+            comments_scores.tolist()
+        )
+        return [
+            {
+                'score': weighted_score,
+                'category': category,
+                'components': {
+                    'text': {
+                        'score': text_score,
+                        'weight': self.weights['text']
                     },
-                    'comments': {
-                        'score': comments_score,
-                        'weight': self.weights['comments']
+                    'metrics': {
+                        'likes': {
+                            'score': likes_score,
+                            'weight': self.weights['likes']
+                        },
+                        'retweets': {
+                            'score': retweets_score,
+                            'weight': self.weights['retweets']
+                        },
+                        'comments': {
+                            'score': comments_score,
+                            'weight': self.weights['comments']
+                        }
                     }
                 }
             }
-        }
+            for weighted_score, category, text_score, likes_score, retweets_score, comments_score in columns
+        ]
         
     def analyze_tweets(self, tweets: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
@@ -251,16 +895,39 @@ class CompositeSentimentAnalyzer:
         Returns:
             List of sentiment analysis results
         """
-        results = []
+        scorable = []
         for tweet in tweets:
-            try:
-                sentiment = self.analyze_tweet(tweet)
-                results.append({
-                    'tweet_id': tweet['id'],
-                    'sentiment': sentiment
-                })
-            except Exception as e:
-                logger.error(f"Error analyzing tweet {tweet.get('id', 'unknown')}: {str(e)}")
+            if isinstance(tweet.get('text'), str) and all(
+                isinstance(tweet.get(field), numbers.Real) for field in ('likes', 'retweets', 'comments')
+            ):
+                scorable.append(tweet)
+            else:
+                logger.error(f"Error analyzing tweet {tweet.get('id', 'unknown')}: missing text or metrics")
                 
+        # Score all texts at once, falling back to one at a time so a single
+        # bad text only loses its own tweet
+        try:
+            text_sentiments = self.analyzer.analyze_batch([tweet['text'] for tweet in scorable])
+            sentiments = self._combine_batch(scorable, text_sentiments.scores)
+            results = [
+                {'tweet_id': tweet['id'], 'sentiment': sentiment}
+                for tweet, sentiment in zip(scorable, sentiments)
+            ]
+        except Exception as e:
+            logger.error(f"Error analyzing tweet batch, retrying one by one: {str(e)}")
+            results = []
+            for tweet in scorable:
+                try:
+                    results.append({
+                        'tweet_id': tweet['id'],
+                        'sentiment': self.analyze_tweet(tweet)
+                    })
+                except Exception as e:
+                    logger.error(f"Error analyzing tweet {tweet.get('id', 'unknown')}: {str(e)}")
+                    
         logger.info(f"Analyzed sentiment for {len(results)} tweets")
-        return results 
\ No newline at end of file
+        return results
+        
+    def close(self):
+        """Release the backend analyzer, e.g. its worker processes."""
+        self.analyzer.close()
\ No newline at end of file
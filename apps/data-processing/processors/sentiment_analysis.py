@@ -6,13 +6,15 @@ import json
 import time
 import random 
 import os
-import re
+import threading
 from typing import Tuple, Dict, Any, List
 import requests
+import numpy as np
 import pandas as pd
-from collections import Counter
 from datetime import datetime
 from flask import Flask, request, jsonify
+from processors.keyword_matcher import KeywordMatcher
+from processors.micro_batcher import MicroBatcher, load_serving_config
 
 
 # Twitter API Configuration
@@ -73,6 +75,13 @@ class CryptoSentimentAnalyzer:
             # Regulatory
             "ban", "banned", "regulation", "regulate", "sec", "lawsuit", "illegal", "risky", "risk"
         }
+        
+        # Polarity of every keyword, the shared matcher serves single tweets and columns
+        self.keyword_polarity = {
+            **{keyword: "negative" for keyword in self.negative_keywords},
+            **{keyword: "positive" for keyword in self.positive_keywords}
+        }
+        self.matcher = KeywordMatcher({'keywords': self.keyword_polarity})
     
     def analyze_tweet(self, tweet_text: str) -> Dict[str, Any]:
         """
@@ -84,46 +93,82 @@ class CryptoSentimentAnalyzer:
         Returns:
             dict: A dictionary containing sentiment analysis results
         """
-        # Clean and tokenize text
-        tweet_text = tweet_text.lower()
-        # Split on word boundaries to properly identify words
-        words = re.findall(r'\b\w+\b', tweet_text)
+        return self.analyze_tweets([tweet_text])[0]
+    
+    def analyze_tweets(self, tweet_texts: List[str]) -> List[Dict[str, Any]]:
+        """
+        Analyzes the sentiment of several tweets in one columnar pass.
         
-        # Use Counter for efficient word counting
-        word_counts = Counter(words)
+        Args:
+            tweet_texts (list): Texts of the tweets to analyze
         
-        # Count keyword matches - faster with dictionary comprehensions
-        positive_matches = {word: count for word, count in word_counts.items() if word in self.positive_keywords}
-        negative_matches = {word: count for word, count in word_counts.items() if word in self.negative_keywords}
+        Returns:
+            list: Analysis results in the order of the texts
+        """
+        if not tweet_texts:
+            return []
         
-        positive_count = sum(positive_matches.values())
-        negative_count = sum(negative_matches.values())
+        hits, positive_count, negative_count, scores = self._score_texts(pd.Series(tweet_texts, dtype=object))
+        sentiments = np.select([scores > 0.1, scores < -0.1], ['positive', 'negative'], 'neutral')
         
-        # Calculate sentiment score (-1.0 to 1.0)
-        total_count = positive_count + negative_count
-        if total_count == 0:
-            score = 0.0
-        else:
-            score = (positive_count - negative_count) / total_count
-        
-        # Determine sentiment category with thresholds
-        if score > 0.1:
-            sentiment = "positive"
-        elif score < -0.1:
-            sentiment = "negative"
-        else:
-            sentiment = "neutral"
+        # Occurrences of every keyword per tweet, in order of appearance
+        matches = [{"positive": {}, "negative": {}} for _ in tweet_texts]
+        occurrences = hits.groupby(['row', 'polarity', 'word'], sort=False).size()
+        for (row, polarity, word), occurrence_count in occurrences.items():
+            matches[row][polarity][word] = int(occurrence_count)
         
-        return {
-            "sentiment": sentiment,
-            "score": round(score, 2),
-            "keywords_found": {
-                "positive": positive_count,
-                "negative": negative_count,
-                "positive_matches": dict(positive_matches),
-                "negative_matches": dict(negative_matches)
+        return [
+            {
+                "sentiment": sentiment,
+                "score": score,
+                "keywords_found": {
+                    "positive": positive,
+                    "negative": negative,
+                    "positive_matches": found["positive"],
+                    "negative_matches": found["negative"]
+                }
             }
-        }
+            for sentiment, score, positive, negative, found in zip(
+                sentiments.tolist(), scores.round(2).tolist(),
+                positive_count.tolist(), negative_count.tolist(), matches
+            )
+        ]
+    
+    def _score_texts(self, texts: pd.Series) -> Tuple[pd.DataFrame, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Find the keywords of a column of texts and score every text.
+        
+        Args:
+            texts (pd.Series): Texts with a 0..n-1 index, missing texts count as empty
+        
+        Returns:
+            tuple: Keyword hits (row, word, polarity) sorted by text, positive
+                counts, negative counts and scores from -1.0 to 1.0
+        """
+        count = len(texts)
+        
+        # Table of every keyword occurrence: one row per (tweet, keyword)
+        found = self.matcher.find_many(texts.fillna('').astype(str).tolist())
+        words = pd.Series(found, index=texts.index, dtype=object).explode().dropna()
+        polarity = words.map(self.keyword_polarity)
+        hits = pd.DataFrame({
+            'row': words.index,
+            'word': words.values,
+            'polarity': polarity.values
+        }).dropna(subset=['polarity'])
+        
+        # Keyword counts per tweet and polarity
+        counts = (hits.groupby(['row', 'polarity']).size()
+                  .unstack(fill_value=0)
+                  .reindex(index=range(count), columns=['positive', 'negative'], fill_value=0))
+        positive_count = counts['positive'].to_numpy()
+        negative_count = counts['negative'].to_numpy()
+        
+        # Calculate sentiment score (-1.0 to 1.0) for all tweets at once
+        total_count = positive_count + negative_count
+        scores = np.zeros(count)
+        np.divide(positive_count - negative_count, total_count, out=scores, where=total_count > 0)
+        return hits, positive_count, negative_count, scores
     
     def analyze_dataframe(self, tweets_df: pd.DataFrame, users_df: pd.DataFrame = None) -> pd.DataFrame:
         """
@@ -132,7 +177,7 @@ class CryptoSentimentAnalyzer:
         Args:
             tweets_df (pd.DataFrame): DataFrame containing tweets with 'text' column
             users_df (pd.DataFrame, optional): DataFrame containing user data
-            
+        
         Returns:
             pd.DataFrame: Original DataFrame with added sentiment columns
         """
@@ -140,25 +185,24 @@ class CryptoSentimentAnalyzer:
             return pd.DataFrame()
         
         # Create a copy to avoid modifying the original
-        results_df = tweets_df.copy()
-        
-        # Apply sentiment analysis to each tweet
-        sentiment_results = []
-        for _, row in results_df.iterrows():
-            analysis = self.analyze_tweet(row['text'])
-            sentiment_results.append({
-                'sentiment': analysis['sentiment'],
-                'score': analysis['score'],
-                'positive_count': analysis['keywords_found']['positive'],
-                'negative_count': analysis['keywords_found']['negative'],
-                'positive_keywords': list(analysis['keywords_found']['positive_matches'].keys()),
-                'negative_keywords': list(analysis['keywords_found']['negative_matches'].keys())
-            })
-        
-        # Convert results to DataFrame and join with original
-        sentiment_df = pd.DataFrame(sentiment_results)
-        results_df = pd.concat([results_df.reset_index(drop=True), 
-                              sentiment_df.reset_index(drop=True)], axis=1)
+        results_df = tweets_df.reset_index(drop=True)
+        count = len(results_df)
+        hits, positive_count, negative_count, scores = self._score_texts(results_df['text'])
+        
+        results_df['sentiment'] = np.select([scores > 0.1, scores < -0.1], ['positive', 'negative'], 'neutral')
+        results_df['score'] = scores.round(2)
+        results_df['positive_count'] = positive_count
+        results_df['negative_count'] = negative_count
+        
+        # Distinct keywords per tweet in order of appearance, hits are sorted by tweet
+        unique_hits = hits.drop_duplicates(['row', 'word'])
+        for name in ['positive', 'negative']:
+            found = unique_hits[unique_hits['polarity'] == name]
+            rows, starts = np.unique(found['row'].to_numpy(), return_index=True)
+            keyword_lists = [[] for _ in range(count)]
+            for row, keywords in zip(rows.tolist(), np.split(found['word'].to_numpy(), starts[1:])):
+                keyword_lists[row] = keywords.tolist()
+            results_df[f'{name}_keywords'] = keyword_lists
         
         # Join with user data if provided
         if users_df is not None and not users_df.empty:
@@ -170,6 +214,12 @@ class CryptoSentimentAnalyzer:
         
         return results_df
     
+    @staticmethod
+    def _top_keywords(keyword_lists: pd.Series, n: int = 5) -> Dict[str, int]:
+        """Count keywords over a column of keyword lists and return the n most common."""
+        counts = keyword_lists.explode().dropna().value_counts(sort=False)
+        return {keyword: int(count) for keyword, count in counts.sort_values(ascending=False, kind='stable').head(n).items()}
+    
     def generate_sentiment_summary(self, df: pd.DataFrame) -> Dict[str, Any]:
         """
         Generate summary statistics from analyzed tweets.
@@ -193,17 +243,9 @@ class CryptoSentimentAnalyzer:
         
         avg_score = df['score'].mean()
         
-        # Get most common positive and negative keywords
-        all_pos_keywords = []
-        for keywords in df['positive_keywords'].dropna():
-            all_pos_keywords.extend(keywords)
-        
-        all_neg_keywords = []
-        for keywords in df['negative_keywords'].dropna():
-            all_neg_keywords.extend(keywords)
-        
-        top_pos_keywords = dict(Counter(all_pos_keywords).most_common(5))
-        top_neg_keywords = dict(Counter(all_neg_keywords).most_common(5))
+        # Get most common positive and negative keywords, ties in order of appearance
+        top_pos_keywords = self._top_keywords(df['positive_keywords'])
+        top_neg_keywords = self._top_keywords(df['negative_keywords'])
         
         return {
             "total_tweets": total_tweets,
@@ -247,7 +289,7 @@ def connect_to_endpoint(header: dict, parameters: dict, max_retries: int = 5) ->
             retry_after = int(response.headers.get("Retry-After", random.randint(5,60)))
             print(f"Rate limited. Retrying in {retry_after} seconds...")
             time.sleep(retry_after)
-
+        
         elif 400 <= response_status_code < 500:
             raise requests.exceptions.HTTPError(
                 f"Cannot get data, the program will stop!\nHTTP {response_status_code}: {response.text}"
@@ -257,7 +299,7 @@ def connect_to_endpoint(header: dict, parameters: dict, max_retries: int = 5) ->
             print(f"Temporary issue, retrying in {wait_time:.2f} seconds...\nHTTP {response_status_code}: {response.text}")
             time.sleep(wait_time)
         attempt += 1
-
+    
     raise requests.exceptions.RetryError("Max retries exceeded. Unable to get data. ")
 
 
@@ -275,7 +317,7 @@ def process_x_data(json_response: json,
         new = pd.DataFrame(json_response["data"])
         tweets_df = pd.concat([tweets_df, new])
         tweets_df.to_pickle("tweets_" + query_tag + ".pkl")
-
+        
         if "users" in json_response["includes"].keys():
             new = pd.DataFrame(json_response["includes"]["users"])
             users_df = pd.concat([users_df, new])
@@ -339,6 +381,23 @@ def ingest_and_analyze(query_params: dict = None, tag: str = "crypto") -> Dict[s
 app = Flask(__name__)
 analyzer = CryptoSentimentAnalyzer()
 
+# Micro-batching of concurrent API requests, configured like the pipeline's endpoints
+serving_config = load_serving_config()
+_batcher = None
+_batcher_lock = threading.Lock()
+
+def get_batcher() -> MicroBatcher:
+    """Return the request batcher, starting its worker on first use."""
+    global _batcher
+    with _batcher_lock:
+        if _batcher is None:
+            _batcher = MicroBatcher(
+                analyzer.analyze_tweets,
+                max_batch_size=serving_config['max_batch_size'],
+                max_wait_ms=serving_config['max_wait_ms']
+            )
+        return _batcher
+
 @app.route('/api/analyze/tweet', methods=['POST'])
 def analyze_single_tweet():
     """Analyze a single tweet text"""
@@ -352,14 +411,39 @@ def analyze_single_tweet():
     if not text:
         return jsonify({"error": "No text provided for analysis"}), 400
     
-    # Perform sentiment analysis
-    analysis_result = analyzer.analyze_tweet(text)
+    # Perform sentiment analysis together with concurrent requests
+    analysis_result = get_batcher().analyze(text)
     
     return jsonify({
         "input_text": text,
         "sentiment_analysis": analysis_result
     })
 
+@app.route('/api/analyze/batch', methods=['POST'])
+def analyze_tweet_batch():
+    """Analyze an array of tweet texts"""
+    data = request.get_json()
+    
+    if not data:
+        return jsonify({"error": "Invalid JSON payload"}), 400
+        
+    texts = data.get("texts")
+    
+    if not isinstance(texts, list) or not texts:
+        return jsonify({"error": "No texts provided for analysis"}), 400
+    if len(texts) > serving_config['max_request_texts']:
+        return jsonify({"error": f"At most {serving_config['max_request_texts']} texts can be analyzed at once"}), 400
+    if not all(isinstance(text, str) for text in texts):
+        return jsonify({"error": "Texts must be strings"}), 400
+    
+    return jsonify({
+        "count": len(texts),
+        "results": [
+            {"input_text": text, "sentiment_analysis": result}
+            for text, result in zip(texts, get_batcher().analyze_many(texts))
+        ]
+    })
+
 @app.route('/api/ingest', methods=['POST'])
 def ingest_tweets():
     """Trigger ingestion of tweets from Twitter API"""
@@ -405,4 +489,24 @@ def analyze_file():
         users_df = None
         
         if users_file and os.path.exists(users_file):
-            users_df = pd.read_
\ No newline at end of file
+            users_df = pd.read_pickle(users_file)
+        
+        # Analyze the tweets
+        results_df = analyzer.analyze_dataframe(tweets_df, users_df)
+        summary = analyzer.generate_sentiment_summary(results_df)
+        
+        return jsonify({
+            "success": True,
+            "summary": summary,
+            "tweets_analyzed": len(results_df)
+        })
+    
+    except Exception as e:
+        return jsonify({
+            "success": False,
+            "error": str(e)
+        }), 500
+
+
+if __name__ == '__main__':
+    app.run(debug=True, threaded=True, port=5000)
@@ -0,0 +1,127 @@
+from collections import OrderedDict
+import hashlib
+import logging
+import re
+import threading
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Links and repeated whitespace differ between reposts of the same text
+URL_PATTERN = re.compile(r'https?://\S+')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+def normalize_text(text: str) -> str:
+    """
+    Normalize a text for duplicate detection.
+    
+    Links are removed and whitespace collapsed. Case and punctuation are
+    kept because they change the score of some backends (e.g. VADER).
+    
+    Args:
+        text: Raw text
+        
+    Returns:
+        Normalized text
+    """
+    return WHITESPACE_PATTERN.sub(' ', URL_PATTERN.sub('', text)).strip()
+
+
+class SentimentCache:
+    """
+    Memoizes text sentiment by a hash of the normalized text.
+    
+    Keys include the backend and model version, so changing the model never
+    serves stale scores. Entries live in an in-process LRU and, optionally,
+    in Redis through ``Storage`` so other workers and later runs reuse them.
+    """
+    
+    def __init__(self,
+                 namespace: str,
+                 max_entries: int = 100000,
+                 storage: Any = None,
+                 ttl: Optional[int] = None,
+                 key_prefix: str = 'sentiment'):
+        """
+        Initialize the sentiment cache.
+        
+        Args:
+            namespace: Backend and model version the scores belong to
+            max_entries: Maximum number of entries kept in process
+            storage: Optional connected ``Storage`` used as the Redis tier
+            ttl: TTL of Redis entries in seconds (defaults to the storage TTL)
+            key_prefix: Prefix for Redis keys
+        """
+        self.namespace = namespace
+        self.max_entries = max_entries
+        self.storage = storage
+        self.ttl = ttl
+        self.key_prefix = key_prefix
+        self.hits = 0
+        self.misses = 0
+        self._entries: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+        self._lock = threading.Lock()
+        
+    def make_key(self, text: str) -> str:
+        """
+        Build the cache key for a text.
+        
+        Args:
+            text: Raw text
+            
+        Returns:
+            Cache key
+        """
+        digest = hashlib.sha1(normalize_text(text).encode('utf-8')).hexdigest()
+        return f"{self.key_prefix}:{self.namespace}:{digest}"
+        
+    def get_many(self, keys: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Look up cached sentiments, checking the LRU before Redis.
+        
+        Args:
+            keys: Cache keys
+            
+        Returns:
+            Mapping of the keys found to their sentiment
+        """
+        found = {}
+        missing = []
+        with self._lock:
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry is None:
+                    missing.append(key)
+                else:
+                    self._entries.move_to_end(key)
+                    found[key] = entry
+                    
+        if missing and self.storage is not None:
+            for key, entry in zip(missing, self.storage.get_cached_many(missing)):
+                if entry is not None:
+                    found[key] = entry
+                    self._remember(key, entry)
+                    
+        self.hits += len(found)
+        self.misses += len(keys) - len(found)
+        return found
+        
+    def set_many(self, entries: Dict[str, Dict[str, Any]]):
+        """
+        Cache sentiments.
+        
+        Args:
+            entries: Mapping of cache keys to sentiment
+        """
+        for key, entry in entries.items():
+            self._remember(key, entry)
+        if self.storage is not None:
+            self.storage.cache_many(entries, ttl=self.ttl)
+            
+    def _remember(self, key: str, entry: Dict[str, Any]):
+        """Insert an entry into the in-process LRU, evicting the oldest ones."""
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
@@ -0,0 +1,133 @@
+import json
+import logging
+import os
+from typing import Any, Dict, Iterable, List, Optional
+import numpy as np
+
+from processors.sentiment import (
+    SentimentAnalyzer, SentimentBatch, as_texts, length_buckets, prediction_to_result
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODEL_DIR = "models/sentiment/onnx/distilbert-sst2-int8"
+
+class OnnxSentimentAnalyzer(SentimentAnalyzer):
+    """
+    DistilBERT sentiment served by ONNX Runtime from a locally exported model.
+    
+    The artifact is produced by ``models/sentiment/export_onnx.py``: an int8
+    dynamically quantized graph plus the tokenizer and label mapping. Results
+    have the same shape as the TensorFlow backend.
+    """
+    
+    def __init__(self,
+                 model_dir: str = DEFAULT_MODEL_DIR,
+                 batch_size: int = 32,
+                 max_length: int = 128,
+                 threads: Optional[int] = None):
+        """
+        Initialize the ONNX sentiment analyzer.
+        
+        Args:
+            model_dir: Directory of the exported model
+            batch_size: Number of texts per forward pass
+            max_length: Maximum number of tokens per text, longer texts are truncated
+            threads: Intra-op threads of the runtime (defaults to all cores)
+        
+        Raises:
+            FileNotFoundError: If the model has not been exported yet
+        """
+        # Imported here so other backends never load the runtime
+        import onnxruntime as ort
+        from transformers import AutoTokenizer
+        
+        model_path = os.path.join(model_dir, 'model.int8.onnx')
+        if not os.path.exists(model_path):
+            raise FileNotFoundError(
+                f"No exported model at {model_path}, run models/sentiment/export_onnx.py first"
+            )
+        
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if threads:
+            options.intra_op_num_threads = threads
+        self.session = ort.InferenceSession(model_path, options, providers=['CPUExecutionProvider'])
+        self.input_names = {model_input.name for model_input in self.session.get_inputs()}
+        
+        self.tokenizer = AutoTokenizer.from_pretrained(model_dir)
+        with open(os.path.join(model_dir, 'config.json'), 'r') as f:
+            id2label = json.load(f)['id2label']
+        self.labels = [id2label[str(index)] for index in range(len(id2label))]
+        
+        self.batch_size = batch_size
+        self.max_length = max_length
+    
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> 'OnnxSentimentAnalyzer':
+        return cls(
+            model_dir=config.get('onnx_model_dir', DEFAULT_MODEL_DIR),
+            batch_size=config.get('batch_size', 32),
+            max_length=config.get('max_length', 128),
+            threads=config.get('onnx_threads')
+        )
+    
+    def predict(self, texts: List[str]) -> np.ndarray:
+        """
+        Compute class probabilities for one batch of texts.
+        
+        Args:
+            texts: Texts to classify
+        
+        Returns:
+            Array of shape (len(texts), number of labels)
+        """
+        encoded = self.tokenizer(
+            texts,
+            padding=True,
+            truncation=True,
+            max_length=self.max_length,
+            return_tensors='np'
+        )
+        feeds = {name: values.astype(np.int64) for name, values in encoded.items() if name in self.input_names}
+        logits = self.session.run(None, feeds)[0]
+        
+        # Softmax over the labels
+        exp = np.exp(logits - logits.max(axis=1, keepdims=True))
+        return exp / exp.sum(axis=1, keepdims=True)
+    
+    def analyze(self, text: str) -> Dict[str, Any]:
+        """
+        Analyze sentiment using the ONNX model.
+        
+        Args:
+            text: Text to analyze
+        
+        Returns:
+            Dictionary containing sentiment scores
+        """
+        return self.analyze_batch([text])[0]
+    
+    def analyze_batch(self, texts: Iterable[str]) -> SentimentBatch:
+        """
+        Analyze sentiment of several texts with length-bucketed batches.
+        
+        Args:
+            texts: List or pandas Series of texts to analyze
+        
+        Returns:
+            Columnar results, in the order of the texts
+        """
+        texts = as_texts(texts)
+        results: List[Optional[Dict[str, Any]]] = [None] * len(texts)
+        
+        for bucket in length_buckets(texts, self.batch_size):
+            probabilities = self.predict([texts[index] for index in bucket])
+            best = probabilities.argmax(axis=1)
+            for index, label_id, row in zip(bucket, best.tolist(), probabilities):
+                results[index] = prediction_to_result({
+                    'label': self.labels[label_id],
+                    'score': float(row[label_id])
+                })
+        
+        return SentimentBatch.from_dicts(results)
@@ -0,0 +1,196 @@
+from collections import defaultdict
+import logging
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Running sums kept per asset and bucket
+FIELDS = ('weighted_sum', 'engagement', 'score_sum', 'count')
+
+class SentimentRollup:
+    """
+    Running sentiment aggregates per asset and time bucket.
+    
+    Every scored tweet adds its score times engagement, its engagement, its
+    score and a count to the bucket it was posted in, so updates are O(1) and
+    windowed sentiment is read from at most ``retention / bucket_seconds``
+    buckets instead of the raw tweets. Buckets can be mirrored to Redis
+    through ``Storage``, one hash per bucket expiring after the retention, so
+    a restarted worker picks the aggregates up again with ``restore``.
+    Windows are read from memory only: increments made by other workers
+    sharing the Redis keys are seen after their next ``restore``.
+    """
+    
+    def __init__(self,
+                 bucket_seconds: int = 60,
+                 retention: int = 86400,
+                 storage: Any = None,
+                 key_prefix: str = 'sentiment_rollup'):
+        """
+        Initialize the rollup.
+        
+        Args:
+            bucket_seconds: Width of a bucket, e.g. 60 for per-minute or 3600 for per-hour
+            retention: Seconds of buckets kept
+            storage: Optional connected ``Storage`` used as the Redis backing
+            key_prefix: Prefix for Redis keys
+        
+        Raises:
+            ValueError: If the bucket width is not positive
+        """
+        if bucket_seconds <= 0:
+            raise ValueError(f"bucket_seconds must be positive, got {bucket_seconds}")
+        
+        self.bucket_seconds = bucket_seconds
+        self.retention = retention
+        self.storage = storage
+        self.key_prefix = key_prefix
+        self.buckets: Dict[str, Dict[int, List[float]]] = {}
+        self._lock = threading.Lock()
+    
+    def bucket_of(self, timestamp: float) -> int:
+        """Start of the bucket containing a Unix timestamp."""
+        return int(timestamp // self.bucket_seconds) * self.bucket_seconds
+    
+    def _key(self, bucket: int) -> str:
+        """Redis key of a bucket."""
+        return f"{self.key_prefix}:{self.bucket_seconds}:{bucket}"
+    
+    def add(self, asset: str, score: float, engagement: float, timestamp: Optional[float] = None):
+        """
+        Add one scored tweet.
+        
+        Args:
+            asset: Asset the tweet is about
+            score: Sentiment score in [0, 1]
+            engagement: Engagement of the tweet
+            timestamp: Unix time the tweet was posted (defaults to now)
+        """
+        self.add_many([(asset, score, engagement, timestamp)])
+    
+    def add_many(self, records: Iterable[Tuple[str, float, float, Optional[float]]]):
+        """
+        Add scored tweets, mirroring the increments to Redis in one round-trip.
+        
+        Args:
+            records: (asset, score, engagement, timestamp) tuples
+        """
+        increments: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
+        now = time.time()
+        
+        with self._lock:
+            for asset, score, engagement, timestamp in records:
+                bucket = self.bucket_of(timestamp if timestamp is not None else now)
+                values = (score * engagement, engagement, score, 1)
+                
+                sums = self.buckets.setdefault(asset, {}).setdefault(bucket, [0.0] * len(FIELDS))
+                for index, value in enumerate(values):
+                    sums[index] += value
+                
+                if self.storage is not None:
+                    fields = increments[self._key(bucket)]
+                    for field, value in zip(FIELDS, values):
+                        fields[f"{asset}|{field}"] += value
+        
+        if increments:
+            self.storage.increment_hashes(increments, ttl=self.retention + self.bucket_seconds)
+    
+    def window(self, asset: str, seconds: Optional[int] = None, now: Optional[float] = None) -> Dict[str, float]:
+        """
+        Aggregate the buckets of an asset over a trailing window.
+        
+        The window is rounded out to whole buckets. The score is the
+        engagement-weighted mean, or the plain mean when no tweet had any
+        engagement, and None without tweets.
+        
+        Args:
+            asset: Asset to aggregate
+            seconds: Window length (defaults to the retention)
+            now: End of the window as Unix time (defaults to now)
+        
+        Returns:
+            Summed fields and the windowed score
+        """
+        now = time.time() if now is None else now
+        start = self.bucket_of(now - (seconds or self.retention))
+        totals = [0.0] * len(FIELDS)
+        
+        with self._lock:
+            for bucket, sums in self.buckets.get(asset, {}).items():
+                if start <= bucket <= now:
+                    for index, value in enumerate(sums):
+                        totals[index] += value
+        
+        result = dict(zip(FIELDS, totals))
+        if result['engagement'] > 0:
+            result['score'] = result['weighted_sum'] / result['engagement']
+        elif result['count'] > 0:
+            result['score'] = result['score_sum'] / result['count']
+        else:
+            result['score'] = None
+        return result
+    
+    def windows(self, seconds: Optional[int] = None, now: Optional[float] = None) -> Dict[str, Dict[str, float]]:
+        """
+        Aggregate every asset with tweets in a trailing window.
+        
+        Args:
+            seconds: Window length (defaults to the retention)
+            now: End of the window as Unix time (defaults to now)
+        
+        Returns:
+            Windowed aggregates by asset
+        """
+        with self._lock:
+            assets = list(self.buckets)
+        results = {asset: self.window(asset, seconds, now) for asset in assets}
+        return {asset: result for asset, result in results.items() if result['count'] > 0}
+    
+    def prune(self, now: Optional[float] = None) -> Set[str]:
+        """
+        Drop buckets older than the retention.
+        
+        Args:
+            now: Current Unix time (defaults to now)
+        
+        Returns:
+            Assets that lost buckets, so their windowed sentiment changed
+        """
+        cutoff = self.bucket_of((time.time() if now is None else now) - self.retention)
+        expired = set()
+        with self._lock:
+            for asset in list(self.buckets):
+                buckets = self.buckets[asset]
+                for bucket in [bucket for bucket in buckets if bucket < cutoff]:
+                    del buckets[bucket]
+                    expired.add(asset)
+                if not buckets:
+                    del self.buckets[asset]
+        return expired
+    
+    def restore(self, now: Optional[float] = None):
+        """
+        Load the retained buckets from Redis, replacing the in-memory ones.
+        
+        Args:
+            now: Current Unix time (defaults to now)
+        """
+        if self.storage is None:
+            return
+        
+        end = self.bucket_of(time.time() if now is None else now)
+        starts = list(range(end - self.bucket_of(self.retention), end + 1, self.bucket_seconds))
+        buckets: Dict[str, Dict[int, List[float]]] = {}
+        
+        for bucket, fields in zip(starts, self.storage.get_hashes([self._key(bucket) for bucket in starts])):
+            for name, value in fields.items():
+                asset, field = name.rsplit('|', 1)
+                if field in FIELDS:
+                    sums = buckets.setdefault(asset, {}).setdefault(bucket, [0.0] * len(FIELDS))
+                    sums[FIELDS.index(field)] = value
+        
+        with self._lock:
+            self.buckets = buckets
+        logger.info(f"Restored sentiment rollup of {len(buckets)} assets")
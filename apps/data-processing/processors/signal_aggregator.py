@@ -1,10 +1,11 @@
 import json
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Any, Optional, Tuple
-import os
+from typing import Dict, Iterable, List, Any, Optional, Tuple
 import logging
 
+from processors.signal_sinks import JSONSink, create_sink
+
 # Set up logging
 logging.basicConfig(
     level=logging.INFO,
@@ -12,6 +13,37 @@ logging.basicConfig(
 )
 logger = logging.getLogger('signal_aggregator')
 
+# Words of the placeholder keyword sentiment used when no scores are given
+POSITIVE_WORDS = ['bullish', 'moon', 'up', 'gain', 'profit', 'good', 'great', 'excellent']
+NEGATIVE_WORDS = ['bearish', 'down', 'crash', 'loss', 'bad', 'terrible', 'poor']
+
+# Market metric names of normalize_market_metrics and their DexScreener fields
+DEX_METRIC_FIELDS = {
+    'liquidity': 'liquidity_usd',
+    'volume': 'volume_24h',
+    'price_change_pct': 'price_change_pct'
+}
+
+def symbol_addresses(market_metrics: Dict[str, Dict[str, Any]]) -> Dict[str, str]:
+    """
+    Resolve the symbols of the market metrics to addresses.
+    
+    A symbol shared by several tokens resolves to the most liquid one, ties
+    going to the lowest address, the same choice ``TokenIndex`` makes.
+    
+    Args:
+        market_metrics: DexScreener token metrics by address
+        
+    Returns:
+        Address of every uppercase symbol
+    """
+    ranked = sorted(market_metrics.items(), key=lambda item: (-(item[1].get('liquidity_usd') or 0.0), item[0]))
+    addresses: Dict[str, str] = {}
+    for address, metrics in ranked:
+        if metrics.get('symbol'):
+            addresses.setdefault(metrics['symbol'].upper(), address)
+    return addresses
+
 class SignalAggregator:
     """
     Aggregates sentiment and market metrics data to generate trading signals.
@@ -25,7 +57,12 @@ class SignalAggregator:
         Initialize the SignalAggregator with configuration parameters.
         
         Args:
-            config: Dictionary containing configuration parameters
+            config: Dictionary containing configuration parameters. Categories
+                given are merged into the default bounds of that category.
+                
+        Raises:
+            ValueError: If a setting or category is unknown, or a category is
+                not a mapping of bounds
         """
         # Default configuration
         self.config = {
@@ -33,6 +70,7 @@ class SignalAggregator:
             'liquidity_weight': 0.2,
             'volume_weight': 0.2,
             'price_action_weight': 0.2,
+            'profitability_weight': 0.2,
             'high_threshold': 0.7,
             'medium_threshold': 0.4,
             'low_threshold': 0.0,
@@ -45,9 +83,20 @@ class SignalAggregator:
             }
         }
         
-        # Update with provided config
-        if config:
-            self.config.update(config)
+        # Update with provided config, failing on settings that would be ignored
+        config = dict(config or {})
+        unknown = set(config).difference(self.config)
+        if unknown:
+            raise ValueError(f"Unknown signal settings: {sorted(unknown)}")
+        categories = config.pop('categories', None) or {}
+        for name, bounds in categories.items():
+            if name not in self.config['categories'] or not isinstance(bounds, dict):
+                raise ValueError(
+                    f"Signal category {name} must be one of {list(self.config['categories'])} "
+                    f"mapping to score bounds, got {bounds!r}"
+                )
+            self.config['categories'][name] = {**self.config['categories'][name], **bounds}
+        self.config.update(config)
             
         logger.info("SignalAggregator initialized with configuration")
     
@@ -78,15 +127,12 @@ class SignalAggregator:
             # This is a simple example - in a real scenario, you'd use a proper NLP model
             if 'text' in normalized.columns:
                 # Simple keyword-based sentiment (placeholder for actual NLP)
-                positive_words = ['bullish', 'moon', 'up', 'gain', 'profit', 'good', 'great', 'excellent']
-                negative_words = ['bearish', 'down', 'crash', 'loss', 'bad', 'terrible', 'poor']
-                
                 def simple_sentiment(text):
                     if not isinstance(text, str):
                         return 0.5
                     text = text.lower()
-                    pos_count = sum(1 for word in positive_words if word in text)
-                    neg_count = sum(1 for word in negative_words if word in text)
+                    pos_count = sum(1 for word in POSITIVE_WORDS if word in text)
+                    neg_count = sum(1 for word in NEGATIVE_WORDS if word in text)
                     
                     if pos_count + neg_count == 0:
                         return 0.5
@@ -295,6 +341,53 @@ class SignalAggregator:
         else:
             sentiment_score = 0.5  # Neutral default
         
+        sentiment_count = len(normalized_sentiment) if not normalized_sentiment.empty else 0
+        return self._build_signal(asset_id, sentiment_score, sentiment_count, normalized_metrics)
+    
+    def generate_rollup_signal(self,
+                               asset_id: str,
+                               rollup: Any,
+                               metrics_data: Dict[str, Any],
+                               window: Optional[int] = None,
+                               now: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Generate a signal for a specific asset from running sentiment aggregates.
+        
+        The engagement-weighted sentiment is read from the buckets of a
+        ``SentimentRollup`` instead of being recomputed from the raw tweets.
+        
+        Args:
+            asset_id: Identifier for the asset
+            rollup: SentimentRollup holding the asset's sentiment buckets
+            metrics_data: Dictionary containing market metrics
+            window: Seconds of sentiment to combine (defaults to the rollup retention)
+            now: End of the window as Unix time (defaults to now)
+            
+        Returns:
+            Signal dictionary
+        """
+        aggregate = rollup.window(asset_id, window, now)
+        sentiment_score = 0.5 if aggregate['score'] is None else min(1.0, max(0.0, aggregate['score']))
+        normalized_metrics = self.normalize_market_metrics(metrics_data)
+        return self._build_signal(asset_id, sentiment_score, int(aggregate['count']), normalized_metrics)
+    
+    def _build_signal(self,
+                      asset_id: str,
+                      sentiment_score: float,
+                      sentiment_count: int,
+                      normalized_metrics: Dict[str, float]) -> Dict[str, Any]:
+        """
+        Score, qualify and categorize a signal from normalized inputs.
+        
+        Args:
+            asset_id: Identifier for the asset
+            sentiment_score: Aggregate sentiment score (0-1)
+            sentiment_count: Number of sentiment records behind the score
+            normalized_metrics: Dictionary of normalized market metrics
+            
+        Returns:
+            Signal dictionary
+        """
         # Calculate aggregate score
         aggregate_score = self.calculate_aggregate_score(sentiment_score, normalized_metrics)
         
@@ -318,7 +411,7 @@ class SignalAggregator:
                 "metrics": {k: round(v, 2) for k, v in normalized_metrics.items()}
             },
             "metadata": {
-                "sentiment_count": len(normalized_sentiment) if not normalized_sentiment.empty else 0,
+                "sentiment_count": sentiment_count,
                 "config": {k: v for k, v in self.config.items() if k != 'categories'}
             }
         }
@@ -348,21 +441,395 @@ class SignalAggregator:
             
         return signals
     
-    def save_signals_to_json(self, signals: List[Dict[str, Any]], output_path: str) -> None:
+    def generate_signals(self,
+                         sentiments: Dict[str, Dict[str, float]],
+                         market_metrics: Dict[str, Dict[str, Any]],
+                         profitability: Dict[str, List[Dict[str, Any]]],
+                         tokens: Optional[Iterable[str]] = None,
+                         symbols: Optional[Dict[str, str]] = None) -> List[Dict[str, Any]]:
+        """
+        Generate signals for the tokens the pipeline has data for.
+        
+        Sentiment comes pre-aggregated per token, as the windows of a
+        ``SentimentRollup``, so the raw tweets are never rescanned. The sources
+        are laid out as long tables keyed by token, one sentiment row per
+        aggregate and one row per forum-call return, and scored together by
+        ``generate_signals_frame``. Tokens given as symbols are resolved to
+        addresses through ``symbols``, by default through the symbols of the
+        market metrics, shared ones going to the most liquid token.
+        When ``tokens`` is given only their signals are generated, so
+        unchanged tokens can keep their previous signals.
+        
+        Args:
+            sentiments: Windowed sentiment aggregates by token, as returned
+                by ``SentimentRollup.window``/``windows``
+            market_metrics: DexScreener token metrics by address
+            profitability: Forum-call profitability records by token
+            tokens: Optional tokens to generate signals for, by address or
+                symbol, defaults to every token with data
+            symbols: Optional address of every uppercase symbol, e.g.
+                ``TokenIndex.symbols``, so symbols resolve as in tweets
+            
+        Returns:
+            List of signal records with token, score, category, confidence,
+            components and timestamp
+        """
+        # Symbols and addresses of the known tokens, resolved to addresses
+        aliases = {address: address for address in market_metrics}
+        aliases.update(symbol_addresses(market_metrics) if symbols is None else symbols)
+        
+        def resolve(token: str) -> str:
+            return aliases.get(token) or aliases.get(token.lstrip('$').upper(), token)
+        
+        wanted = None if tokens is None else {resolve(token) for token in tokens}
+        
+        # One sentiment row per aggregate, a symbol and its address are merged by the columnar engine
+        sentiment_rows = [
+            (resolve(token), aggregate['score'], aggregate['engagement'], aggregate['count'])
+            for token, aggregate in sentiments.items()
+            if aggregate['count'] > 0 and (wanted is None or resolve(token) in wanted)
+        ]
+        sentiment_data = pd.DataFrame(
+            sentiment_rows,
+            columns=['asset_id', 'sentiment_score', 'engagement', 'sentiment_count']
+        )
+        
+        universe = list(market_metrics) if wanted is None else [token for token in wanted if token in market_metrics]
+        metrics_data = pd.DataFrame({'asset_id': universe})
+        for name, field in DEX_METRIC_FIELDS.items():
+            values = (market_metrics[token].get(field) for token in universe)
+            metrics_data[name] = np.array([np.nan if value is None else value for value in values], dtype=float)
+        
+        call_rows = []
+        for token, calls in profitability.items():
+            token = resolve(token)
+            if wanted is None or token in wanted:
+                call_rows.extend((token, call['return_pct']) for call in calls)
+        profitability_data = pd.DataFrame(call_rows, columns=['asset_id', 'return_pct'])
+        
+        frame = self.generate_signals_frame(sentiment_data, metrics_data, profitability_data)
+        timestamp = pd.Timestamp.now().isoformat()
+        signals = [
+            {
+                'token': token,
+                'score': score,
+                'category': category,
+                'confidence': confidence,
+                'components': {
+                    'sentiment': sentiment,
+                    'sentiment_count': sentiment_count,
+                    'metrics': {'liquidity': liquidity, 'volume': volume, 'price_action': price_action},
+                    'profitability': None if np.isnan(profitability_score) else profitability_score,
+                    'calls_count': calls_count
+                },
+                'timestamp': timestamp
+            }
+            for token, score, category, confidence, sentiment, sentiment_count,
+                liquidity, volume, price_action, profitability_score, calls_count
+            in zip(*(frame[column].tolist() for column in [
+                'asset_id', 'score', 'category', 'confidence', 'sentiment', 'sentiment_count',
+                'liquidity', 'volume', 'price_action', 'profitability', 'calls_count'
+            ]))
+        ]
+        
+        logger.info(f"Generated {len(signals)} signals from {len(sentiment_rows)} sentiment aggregates, "
+                    f"{len(market_metrics)} token metrics and {profitability_data['asset_id'].nunique()} called tokens")
+        return signals
+    
+    def generate_signals_frame(self,
+                               sentiment_data: pd.DataFrame,
+                               metrics_data: pd.DataFrame,
+                               profitability_data: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+        """
+        Generate signals for many assets at once from long-format tables.
+        
+        Every step of ``generate_signal`` runs as array operations over all
+        assets: sentiment is reduced per asset with ``np.bincount`` and the
+        metric normalization, scoring, confidence and category are computed
+        with ``np.where``/``np.select``. Results match the per-asset path.
+        For assets with forum calls, the mean call return mapped to 0-1
+        (e.g. +25% -> 0.75) is blended into the score by ``profitability_weight``.
+        
+        Args:
+            sentiment_data: One row per sentiment record with an 'asset_id'
+                column and the columns accepted by ``normalize_sentiment_data``.
+                Rows with a 'sentiment_score' may stand for several records
+                given in a 'sentiment_count' column, e.g. rollup windows
+            metrics_data: One row per asset with an 'asset_id' column and the
+                keys accepted by ``normalize_market_metrics`` as columns
+            profitability_data: Optional forum calls, one row per call with
+                'asset_id' and 'return_pct' columns
+                
+        Returns:
+            DataFrame with one row per asset: asset_id, category, confidence,
+            score, sentiment, liquidity, volume, price_action, sentiment_count,
+            profitability (NaN without calls) and calls_count
+        """
+        if profitability_data is None:
+            profitability_data = pd.DataFrame(columns=['asset_id', 'return_pct'])
+        
+        # Code every asset in one hashing pass: assets with metrics first, then
+        # assets only seen in sentiment data, then assets only called
+        def ids(data: pd.DataFrame) -> np.ndarray:
+            return data['asset_id'].to_numpy(dtype=object) if 'asset_id' in data else np.empty(0, dtype=object)
+        
+        metric_ids, sentiment_ids, call_ids = ids(metrics_data), ids(sentiment_data), ids(profitability_data)
+        codes, assets = pd.factorize(np.concatenate([metric_ids, sentiment_ids, call_ids]))
+        count = len(assets)
+        metric_codes = codes[:len(metric_ids)]
+        sentiment_codes = codes[len(metric_ids):len(metric_ids) + len(sentiment_ids)]
+        call_codes = codes[len(metric_ids) + len(sentiment_ids):]
+        
+        sentiment_score, sentiment_count = self._sentiment_columns(sentiment_data, sentiment_codes, count)
+        
+        # Metric columns aligned with the assets, NaN where not provided
+        aligned = {}
+        for name in ['liquidity', 'volume', 'average_volume', 'price_change_pct']:
+            aligned[name] = np.full(count, np.nan)
+            if name in metrics_data:
+                aligned[name][metric_codes] = metrics_data[name].to_numpy(dtype=float)
+        metrics = self._metric_columns(pd.DataFrame(aligned))
+        
+        # Weighted score in the order of calculate_aggregate_score
+        score = self.config['sentiment_weight'] * sentiment_score
+        score = score + self.config['liquidity_weight'] * metrics['liquidity']
+        score = score + self.config['volume_weight'] * metrics['volume']
+        score = score + self.config['price_action_weight'] * metrics['price_action']
+        
+        # Mean forum-call return blended in for assets with calls
+        calls_count = np.bincount(call_codes, minlength=count)
+        returns = np.bincount(call_codes, weights=profitability_data['return_pct'].to_numpy(dtype=float), minlength=count)
+        profitability = np.full(count, np.nan)
+        np.divide(returns, calls_count, out=profitability, where=calls_count > 0)
+        profitability = np.clip(0.5 + profitability / 100, 0.0, 1.0)
+        weight = self.config['profitability_weight']
+        score = np.where(calls_count > 0, (1 - weight) * score + weight * profitability, score)
+        
+        # Confidence as in determine_confidence
+        divergence = np.abs(sentiment_score - metrics['price_action'])
+        confidence = np.select(
+            [
+                (score >= self.config['high_threshold']) & (divergence < 0.3),
+                divergence > 0.6,
+                score >= self.config['medium_threshold']
+            ],
+            ['high', 'low', 'medium'],
+            'low'
+        )
+        
+        # Category as in categorize_signal
+        categories = self.config['categories']
+        price_action = metrics['price_action']
+        category = np.select(
+            [
+                (score >= categories['strong_buy']['min_score']) &
+                (sentiment_score >= categories['strong_buy']['sentiment_min']) &
+                (price_action >= categories['strong_buy']['price_action_min']),
+                (score >= categories['buy']['min_score']) &
+                (sentiment_score >= categories['buy']['sentiment_min']) &
+                (price_action >= categories['buy']['price_action_min']),
+                (score <= categories['strong_sell']['max_score']) &
+                (sentiment_score <= categories['strong_sell']['sentiment_max']) &
+                (price_action <= categories['strong_sell']['price_action_max']),
+                (score <= categories['sell']['max_score']) &
+                (sentiment_score <= categories['sell']['sentiment_max']) &
+                (price_action <= categories['sell']['price_action_max'])
+            ],
+            ['strong_buy', 'buy', 'strong_sell', 'sell'],
+            'neutral'
+        )
+        
+        return pd.DataFrame({
+            'asset_id': assets,
+            'category': category,
+            'confidence': confidence,
+            'score': np.round(score, 2),
+            'sentiment': np.round(sentiment_score, 2),
+            'liquidity': np.round(metrics['liquidity'], 2),
+            'volume': np.round(metrics['volume'], 2),
+            'price_action': np.round(price_action, 2),
+            'sentiment_count': sentiment_count,
+            'profitability': np.round(profitability, 2),
+            'calls_count': calls_count
+        }, index=range(count))
+    
+    def frame_to_signals(self, frame: pd.DataFrame) -> List[Dict[str, Any]]:
+        """
+        Convert a signals frame into the signal dictionaries of ``generate_signal``.
+        
+        Args:
+            frame: Result of ``generate_signals_frame``
+            
+        Returns:
+            List of signal dictionaries
+        """
+        timestamp = pd.Timestamp.now().isoformat()
+        config = {k: v for k, v in self.config.items() if k != 'categories'}
+        columns = ['asset_id', 'category', 'confidence', 'score', 'sentiment',
+                   'liquidity', 'volume', 'price_action', 'sentiment_count']
+        
+        return [
+            {
+                "asset_id": asset_id,
+                "timestamp": timestamp,
+                "signal": {
+                    "category": category,
+                    "confidence": confidence,
+                    "score": score
+                },
+                "components": {
+                    "sentiment": sentiment,
+                    "metrics": {
+                        "liquidity": liquidity,
+                        "volume": volume,
+                        "price_action": price_action
+                    }
+                },
+                "metadata": {
+                    "sentiment_count": sentiment_count,
+                    "config": config
+                }
+            }
+            for asset_id, category, confidence, score, sentiment, liquidity, volume, price_action, sentiment_count
+            in zip(*(frame[column].tolist() for column in columns))
+        ]
+    
+    def _sentiment_columns(self,
+                           sentiment_data: pd.DataFrame,
+                           codes: np.ndarray,
+                           count: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Reduce long-format sentiment to one score per asset.
+        
+        Args:
+            sentiment_data: Sentiment records
+            codes: Asset position of every record
+            count: Number of assets
+            
+        Returns:
+            Sentiment score and record count per asset
+        """
+        if sentiment_data.empty or 'asset_id' not in sentiment_data:
+            return np.full(count, 0.5), np.zeros(count, dtype=int)
+        
+        # Records every row stands for, one unless pre-aggregated
+        if 'sentiment_score' in sentiment_data and 'sentiment_count' in sentiment_data:
+            row_records = sentiment_data['sentiment_count'].to_numpy(dtype=float)
+        else:
+            row_records = np.ones(len(sentiment_data))
+        records = np.bincount(codes, weights=row_records, minlength=count)
+        engagement = None
+        
+        if 'sentiment_score' in sentiment_data:
+            scores = sentiment_data['sentiment_score'].clip(0, 1).to_numpy(dtype=float)
+            if 'engagement' in sentiment_data:
+                engagement = sentiment_data['engagement'].to_numpy(dtype=float)
+        else:
+            scores = None
+            if 'text' in sentiment_data:
+                scores = self._keyword_scores(sentiment_data['text'])
+                
+            if all(col in sentiment_data for col in ['likes', 'retweets', 'comments']):
+                engagement = (sentiment_data['likes'] + sentiment_data['retweets']*2 +
+                              sentiment_data['comments']*3).to_numpy(dtype=float)
+                
+                # Normalize engagement to 0-1 within each asset
+                peak = np.zeros(count)
+                np.maximum.at(peak, codes, engagement)
+                asset_peak = peak[codes]
+                engagement = np.divide(engagement, asset_peak, out=np.zeros_like(engagement), where=asset_peak > 0)
+                
+                if scores is not None:
+                    scores = scores * (0.5 + 0.5 * engagement)
+                    
+            if scores is None:
+                scores = np.full(len(sentiment_data), 0.5)
+                
+        # Engagement-weighted mean where any weight, plain mean otherwise
+        totals = np.bincount(codes, weights=scores * row_records, minlength=count)
+        sentiment = np.full(count, 0.5)
+        np.divide(totals, records, out=sentiment, where=records > 0)
+        if engagement is not None:
+            weighted = np.bincount(codes, weights=scores * engagement, minlength=count)
+            weights = np.bincount(codes, weights=engagement, minlength=count)
+            np.divide(weighted, weights, out=sentiment, where=weights > 0)
+            
+        return sentiment, records.round().astype(int)
+    
+    @staticmethod
+    def _keyword_scores(texts: pd.Series) -> np.ndarray:
+        """Keyword sentiment of a text column, as in normalize_sentiment_data."""
+        is_text = texts.map(lambda text: isinstance(text, str)).to_numpy(dtype=bool)
+        lowered = texts.where(is_text, '').str.lower()
+        pos_count = sum(lowered.str.contains(word, regex=False).to_numpy(dtype=int) for word in POSITIVE_WORDS)
+        neg_count = sum(lowered.str.contains(word, regex=False).to_numpy(dtype=int) for word in NEGATIVE_WORDS)
+        
+        total = pos_count + neg_count
+        scores = np.full(len(texts), 0.5)
+        np.divide(pos_count, total, out=scores, where=(total > 0) & is_text)
+        return scores
+    
+    @staticmethod
+    def _metric_columns(metrics: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """
+        Normalize market metric columns as in normalize_market_metrics.
+        
+        Args:
+            metrics: Metrics indexed by asset, missing values as NaN
+            
+        Returns:
+            Normalized liquidity, volume and price action per asset
+        """
+        def column(name: str) -> np.ndarray:
+            if name not in metrics:
+                return np.full(len(metrics), np.nan)
+            return metrics[name].to_numpy(dtype=float)
+        
+        liquidity = column('liquidity')
+        volume = column('volume')
+        average_volume = np.where(np.isnan(column('average_volume')), volume, column('average_volume'))
+        price_change = column('price_change_pct')
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            volume_score = np.clip(0.5 + 0.3 * np.log2(volume / average_volume), 0.0, 1.0)
+            
+        return {
+            'liquidity': np.where(np.isnan(liquidity), 0.5, np.clip(liquidity / 1000000, 0.0, 1.0)),
+            'volume': np.where(np.isnan(volume) | ~(average_volume > 0), 0.5, volume_score),
+            'price_action': np.where(np.isnan(price_change), 0.5, np.clip(0.5 + price_change / 20, 0.0, 1.0))
+        }
+    
+    def save_signals_to_json(self, signals: Iterable[Dict[str, Any]], output_path: str) -> None:
         """
         Save signals to a JSON file.
         
+        Signals are encoded one at a time and the file is replaced atomically,
+        so a generator of signals is written in constant memory.
+        
         Args:
-            signals: List of signal dictionaries
+            signals: Signal dictionaries, e.g. a list or a generator
             output_path: Path to save the JSON file
         """
-        # Create directory if it doesn't exist
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        JSONSink(output_path, indent=2).write(signals)
+        
+    def save_signals(self,
+                     signals: Iterable[Dict[str, Any]],
+                     output_path: str,
+                     format: Optional[str] = None,
+                     **options: Any) -> int:
+        """
+        Stream signals to a JSON, NDJSON or Parquet file, optionally gzipped.
         
-        with open(output_path, 'w') as f:
-            json.dump(signals, f, indent=2)
+        Args:
+            signals: Signal dictionaries, e.g. a list or a generator
+            output_path: Output file path
+            format: json, ndjson or parquet, defaults to the file extension
+            options: Keyword arguments of the sink, e.g. append=True for NDJSON
             
-        logger.info(f"Saved {len(signals)} signals to {output_path}")
+        Returns:
+            Number of signals written
+        """
+        return create_sink(output_path, format, **options).write(signals)
 
 
 # Example usage function
@@ -0,0 +1,294 @@
+import gzip
+import json
+import logging
+import os
+import stat
+import tempfile
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from itertools import islice
+from typing import Any, Dict, IO, Iterable, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+class SignalSink(ABC):
+    """
+    Destination that signals are streamed to.
+    
+    Sinks accept any iterable, including generators, and hold at most one
+    signal or one batch in memory. Unless appending, the output is written to
+    a temporary file next to it and renamed over it once complete, so readers
+    never see a partial file.
+    """
+    
+    def __init__(self, path: str):
+        """
+        Initialize the sink.
+        
+        Args:
+            path: Output file path
+        """
+        self.path = path
+    
+    @abstractmethod
+    def write(self, signals: Iterable[Dict[str, Any]]) -> int:
+        """
+        Write signals.
+        
+        Args:
+            signals: Signal dictionaries
+        
+        Returns:
+            Number of signals written
+        """
+    
+    @contextmanager
+    def _atomic_path(self) -> Iterator[str]:
+        """Temporary path renamed to the output path on success, removed on failure."""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        descriptor, temp_path = tempfile.mkstemp(
+            dir=directory or '.',
+            prefix=f".{os.path.basename(self.path)}.",
+            suffix='.tmp'
+        )
+        os.close(descriptor)
+        try:
+            # Keep the permissions of the file being replaced, mkstemp creates it private
+            mode = stat.S_IMODE(os.stat(self.path).st_mode) if os.path.exists(self.path) else 0o644
+            os.chmod(temp_path, mode)
+            yield temp_path
+            os.replace(temp_path, self.path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+    
+    def _open_text(self, path: str, mode: str, compress: bool) -> IO[str]:
+        """Open a text file, gzip compressed if asked."""
+        if compress:
+            return gzip.open(path, mode + 't', encoding='utf-8')
+        return open(path, mode, encoding='utf-8')
+
+
+class JSONSink(SignalSink):
+    """Writes signals as one JSON array, encoded one signal at a time."""
+    
+    def __init__(self, path: str, indent: Optional[int] = 2, compress: Optional[bool] = None):
+        """
+        Initialize the sink.
+        
+        Args:
+            path: Output file path
+            indent: Indentation of the array, as in ``json.dump``
+            compress: Gzip the output, defaults to whether the path ends in '.gz'
+        """
+        super().__init__(path)
+        self.indent = indent
+        self.compress = path.endswith('.gz') if compress is None else compress
+    
+    def write(self, signals: Iterable[Dict[str, Any]]) -> int:
+        """
+        Write signals, producing the same text as ``json.dump(signals, f, indent=indent)``.
+        
+        Args:
+            signals: Signal dictionaries
+        
+        Returns:
+            Number of signals written
+        """
+        count = 0
+        separator, prefix = (', ', '') if self.indent is None else (',', '\n' + ' ' * self.indent)
+        
+        with self._atomic_path() as temp_path, self._open_text(temp_path, 'w', self.compress) as f:
+            f.write('[')
+            for signal in signals:
+                encoded = json.dumps(signal, indent=self.indent)
+                f.write((separator if count else '') + prefix + encoded.replace('\n', prefix))
+                count += 1
+            f.write('\n]' if count and self.indent is not None else ']')
+        
+        logger.info(f"Saved {count} signals to {self.path}")
+        return count
+
+
+class NDJSONSink(SignalSink):
+    """Writes signals as newline-delimited JSON, one signal per line."""
+    
+    def __init__(self, path: str, append: bool = False, compress: Optional[bool] = None):
+        """
+        Initialize the sink.
+        
+        Args:
+            path: Output file path
+            append: Add the signals to the end of the file instead of replacing it
+            compress: Gzip the output, defaults to whether the path ends in '.gz'
+        """
+        super().__init__(path)
+        self.append = append
+        self.compress = path.endswith('.gz') if compress is None else compress
+    
+    def write(self, signals: Iterable[Dict[str, Any]]) -> int:
+        """
+        Write signals.
+        
+        Appended writes go straight to the file so earlier lines are never
+        rewritten; compressed appends add a gzip member, which readers of
+        the file decompress as one stream.
+        
+        Args:
+            signals: Signal dictionaries
+        
+        Returns:
+            Number of signals written
+        """
+        if self.append:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with self._open_text(self.path, 'a', self.compress) as f:
+                count = self._write_lines(f, signals)
+        else:
+            with self._atomic_path() as temp_path, self._open_text(temp_path, 'w', self.compress) as f:
+                count = self._write_lines(f, signals)
+        
+        logger.info(f"Saved {count} signals to {self.path}")
+        return count
+    
+    @staticmethod
+    def _write_lines(f: IO[str], signals: Iterable[Dict[str, Any]]) -> int:
+        """Write one JSON line per signal and count them."""
+        count = 0
+        for signal in signals:
+            f.write(json.dumps(signal) + '\n')
+            count += 1
+        return count
+
+
+class ParquetSink(SignalSink):
+    """
+    Writes signals to a Parquet file for analytics, in row groups of
+    ``batch_size`` signals.
+    
+    Nested dictionaries are flattened into dotted columns such as
+    ``components.sentiment``. The first batch fixes the schema; columns only
+    holding nulls in it are typed as floats, and columns first appearing in a
+    later batch are an error rather than being dropped.
+    """
+    
+    def __init__(self, path: str, batch_size: int = 10000, compression: str = 'snappy'):
+        """
+        Initialize the sink.
+        
+        Args:
+            path: Output file path
+            batch_size: Signals per row group
+            compression: Parquet compression codec
+        """
+        # Imported here so pyarrow is only needed for Parquet output
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        
+        super().__init__(path)
+        self.pa = pa
+        self.pq = pq
+        self.batch_size = batch_size
+        self.compression = compression
+    
+    def write(self, signals: Iterable[Dict[str, Any]]) -> int:
+        """
+        Write signals.
+        
+        Args:
+            signals: Signal dictionaries
+        
+        Returns:
+            Number of signals written
+        
+        Raises:
+            ValueError: If a batch has columns missing from the first batch
+        """
+        pa = self.pa
+        rows = (flatten(signal) for signal in signals)
+        count = 0
+        writer = None
+        
+        with self._atomic_path() as temp_path:
+            try:
+                for batch in iter(lambda: list(islice(rows, self.batch_size)), []):
+                    if writer is None:
+                        schema = pa.Table.from_pylist(batch).schema
+                        schema = pa.schema([
+                            field.with_type(pa.float64()) if pa.types.is_null(field.type) else field
+                            for field in schema
+                        ])
+                        writer = self.pq.ParquetWriter(temp_path, schema, compression=self.compression)
+                    new_columns = set().union(*batch).difference(writer.schema.names)
+                    if new_columns:
+                        raise ValueError(
+                            f"Signal columns {sorted(new_columns)} are not in the Parquet schema "
+                            f"fixed by the first {self.batch_size} signals"
+                        )
+                    writer.write_table(pa.Table.from_pylist(batch, schema=writer.schema))
+                    count += len(batch)
+            finally:
+                if writer is not None:
+                    writer.close()
+            if writer is None:
+                self.pq.write_table(pa.table({}), temp_path, compression=self.compression)
+        
+        logger.info(f"Saved {count} signals to {self.path}")
+        return count
+
+
+def flatten(record: Dict[str, Any], prefix: str = '') -> Dict[str, Any]:
+    """
+    Flatten nested dictionaries into dotted keys.
+    
+    Args:
+        record: Dictionary to flatten
+        prefix: Prefix of the keys
+    
+    Returns:
+        Flat dictionary
+    """
+    flat = {}
+    for key, value in record.items():
+        if isinstance(value, dict):
+            flat.update(flatten(value, f"{prefix}{key}."))
+        else:
+            flat[f"{prefix}{key}"] = value
+    return flat
+
+
+# Sinks by output format
+SIGNAL_SINKS = {
+    'json': JSONSink,
+    'ndjson': NDJSONSink,
+    'parquet': ParquetSink
+}
+
+def create_sink(path: str, format: Optional[str] = None, **options: Any) -> SignalSink:
+    """
+    Create the sink for an output file.
+    
+    Args:
+        path: Output file path
+        format: json, ndjson or parquet, defaults to the one named by the
+            extension ('.jsonl' and '.ndjson' for ndjson, ignoring '.gz')
+        options: Keyword arguments of the sink
+    
+    Returns:
+        Signal sink
+    
+    Raises:
+        ValueError: If the format is unknown
+    """
+    if format is None:
+        extension = os.path.splitext(path[:-3] if path.endswith('.gz') else path)[1].lstrip('.').lower()
+        format = 'ndjson' if extension == 'jsonl' else extension
+    if format not in SIGNAL_SINKS:
+        raise ValueError(f"Unknown signal output format: {format}")
+    return SIGNAL_SINKS[format](path, **options)
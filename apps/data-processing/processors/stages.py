@@ -0,0 +1,88 @@
+import asyncio
+from typing import Any, AsyncIterable, AsyncIterator, Awaitable, Iterable, List, Sequence, TypeVar, Union
+
+T = TypeVar('T')
+
+# Marks the end of a stage's output
+END = object()
+
+async def emit(queue: asyncio.Queue, items: Union[Iterable[Any], AsyncIterable[Any]]):
+    """
+    Put items on a bounded queue, then mark it as finished.
+    
+    ``put`` blocks while the queue is full, so a fast producer is held back by
+    its consumer instead of buffering everything in memory.
+    
+    Args:
+        queue: Queue feeding the next stage
+        items: Items to forward, sync or async iterable
+    """
+    if hasattr(items, '__aiter__'):
+        async for item in items:
+            await queue.put(item)
+    else:
+        for item in items:
+            await queue.put(item)
+    await queue.put(END)
+
+
+async def consume(queue: asyncio.Queue) -> AsyncIterator[Any]:
+    """
+    Iterate over the items of a queue until it is marked as finished.
+    
+    Args:
+        queue: Queue fed by the previous stage
+    
+    Returns:
+        Async iterator over the queued items
+    """
+    while True:
+        item = await queue.get()
+        if item is END:
+            return
+        yield item
+
+
+def chunks(items: Sequence[T], size: int) -> Iterable[List[T]]:
+    """
+    Split a sequence into lists of at most ``size`` items.
+    
+    Args:
+        items: Items to split
+        size: Maximum chunk size
+    
+    Returns:
+        Iterable of chunks
+    """
+    for start in range(0, len(items), size):
+        yield list(items[start:start + size])
+
+
+async def run_stages(*stages: Awaitable) -> List[Any]:
+    """
+    Run connected stages concurrently.
+    
+    If a stage fails the others are cancelled, so no stage is left waiting on
+    a queue that will never be fed or drained.
+    
+    Args:
+        stages: Stage coroutines
+    
+    Returns:
+        Results of the stages, in the given order
+    
+    Raises:
+        Exception: The first exception raised by a stage
+    """
+    tasks = [asyncio.ensure_future(stage) for stage in stages]
+    try:
+        done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        for task in done:
+            if task.exception() is not None:
+                raise task.exception()
+        return [task.result() for task in tasks]
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
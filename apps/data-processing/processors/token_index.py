@@ -0,0 +1,250 @@
+import logging
+import re
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from processors.keyword_matcher import KeywordMatcher, tokenize
+
+logger = logging.getLogger(__name__)
+
+# Cashtags such as $SOL name the token a tweet is about
+CASHTAG_PATTERN = re.compile(r'\$([A-Za-z][A-Za-z0-9]{1,9})\b')
+
+# Everyday and crypto-slang words that tokens also use as symbols or names,
+# they only count as cashtags, e.g. "the market is going to the moon"
+STOP_WORDS = frozenset({
+    'the', 'and', 'for', 'are', 'but', 'not', 'you', 'all', 'any', 'can', 'had', 'her', 'was',
+    'one', 'our', 'out', 'day', 'get', 'has', 'him', 'his', 'how', 'man', 'new', 'now', 'old',
+    'see', 'two', 'way', 'who', 'boy', 'did', 'its', 'let', 'put', 'say', 'she', 'too', 'use',
+    'just', 'like', 'this', 'that', 'with', 'have', 'from', 'they', 'will', 'what', 'when',
+    'your', 'more', 'time', 'some', 'than', 'them', 'then', 'only', 'over', 'also', 'back',
+    'after', 'first', 'well', 'even', 'want', 'because', 'good', 'best', 'next', 'real',
+    'love', 'life', 'world', 'free', 'game', 'money', 'cash', 'gold', 'king', 'baby', 'dog',
+    'cat', 'frog', 'fire', 'based', 'alpha', 'send', 'hold', 'long', 'open', 'play', 'live',
+    'moon', 'pump', 'dump', 'bull', 'bear', 'buy', 'sell', 'gem', 'gems', 'rug', 'ape',
+    'hodl', 'fomo', 'wagmi', 'ngmi', 'lfg', 'degen', 'chad', 'meme', 'coin', 'token',
+    'crypto', 'airdrop', 'launch', 'chart', 'price', 'market', 'trade', 'yes', 'wow', 'lol'
+})
+
+class TokenIndex:
+    """
+    Recognizes the tokens tweets are about.
+    
+    Tokens of the Raydium/DexScreener universe are registered with their mint
+    address and, when known, their symbol, name and liquidity. Symbols, names
+    and mint addresses are compiled into one word-level ``KeywordMatcher``
+    automaton, so a text is scanned once whatever the number of tokens.
+    Symbols and names only match as bare words for tokens with at least
+    ``min_liquidity`` of liquidity and when they are not ``STOP_WORDS``, so
+    everyday words do not hit low-cap tokens named after them. Cashtags are
+    looked up separately: they always count, even for symbols too short,
+    too common or unknown to be matched as bare words, and unknown cashtags
+    are reported as their uppercase symbol. A symbol or name shared by
+    several tokens points to the most liquid one, ties going to the lowest
+    address, so the choice does not depend on the order of registration.
+    """
+    
+    def __init__(self,
+                 tokens: Iterable[Dict[str, Any]] = (),
+                 min_symbol_length: int = 3,
+                 min_liquidity: float = 0.0):
+        """
+        Initialize the index.
+        
+        Args:
+            tokens: Token dictionaries with an 'address' and optional 'symbol',
+                'name' and 'liquidity_usd'
+            min_symbol_length: Shortest symbol matched without a leading '$'
+            min_liquidity: Least liquidity in USD of tokens whose symbol and
+                name are matched without a leading '$'
+        """
+        self.min_symbol_length = min_symbol_length
+        self.min_liquidity = min_liquidity
+        self.tokens: Dict[str, Dict[str, Any]] = {}
+        self.symbols: Dict[str, str] = {}
+        self.aliases: Dict[str, str] = {}
+        self._matcher: Optional[KeywordMatcher] = None
+        self._lock = threading.Lock()
+        self.add_many(tokens)
+    
+    def __len__(self) -> int:
+        return len(self.tokens)
+    
+    def add(self,
+            address: str,
+            symbol: Optional[str] = None,
+            name: Optional[str] = None,
+            liquidity_usd: Optional[float] = None):
+        """
+        Register a token.
+        
+        Args:
+            address: Mint address identifying the token
+            symbol: Ticker symbol, e.g. 'SOL'
+            name: Token name, e.g. 'Wrapped SOL'
+            liquidity_usd: Liquidity in USD, e.g. from DexScreener
+        """
+        self.add_many([{'address': address, 'symbol': symbol, 'name': name, 'liquidity_usd': liquidity_usd}])
+    
+    def add_many(self, tokens: Iterable[Dict[str, Any]], rebuild: bool = True):
+        """
+        Register tokens, or update the symbol, name and liquidity of known ones.
+        
+        Compiling the automaton costs time linear in the whole universe, so
+        callers registering it in batches pass ``rebuild=False`` and call
+        ``rebuild`` once at the end; until then lookups keep using the
+        previous automaton.
+        
+        Args:
+            tokens: Token dictionaries with an 'address' and optional 'symbol',
+                'name' and 'liquidity_usd'
+            rebuild: Recompile the automaton on the next lookup
+        """
+        with self._lock:
+            changed = False
+            for token in tokens:
+                address = token.get('address')
+                if not address:
+                    continue
+                if address not in self.tokens:
+                    self.tokens[address] = {'symbol': '', 'name': '', 'liquidity': 0.0}
+                    changed = True
+                entry = self.tokens[address]
+                previous = dict(entry)
+                if token.get('symbol'):
+                    entry['symbol'] = token['symbol'].upper()
+                if token.get('name'):
+                    entry['name'] = token['name']
+                if token.get('liquidity_usd') is not None:
+                    entry['liquidity'] = float(token['liquidity_usd'])
+                changed = changed or entry != previous
+            
+            # The automaton is rebuilt on the next lookup
+            if changed and rebuild:
+                self._matcher = None
+    
+    def rebuild(self):
+        """Compile the automaton over the aliases of every registered token."""
+        with self._lock:
+            self._matcher = self._compile()
+    
+    def _compile(self) -> KeywordMatcher:
+        """Resolve symbols and aliases and compile the automaton, called with the lock held."""
+        # Most liquid token first, ties by address, so shared aliases resolve deterministically
+        ranked = sorted(self.tokens.items(), key=lambda item: (-item[1]['liquidity'], item[0]))
+        
+        symbols: Dict[str, str] = {}
+        aliases: Dict[str, str] = {}
+        for address, token in ranked:
+            if token['symbol']:
+                symbols.setdefault(token['symbol'], address)
+            
+            candidates = [address]
+            if token['liquidity'] >= self.min_liquidity:
+                candidates.append(token['name'])
+                if len(token['symbol']) >= self.min_symbol_length:
+                    candidates.append(token['symbol'])
+            for alias in candidates:
+                alias = ' '.join(tokenize(alias))
+                if alias and alias not in STOP_WORDS:
+                    aliases.setdefault(alias, address)
+        
+        groups: Dict[str, List[str]] = {}
+        for alias, address in aliases.items():
+            groups.setdefault(address, []).append(alias)
+        
+        self.symbols, self.aliases = symbols, aliases
+        return KeywordMatcher(groups)
+    
+    @property
+    def matcher(self) -> KeywordMatcher:
+        """Automaton over the aliases of the registered tokens, compiled on first use."""
+        matcher = self._matcher
+        if matcher is None:
+            with self._lock:
+                if self._matcher is None:
+                    self._matcher = self._compile()
+                matcher = self._matcher
+        return matcher
+    
+    def extract(self, text: str) -> List[str]:
+        """
+        Find the tokens a text mentions.
+        
+        Args:
+            text: Text to scan
+        
+        Returns:
+            Addresses of the mentioned tokens, or uppercase symbols for unknown
+            cashtags, without duplicates, cashtags first
+        """
+        if not isinstance(text, str):
+            return []
+        
+        matcher = self.matcher
+        symbols = self.symbols
+        tokens = [symbols.get(tag.upper(), tag.upper()) for tag in CASHTAG_PATTERN.findall(text)]
+        tokens.extend(matcher.keyword_groups[keyword][0] for keyword in matcher.find(text))
+        return list(dict.fromkeys(tokens))
+    
+    def extract_many(self, texts: Iterable[str]) -> List[List[str]]:
+        """
+        Find the tokens of several texts.
+        
+        Args:
+            texts: Texts to scan
+        
+        Returns:
+            Tokens of each text, as returned by ``extract``
+        """
+        return [self.extract(text) for text in texts]
+    
+    def index(self, documents: Iterable[Tuple[Any, str]]) -> Dict[str, List[Any]]:
+        """
+        Build an inverted index from tokens to the documents mentioning them.
+        
+        Args:
+            documents: (document id, text) pairs, e.g. tweet ids and texts
+        
+        Returns:
+            Document ids by token, in the order of the documents
+        """
+        inverted: Dict[str, List[Any]] = {}
+        for document_id, text in documents:
+            for token in self.extract(text):
+                inverted.setdefault(token, []).append(document_id)
+        return inverted
+    
+    def index_tweets(self, tweets: Iterable[Dict[str, Any]]) -> Dict[str, List[Any]]:
+        """
+        Build an inverted index from tokens to tweet ids.
+        
+        Args:
+            tweets: Tweet dictionaries with 'id' and 'text'
+        
+        Returns:
+            Tweet ids by token
+        """
+        return self.index((tweet['id'], tweet['text']) for tweet in tweets)
+    
+    def slices(self, frame: pd.DataFrame, text_column: str = 'text') -> Dict[str, pd.DataFrame]:
+        """
+        Split a tweet DataFrame into the rows of every token in one pass.
+        
+        A row mentioning several tokens belongs to each of their slices.
+        
+        Args:
+            frame: Tweets with a text column
+            text_column: Name of the text column
+        
+        Returns:
+            Rows by token
+        """
+        positions = self.index(enumerate(frame[text_column].tolist()))
+        return {
+            token: frame.iloc[np.asarray(rows, dtype=int)]
+            for token, rows in positions.items()
+        }
@@ -1,6 +1,7 @@
 import logging
 from typing import Any, Dict, List, Set
 import re
+from processors.keyword_matcher import KeywordMatcher
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +16,25 @@ class DataValidator:
             'defi', 'nft', 'solana', 'sol', 'trading', 'market', 'price',
             'bull', 'bear', 'buy', 'sell', 'long', 'short', 'hodl', 'moon'
         }
+        self.trading_actions: Set[str] = {'buy', 'sell', 'long', 'short'}
+        
+        # Keywords only match whole words, so their inflected forms are listed too
+        self.trading_actions |= {
+            'buys', 'buying', 'bought', 'sells', 'selling', 'sold',
+            'longs', 'longing', 'shorts', 'shorting', 'shorted'
+        }
+        self.crypto_keywords |= self.trading_actions | {
+            'bitcoins', 'cryptos', 'cryptocurrency', 'cryptocurrencies', 'tokens',
+            'blockchains', 'nfts', 'trade', 'trades', 'trader', 'traders', 'markets',
+            'prices', 'bulls', 'bullish', 'bears', 'bearish', 'hodling', 'hodler',
+            'hodlers', 'mooning'
+        }
+        
+        # All keywords of a text are found in one scan
+        self.matcher = KeywordMatcher({
+            'crypto': self.crypto_keywords,
+            'action': self.trading_actions
+        })
         
     def validate_tweet(self, tweet: Dict[str, Any]) -> bool:
         """
@@ -40,7 +60,7 @@ class DataValidator:
                 return False
                 
             # Check for crypto relevance
-            if not any(keyword in text for keyword in self.crypto_keywords):
+            if not self.matcher.match(text)['crypto']:
                 logger.warning(f"Tweet not crypto-related: {tweet['id']}")
                 return False
                 
@@ -137,13 +157,13 @@ class DataValidator:
                 logger.warning(f"Empty forum call content: {call['post_id']}")
                 return False
                 
-            # Check for trading action
-            if not any(action in content for action in ['buy', 'sell', 'long', 'short']):
+            # Check for trading action and asset mention
+            matches = self.matcher.match(content)
+            if not matches['action']:
                 logger.warning(f"No trading action in forum call: {call['post_id']}")
                 return False
                 
-            # Check for asset mention
-            if not any(keyword in content for keyword in self.crypto_keywords):
+            if not matches['crypto']:
                 logger.warning(f"No asset mentioned in forum call: {call['post_id']}")
                 return False
                 
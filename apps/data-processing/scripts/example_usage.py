@@ -1,7 +1,17 @@
 import pandas as pd
 import json
 import os
-from signal_aggregator import SignalAggregator
+from processors.signal_aggregator import SignalAggregator
+from processors.token_index import TokenIndex
+
+# Assets recognized in the tweets, by symbol or name
+ASSETS = [
+    {'address': 'BTC', 'symbol': 'BTC', 'name': 'Bitcoin'},
+    {'address': 'ETH', 'symbol': 'ETH', 'name': 'Ethereum'},
+    {'address': 'CRYPTO_MARKET', 'name': 'crypto'},
+    {'address': 'CRYPTO_MARKET', 'name': 'token'},
+    {'address': 'CRYPTO_MARKET', 'name': 'coin'}
+]
 
 def run_examples():
     """
@@ -30,11 +40,11 @@ def run_examples():
             'user': ['user1', 'user2', 'user3', 'user4']
         })
     
-    # Filter data for different assets
-    # For this example, we'll use simple keyword filtering
-    btc_data = x_data[x_data['text'].str.contains('BTC|Bitcoin|bitcoin', case=False, na=False)]
-    eth_data = x_data[x_data['text'].str.contains('ETH|Ethereum|ethereum', case=False, na=False)]
-    crypto_general = x_data[x_data['text'].str.contains('crypto|token|coin', case=False, na=False)]
+    # Split the tweets by the assets they mention in one pass
+    slices = TokenIndex(ASSETS).slices(x_data)
+    btc_data = slices.get('BTC', x_data.iloc[:0])
+    eth_data = slices.get('ETH', x_data.iloc[:0])
+    crypto_general = slices.get('CRYPTO_MARKET', x_data.iloc[:0])
     
     print(f"Found {len(btc_data)} BTC related tweets")
     print(f"Found {len(eth_data)} ETH related tweets")
@@ -1,17 +1,78 @@
+import logging
+import os
+import sys
+import threading
+import yaml
 from flask import Flask, request, jsonify
 
+# Make the processors package importable when run as a plain script
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from processors.micro_batcher import MicroBatcher, load_serving_config
+from processors.sentiment import create_analyzer
+
+logger = logging.getLogger(__name__)
+
 app = Flask(__name__)
 
+# Configuration shared with the pipeline
+CONFIG_PATH = os.environ.get("PIPELINE_CONFIG", "config/pipeline.yaml")
+serving_config = load_serving_config(CONFIG_PATH)
+
+# Concurrent requests are scored together through the backend's batch path
+_batcher = None
+_batcher_lock = threading.Lock()
+
+def load_sentiment_config() -> dict:
+    """Read the sentiment settings, falling back to keyword matching without a configuration."""
+    try:
+        with open(CONFIG_PATH, 'r') as f:
+            return (yaml.safe_load(f) or {})['sentiment']
+    except (FileNotFoundError, KeyError):
+        logger.warning(f"No sentiment settings in {CONFIG_PATH}, using keyword matching")
+        return {'backend': 'keyword'}
+
+def get_batcher() -> MicroBatcher:
+    """Return the request batcher, loading the analyzer and starting its worker on first use."""
+    global _batcher
+    with _batcher_lock:
+        if _batcher is None:
+            analyzer = create_analyzer(load_sentiment_config())
+            _batcher = MicroBatcher(
+                lambda texts: analyzer.analyze_batch(texts).to_dicts(),
+                max_batch_size=serving_config['max_batch_size'],
+                max_wait_ms=serving_config['max_wait_ms']
+            )
+        return _batcher
+
 @app.route('/nlp/analyze', methods=['POST'])
 def analyze_text():
     """
-    Placeholder endpoint for NLP processing.
+    Analyze the sentiment of one text.
     Expects JSON payload: {"text": "sample text"}
     """
     data = request.get_json()
+    if not data:
+        return jsonify({"error": "Invalid JSON payload"}), 400
     text = data.get("text", "")
-    # Placeholder response
-    return jsonify({"message": "NLP processing not implemented yet", "input_text": text})
+    return jsonify({"input_text": text, "sentiment": get_batcher().analyze(text)})
+
+@app.route('/nlp/analyze/batch', methods=['POST'])
+def analyze_texts():
+    """
+    Analyze the sentiment of several texts.
+    Expects JSON payload: {"texts": ["sample text", ...]}
+    """
+    data = request.get_json()
+    texts = data.get("texts") if data else None
+    if not isinstance(texts, list) or not all(isinstance(text, str) for text in texts):
+        return jsonify({"error": "Expected a list of texts"}), 400
+    if len(texts) > serving_config['max_request_texts']:
+        return jsonify({"error": "Too many texts in one request"}), 400
+    return jsonify({"results": [
+        {"input_text": text, "sentiment": result}
+        for text, result in zip(texts, get_batcher().analyze_many(texts))
+    ]})
 
 if __name__ == '__main__':
-    app.run(debug=True, port=5000)
+    app.run(debug=True, threaded=True, port=5000)
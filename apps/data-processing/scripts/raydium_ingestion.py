@@ -2,12 +2,17 @@
 
 
 import os
-import json
+import sys
 import requests
 import psycopg2
 
 from dotenv import load_dotenv
 
+# Make the clients package importable when run as a plain script
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from clients.json_stream import iter_json_array
+
 
 load_dotenv()
 
@@ -29,28 +34,41 @@ DB_PARAMS = {
 # Raydium API Endpoint for Pools
 RAYDIUM_POOLS_API = "https://api.raydium.io/v2/ammV3/ammPools"
 
+# Rows written per round-trip and per transaction
+BATCH_SIZE = 500
+
 
 session = requests.Session()
 session.headers.update({"Connection": "close"})
 
 
 def fetch_raydium_pools():
-    '''Function to fetch liquidity pool data'''
-    try:
-        with session.get(RAYDIUM_POOLS_API, stream= True, timeout=30) as response:
-            response.raise_for_status()
-            data_chunks = []
-            for chunk in response.iter_content(chunk_size=8192):
-                data_chunks.append(chunk)
-            full_data = b"".join(data_chunks)  # Get the main liquidity pools
-            return json.loads(full_data).get("data", [])
-    except requests.exceptions.RequestException as e:
-        print("Error fetching Raydium data:", e)
-        return []
+    '''Function to stream liquidity pool data, yielding pools as they arrive.
+    Raises RequestException if the download fails, ValueError if Raydium reports
+    failure or the JSON ends before the pool list is complete'''
+    with session.get(RAYDIUM_POOLS_API, stream= True, timeout=30) as response:
+        response.raise_for_status()
+        for pool in iter_json_array(response.iter_content(chunk_size=65536), "data", success_key="success"):
+            if "id" in pool and "mintA" in pool and "mintB" in pool:
+                yield pool
+
+
+def write_batch(cur, batch):
+    '''Upsert a batch of pool rows, returns the number of rows'''
+    # Insert data, update if duplicate
+    cur.executemany("""
+        INSERT INTO raydium_liquidity (pool_id, mintA, mintB, liquidity, price)
+        VALUES (%s, %s, %s, %s, %s)
+        ON CONFLICT (pool_id) DO UPDATE
+        SET liquidity = EXCLUDED.liquidity, price = EXCLUDED.price, timestamp = CURRENT_TIMESTAMP;
+    """, batch)
+    return len(batch)
 
 
 def store_market_data(pool_data):
-    '''# Function to store data in PostgreSQL'''
+    '''# Function to store data in PostgreSQL, returns whether every pool was stored'''
+    conn = None
+    stored = 0
     try:
         conn = psycopg2.connect(**DB_PARAMS)
         cur = conn.cursor()
@@ -68,31 +86,35 @@ def store_market_data(pool_data):
             )
         """)
 
+        conn.commit()
+        
+        # Consume the pools as they stream in, writing them in batches
+        batch = []
         for pool in pool_data:
-            pool_id = pool["id"]
-            mintA = pool["mintA"]
-            mintB = pool["mintB"]
-            liquidity = pool.get("tvl", 0)
-            price = pool.get("price", 0)
-
-            # Insert data, ignore if duplicate
-            cur.execute("""
-                INSERT INTO raydium_liquidity (pool_id, mintA, mintB, liquidity, price)
-                VALUES (%s, %s, %s, %s, %s)
-                ON CONFLICT (pool_id) DO UPDATE
-                SET liquidity = EXCLUDED.liquidity, price = EXCLUDED.price, timestamp = CURRENT_TIMESTAMP;
-            """, (pool_id, mintA, mintB, liquidity, price))
+            batch.append((pool["id"], pool["mintA"], pool["mintB"], pool.get("tvl", 0), pool.get("price", 0)))
+            if len(batch) >= BATCH_SIZE:
+                stored += write_batch(cur, batch)
+                conn.commit()
+                batch = []
+        if batch:
+            stored += write_batch(cur, batch)
 
         conn.commit()
         cur.close()
-        conn.close()
-        print("✅ Market data stored successfully.")
+        print(f"✅ Market data stored successfully ({stored} pools).")
+        return True
 
+    except (requests.exceptions.RequestException, ValueError) as e:
+        # Earlier batches are committed, the one in progress is rolled back on close
+        print(f"❌ Error fetching Raydium data, ingest incomplete ({stored} pools stored):", e)
     except psycopg2.Error as e:
-        print("❌ Database error:", e)
+        print(f"❌ Database error, ingest incomplete ({stored} pools stored):", e)
+    finally:
+        if conn is not None:
+            conn.close()
+    return False
 
 if __name__ == "__main__":
-    pools = fetch_raydium_pools()
-    if pools:
-        store_market_data(pools)
+    if not store_market_data(fetch_raydium_pools()):
+        sys.exit(1)
  
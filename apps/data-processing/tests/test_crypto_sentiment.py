@@ -0,0 +1,49 @@
+import unittest
+import pandas as pd
+from processors.sentiment_analysis import CryptoSentimentAnalyzer
+
+class TestCryptoSentimentAnalyzer(unittest.TestCase):
+    """Test cases for the columnar DataFrame analysis."""
+    
+    def setUp(self):
+        self.analyzer = CryptoSentimentAnalyzer()
+        self.tweets = pd.DataFrame({
+            'text': [
+                'Bullish! Buy the dip, gains gains gains',
+                'Scam alert: rug pull, sell now',
+                'GM frens',
+                None,
+                'Good project, bad timing. Hold or sell?'
+            ],
+            'author_id': ['1', '2', '1', '3', '2']
+        }, index=[10, 20, 30, 40, 50])
+        
+    def test_dataframe_matches_single_tweets(self):
+        """Test that whole-column analysis agrees with per-tweet analysis."""
+        results = self.analyzer.analyze_dataframe(self.tweets)
+        self.assertEqual(list(results.index), list(range(5)))
+        
+        for row, text in zip(results.itertuples(), self.tweets['text'].fillna('')):
+            expected = self.analyzer.analyze_tweet(text)
+            self.assertEqual(row.sentiment, expected['sentiment'])
+            self.assertEqual(row.score, expected['score'])
+            self.assertEqual(row.positive_count, expected['keywords_found']['positive'])
+            self.assertEqual(row.negative_count, expected['keywords_found']['negative'])
+            self.assertEqual(row.positive_keywords, list(expected['keywords_found']['positive_matches']))
+            self.assertEqual(row.negative_keywords, list(expected['keywords_found']['negative_matches']))
+            
+    def test_batch_matches_single_tweets(self):
+        """Test that batch analysis returns the per-tweet results in order."""
+        texts = self.tweets['text'].fillna('').tolist()
+        self.assertEqual(self.analyzer.analyze_tweets(texts), [self.analyzer.analyze_tweet(text) for text in texts])
+        self.assertEqual(self.analyzer.analyze_tweets([]), [])
+    
+    def test_summary(self):
+        """Test sentiment distribution and top keywords of the summary."""
+        summary = self.analyzer.generate_sentiment_summary(self.analyzer.analyze_dataframe(self.tweets))
+        self.assertEqual(summary['sentiment_distribution'], {'positive': 1, 'negative': 1, 'neutral': 3})
+        self.assertEqual(summary['top_negative_keywords'], {'sell': 2, 'scam': 1, 'dip': 1, 'bad': 1})
+        self.assertEqual(list(summary['top_positive_keywords'])[:2], ['bullish', 'buy'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+import asyncio
+import unittest
+from unittest.mock import patch
+from clients.dex_screener_client import DexScreenerClient
+
+SOL = 'So11111111111111111111111111111111111111112'
+USDC = 'EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v'
+BONK = 'DezXAZ8z7PnrnRJjz3wXBoRgixCa6xjnB7YaB1pPB263'
+
+def make_pair(base, quote, volume=1000, liquidity=5000, price='1.5'):
+    """Build a DexScreener pair between two tokens."""
+    return {
+        'chainId': 'solana',
+        'dexId': 'raydium',
+        'baseToken': {'address': base, 'symbol': base[:4].upper(), 'name': base[:4]},
+        'quoteToken': {'address': quote, 'symbol': quote[:4].upper(), 'name': quote[:4]},
+        'priceUsd': price,
+        'volume': {'h24': volume},
+        'liquidity': {'usd': liquidity},
+        'priceChange': {'h24': 2.0}
+    }
+
+class TestDexScreenerClient(unittest.TestCase):
+    """Test cases for batched DexScreener token requests."""
+    
+    def setUp(self):
+        """Set up client."""
+        self.client = DexScreenerClient({'endpoint': 'https://api.dexscreener.com/latest', 'batch_size': 2})
+    
+    def test_chunk_addresses(self):
+        """Test that addresses are deduplicated and split into provider-sized chunks."""
+        self.assertEqual(self.client._chunk_addresses([SOL, USDC, SOL, BONK]), [[SOL, USDC], [BONK]])
+        self.assertEqual(self.client._chunk_addresses([]), [])
+        self.assertEqual(DexScreenerClient({'endpoint': '', 'batch_size': 100}).batch_size, 30)
+    
+    def test_split_token_metrics(self):
+        """Test that pairs go to every requested token on either side, matched case-insensitively."""
+        response = {'pairs': [
+            make_pair(SOL, USDC, volume=1000),
+            make_pair(BONK.lower(), SOL, volume=200),
+            make_pair('other', 'another')
+        ]}
+        metrics = self.client._split_token_metrics([SOL, BONK, USDC.lower()], response)
+        
+        self.assertEqual(list(metrics), [SOL, BONK, USDC.lower()])
+        self.assertEqual(metrics[SOL]['pairs_count'], 2)
+        self.assertEqual(metrics[SOL]['volume_24h'], 1200)
+        self.assertEqual(metrics[SOL]['symbol'], 'SO11')
+        self.assertEqual(metrics[BONK]['pairs_count'], 1)
+        self.assertEqual(metrics[USDC.lower()]['symbol'], 'EPJF')
+        
+        # A pair with the same token on both sides counts once, tokens without pairs are left out
+        metrics = self.client._split_token_metrics([SOL, 'missing'], {'pairs': [make_pair(SOL, SOL.lower())]})
+        self.assertEqual(list(metrics), [SOL])
+        self.assertEqual(metrics[SOL]['pairs_count'], 1)
+    
+    def test_sync_skips_failed_chunk(self):
+        """Test that a failing chunk is skipped and the other chunks are kept."""
+        responses = [RuntimeError("provider down"), {'pairs': [make_pair(BONK, 'other')]}]
+        with patch.object(DexScreenerClient, '_make_request', side_effect=responses) as request:
+            metrics = self.client.get_tokens_metrics([SOL, USDC, BONK])
+        
+        self.assertEqual(list(metrics), [BONK])
+        self.assertEqual(request.call_args_list[0].kwargs['url'], f'https://api.dexscreener.com/latest/tokens/{SOL},{USDC}')
+    
+    def test_async_skips_failed_chunk(self):
+        """Test that the async batch fetch skips failing chunks the same way."""
+        async def fake_request(method, url):
+            if SOL in url:
+                raise RuntimeError("provider down")
+            return {'pairs': [make_pair(BONK, 'other')]}
+        
+        with patch.object(DexScreenerClient, '_make_request_async', side_effect=fake_request):
+            metrics = asyncio.run(self.client.get_tokens_metrics_async([SOL, USDC, BONK]))
+        
+        self.assertEqual(list(metrics), [BONK])
+
+if __name__ == '__main__':
+    unittest.main()
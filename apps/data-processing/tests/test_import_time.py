@@ -0,0 +1,45 @@
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+# Heavy frameworks that only the model backends may load
+HEAVY_MODULES = ['tensorflow', 'transformers', 'torch', 'keras', 'onnxruntime']
+
+# Generous wall-clock budget for importing the pipeline's sentiment module
+IMPORT_BUDGET_SECONDS = 3.0
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import processors.sentiment as sentiment
+elapsed = time.perf_counter() - start
+for backend in ('vader', 'keyword'):
+    sentiment.create_analyzer({'backend': backend})
+print(json.dumps({
+    'elapsed': elapsed,
+    'loaded': [name for name in %r if name in sys.modules]
+}))
+""" % (HEAVY_MODULES,)
+
+class TestImportTime(unittest.TestCase):
+    """Test that lightweight sentiment backends stay lightweight to import."""
+    
+    def test_light_backends_skip_heavy_frameworks(self):
+        """Test import time and loaded modules in a fresh interpreter."""
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        output = subprocess.run(
+            [sys.executable, '-c', PROBE],
+            cwd=root,
+            capture_output=True,
+            text=True,
+            check=True
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        
+        self.assertEqual(result['loaded'], [])
+        self.assertLess(result['elapsed'], IMPORT_BUDGET_SECONDS)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+import json
+import random
+import unittest
+from clients.json_stream import JSONArrayStream, iter_json_array
+
+class TestJSONArrayStream(unittest.TestCase):
+    """Test cases for the incremental JSON array parser."""
+    
+    def setUp(self):
+        """Set up a payload with strings and nesting that look like structure."""
+        self.payload = {
+            'success': True,
+            'msg': 'a "data" value with {[ brackets',
+            'meta': {'data': [1, 2]},
+            'data': [
+                {'id': 'pool\\1"}]', 'nested': {'a': [1, {'b': ']]'}]}, 'tvl': 1.5},
+                {'id': 'pool2', 'data': [{'price': 0.1}]},
+                [1, 2, ']']
+            ],
+            'after': {'data': [3]}
+        }
+        self.raw = json.dumps(self.payload).encode('utf-8')
+    
+    def _split(self, cuts):
+        bounds = [0] + cuts + [len(self.raw)]
+        return [self.raw[start:end] for start, end in zip(bounds, bounds[1:])]
+    
+    def test_fixed_chunk_sizes(self):
+        """Test that items are recovered whatever the chunk size."""
+        for size in (1, 2, 3, 7, 64, len(self.raw)):
+            chunks = [self.raw[i:i + size] for i in range(0, len(self.raw), size)]
+            self.assertEqual(list(iter_json_array(chunks)), self.payload['data'])
+    
+    def test_random_chunk_boundaries(self):
+        """Test chunk boundaries falling inside strings and escapes."""
+        rng = random.Random(42)
+        for _ in range(100):
+            cuts = sorted(rng.sample(range(1, len(self.raw)), 12))
+            self.assertEqual(list(iter_json_array(self._split(cuts))), self.payload['data'])
+    
+    def test_items_yielded_before_end(self):
+        """Test that an item is available as soon as its bytes have arrived."""
+        parser = JSONArrayStream('data')
+        first_end = self.raw.index(b'"tvl": 1.5}') + len(b'"tvl": 1.5}')
+        items = parser.feed(self.raw[:first_end])
+        self.assertEqual(items, [self.payload['data'][0]])
+        self.assertFalse(parser.done)
+        
+        parser.feed(self.raw[first_end:])
+        self.assertTrue(parser.done)
+    
+    def test_missing_key(self):
+        """Test that a payload without the key is reported instead of yielding nothing."""
+        with self.assertRaises(ValueError):
+            list(iter_json_array([b'{"success": true, "msg": "error"}']))
+    
+    def test_truncated_payload(self):
+        """Test that a body cut off inside the array raises after the complete items."""
+        items = []
+        with self.assertRaises(ValueError):
+            for item in iter_json_array([b'{"data": [{"id":1},{"id":2}', b',{"id":']):
+                items.append(item)
+        self.assertEqual(items, [{'id': 1}, {'id': 2}])
+    
+    def test_reported_failure(self):
+        """Test that a false success flag raises before any item, whatever the chunking."""
+        raw = b'{"id": "x", "success" : false , "data": [{"id": 1}]}'
+        for size in (1, 5, len(raw)):
+            chunks = [raw[i:i + size] for i in range(0, len(raw), size)]
+            with self.assertRaises(ValueError):
+                list(iter_json_array(chunks, success_key='success'))
+        with self.assertRaises(ValueError):
+            list(iter_json_array([b'{"success": false}'], success_key='success'))
+        
+        # Without a success key only the scalars are recorded
+        parser = JSONArrayStream('data')
+        self.assertEqual(parser.feed(raw), [{'id': 1}])
+        self.assertEqual(parser.fields, {'success': False})
+        
+        parser = JSONArrayStream('data', success_key='success')
+        self.assertEqual(parser.feed(self.raw), self.payload['data'])
+        self.assertEqual(parser.fields, {'success': True})
+
+if __name__ == '__main__':
+    unittest.main()
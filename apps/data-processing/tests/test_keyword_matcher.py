@@ -0,0 +1,68 @@
+import unittest
+from processors.keyword_matcher import KeywordMatcher
+from processors.validation import DataValidator
+
+class TestKeywordMatcher(unittest.TestCase):
+    """Test cases for the multi-group keyword matcher."""
+    
+    def setUp(self):
+        self.matcher = KeywordMatcher({
+            'crypto': ['sol', 'btc', 'crypto news', 'news'],
+            'action': ['buy', 'sell'],
+            'positive': ['buy the dip', 'moon']
+        })
+        
+    def test_word_boundaries(self):
+        """Test that keywords never match inside words."""
+        self.assertEqual(self.matcher.find('Solana buyers console'), [])
+        self.assertEqual(self.matcher.find('$SOL to the #moon, buy!'), ['sol', 'moon', 'buy'])
+        
+    def test_overlapping_phrases(self):
+        """Test that phrases and the keywords inside them are all found."""
+        self.assertEqual(
+            self.matcher.find('crypto news: buy the dip'),
+            ['crypto news', 'news', 'buy', 'buy the dip']
+        )
+        self.assertEqual(self.matcher.find('crypto crypto news'), ['crypto news', 'news'])
+        
+    def test_match_groups(self):
+        """Test that counts are reported for every group in one pass."""
+        matches = self.matcher.match('buy BTC, buy SOL')
+        self.assertEqual(matches, {
+            'crypto': {'btc': 1, 'sol': 1},
+            'action': {'buy': 2},
+            'positive': {}
+        })
+        self.assertEqual(self.matcher.match_many(['', 'sell']), [
+            {'crypto': {}, 'action': {}, 'positive': {}},
+            {'crypto': {}, 'action': {'sell': 1}, 'positive': {}}
+        ])
+        
+    def test_validator_uses_word_boundaries(self):
+        """Test crypto relevance and trading action checks of the validator."""
+        validator = DataValidator()
+        tweet = {'id': '1', 'author_id': 'a', 'created_at': '2024-01-01T00:00:00Z'}
+        self.assertTrue(validator.validate_tweet({**tweet, 'text': 'Loading up on $ETH'}))
+        self.assertFalse(validator.validate_tweet({**tweet, 'text': 'Something smells off'}))
+        
+        call = {'post_id': '1', 'author': 'a', 'timestamp': '2024-01-01T00:00:00Z'}
+        self.assertTrue(validator.validate_forum_call({**call, 'content': 'Long BTC here'}))
+        self.assertFalse(validator.validate_forum_call({**call, 'content': 'Shortlist of BTC pools'}))
+        
+    def test_validator_inflections(self):
+        """Test that inflected keywords, which substring matching used to catch, still match."""
+        validator = DataValidator()
+        tweet = {'id': '1', 'author_id': 'a', 'created_at': '2024-01-01T00:00:00Z'}
+        for text in [
+            'New tokens launching on Raydium', 'Cryptocurrency adoption grows', 'Markets look shaky',
+            'Feeling bullish today', 'NFTs are back', 'Everyone is buying'
+        ]:
+            self.assertTrue(validator.validate_tweet({**tweet, 'text': text}), text)
+        
+        call = {'post_id': '1', 'author': 'a', 'timestamp': '2024-01-01T00:00:00Z'}
+        self.assertTrue(validator.validate_forum_call({**call, 'content': 'Buying more tokens'}))
+        self.assertTrue(validator.validate_forum_call({**call, 'content': 'Shorting ETH'}))
+        self.assertFalse(validator.validate_forum_call({**call, 'content': 'Watching the markets'}))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import threading
+import unittest
+from processors.micro_batcher import MicroBatcher
+
+class TestMicroBatcher(unittest.TestCase):
+    """Test cases for coalescing concurrent requests into batches."""
+    
+    def test_concurrent_requests_share_batches(self):
+        """Test that concurrent texts are scored together and in order."""
+        sizes = []
+        
+        def batch_fn(texts):
+            sizes.append(len(texts))
+            return [text.upper() for text in texts]
+        
+        batcher = MicroBatcher(batch_fn, max_batch_size=8, max_wait_ms=50)
+        results = {}
+        
+        def request(index):
+            results[index] = batcher.analyze(f'text {index}', timeout=5)
+        
+        threads = [threading.Thread(target=request, args=(index,)) for index in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        batcher.close()
+        
+        self.assertEqual(results, {index: f'TEXT {index}' for index in range(20)})
+        self.assertEqual(sum(sizes), 20)
+        self.assertLessEqual(max(sizes), 8)
+        self.assertLess(len(sizes), 20)
+        
+    def test_analyze_many_keeps_order(self):
+        """Test that a bulk request gets one result per text in order."""
+        batcher = MicroBatcher(lambda texts: [len(text) for text in texts], max_batch_size=3)
+        self.assertEqual(batcher.analyze_many(['a', 'bb', 'ccc', 'dddd', ''], timeout=5), [1, 2, 3, 4, 0])
+        batcher.close()
+        
+    def test_errors_reach_every_request_of_the_batch(self):
+        """Test that a failing batch fails its requests and the worker keeps going."""
+        def batch_fn(texts):
+            if 'bad' in texts:
+                raise RuntimeError("model failed")
+            return texts
+        
+        batcher = MicroBatcher(batch_fn, max_batch_size=1)
+        with self.assertRaises(RuntimeError):
+            batcher.analyze('bad', timeout=5)
+        self.assertEqual(batcher.analyze('good', timeout=5), 'good')
+        batcher.close()
+        
+        with self.assertRaises(RuntimeError):
+            batcher.submit('late')
+        
+    def test_missing_results_fail_the_batch(self):
+        """Test that a batch function returning too few results fails its requests."""
+        batcher = MicroBatcher(lambda texts: texts[1:], max_batch_size=2, max_wait_ms=50)
+        futures = [batcher.submit('a'), batcher.submit('b')]
+        for future in futures:
+            with self.assertRaises(RuntimeError):
+                future.result(timeout=5)
+        batcher.close()
+        
+    def test_invalid_settings(self):
+        """Test that non-positive batch sizes and negative waits are rejected."""
+        with self.assertRaises(ValueError):
+            MicroBatcher(list, max_batch_size=0)
+        with self.assertRaises(ValueError):
+            MicroBatcher(list, max_wait_ms=-1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,297 @@
+import asyncio
+import time
+import unittest
+from datetime import datetime, timezone
+from models.storage import Storage
+from processors.pipeline import Pipeline
+from processors.profitability import ProfitabilityCalculator
+from processors.sentiment_rollup import SentimentRollup
+from processors.signal_aggregator import SignalAggregator
+from processors.token_index import TokenIndex
+from processors.validation import DataValidator
+
+SOL = 'So11111111111111111111111111111111111111112'
+BONK = 'DezXAZ8z7PnrnRJjz3wXBoRgixCa6xjnB7YaB1pPB263'
+
+class FakeRedis:
+    """In-memory stand-in for the Redis commands used by Storage."""
+    
+    def __init__(self):
+        self.values = {}
+        self.hashes = {}
+    
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+    
+    def set(self, key, value, ex=None):
+        self.values[key] = value
+    
+    def delete(self, key):
+        self.values.pop(key, None)
+        self.hashes.pop(key, None)
+    
+    def hset(self, key, mapping):
+        self.hashes.setdefault(key, {}).update(mapping)
+    
+    def hdel(self, key, *fields):
+        for field in fields:
+            self.hashes.get(key, {}).pop(field, None)
+    
+    def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+    
+    def expire(self, key, ttl):
+        pass
+
+class FakePipeline:
+    """Queues commands and runs them on execute, like a Redis pipeline."""
+    
+    def __init__(self, redis_client):
+        self.redis_client = redis_client
+        self.commands = []
+    
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self.commands.append((name, args, kwargs))
+    
+    def execute(self):
+        return [getattr(self.redis_client, name)(*args, **kwargs) for name, args, kwargs in self.commands]
+
+class FakeStorage(Storage):
+    """Storage with a fake Redis client that records Postgres signal writes."""
+    
+    def __init__(self):
+        super().__init__({'postgres': {}, 'redis': {}})
+        self.redis_client = FakeRedis()
+        self.stored_signals = []
+        self.stored_tweets = []
+    
+    def store_signals(self, signals):
+        self.stored_signals.append([signal['token'] for signal in signals])
+    
+    def store_tweets(self, tweets):
+        self.stored_tweets.extend(tweets)
+    
+    def store_market_metrics(self, metrics):
+        pass
+
+class FakeXClient:
+    """Serves a fixed poll and records the tweets committed after each cycle."""
+    
+    def __init__(self, tweets=()):
+        self.tweets = list(tweets)
+        self.committed = []
+    
+    async def poll_tweets_async(self, lookback):
+        return self.tweets
+    
+    def commit_since_id(self, tweets):
+        self.committed.append([tweet['id'] for tweet in tweets])
+
+class FakeRaydiumClient:
+    """Streams pools after a delay, like a slow download."""
+    
+    def __init__(self, pools):
+        self.pools = pools
+    
+    async def iter_pools_async(self):
+        await asyncio.sleep(0.05)
+        for pool in self.pools:
+            yield pool
+
+class FakeDexScreenerClient:
+    """Serves fixed token metrics."""
+    
+    max_concurrency = 2
+    batch_size = 30
+    
+    def __init__(self, metrics):
+        self.metrics = {metric['address']: metric for metric in metrics}
+    
+    async def get_tokens_metrics_async(self, addresses):
+        return {address: self.metrics[address] for address in addresses if address in self.metrics}
+
+class FakeSentimentAnalyzer:
+    """Scores every tweet as positive."""
+    
+    def analyze_tweets(self, tweets):
+        return [
+            {'tweet_id': tweet['id'], 'sentiment': {'components': {'text': {'score': 0.8}}}}
+            for tweet in tweets
+        ]
+
+class TestPipelineSignals(unittest.TestCase):
+    """Test cases for dirty-token tracking and incremental signal publishing."""
+    
+    def setUp(self):
+        """Set up a pipeline without connections, clients or models."""
+        self.pipeline = Pipeline.__new__(Pipeline)
+        self.pipeline.snapshot = {'token_metrics': [], 'forum_calls': []}
+        self.pipeline.dirty_tokens = set()
+        self.pipeline.latest_signals = {}
+        self.pipeline._signals_published = False
+        self.pipeline._cycle_lock = asyncio.Lock()
+        self.pipeline._token_index_built = False
+        self.pipeline._pools_refreshed = None
+        self.pipeline.queue_size = 10
+        self.pipeline.clients = {'x': FakeXClient()}
+        self.pipeline.stages_config = {}
+        self.pipeline.storage = FakeStorage()
+        self.pipeline.sentiment_rollup = SentimentRollup(bucket_seconds=60, retention=3600)
+        self.pipeline.signal_aggregator = SignalAggregator()
+        self.pipeline.profitability_calculator = ProfitabilityCalculator()
+        self.pipeline.token_index = TokenIndex()
+        self.metrics = [
+            {'address': SOL, 'symbol': 'SOL', 'price_usd': 150.0, 'liquidity_usd': 2000000},
+            {'address': BONK, 'symbol': 'BONK', 'price_usd': 0.00002, 'liquidity_usd': 500000}
+        ]
+    
+    def cycle(self, *results):
+        """Merge stage results, then regenerate and publish signals."""
+        for result in results:
+            self.pipeline.update_snapshot(result)
+        signals, removed = asyncio.run(self.pipeline.generate_signals())
+        asyncio.run(self.pipeline.store_signals(signals, removed))
+        return signals, removed
+    
+    def published(self):
+        return self.pipeline.storage.get_cached_hash('latest_signals')
+    
+    def test_new_and_expired_sentiments(self):
+        """Test that new sentiments and sentiments leaving the window mark their tokens."""
+        now = time.time()
+        self.pipeline.sentiment_rollup.add_many([('OLD', 0.2, 1, now - 7200), ('SOL', 0.9, 1, now)])
+        self.pipeline.update_snapshot({'sentiments': [{'tokens': ['SOL']}, {'tokens': []}]})
+        self.assertEqual(self.pipeline.dirty_tokens, {'SOL', 'OLD'})
+        
+        self.pipeline.dirty_tokens.clear()
+        self.pipeline.update_snapshot({'sentiments': []})
+        self.assertEqual(self.pipeline.dirty_tokens, set())
+    
+    def test_metric_changes(self):
+        """Test that added, changed and dropped metrics mark the address and symbol."""
+        self.pipeline.update_snapshot({'token_metrics': self.metrics})
+        self.assertEqual(self.pipeline.dirty_tokens, {SOL, 'SOL', BONK, 'BONK'})
+        
+        self.pipeline.dirty_tokens.clear()
+        self.pipeline.update_snapshot({'token_metrics': [dict(metric) for metric in self.metrics]})
+        self.assertEqual(self.pipeline.dirty_tokens, set())
+        
+        self.pipeline.update_snapshot({'token_metrics': [dict(self.metrics[0], price_usd=151.0)]})
+        self.assertEqual(self.pipeline.dirty_tokens, {SOL, 'SOL', BONK, 'BONK'})
+        
+        self.pipeline.dirty_tokens.clear()
+        self.pipeline.update_snapshot({'token_metrics': [dict(self.metrics[0], price_usd=151.0)]})
+        self.assertEqual(self.pipeline.dirty_tokens, set())
+    
+    def test_forum_call_changes(self):
+        """Test that only tokens of added or removed calls are marked."""
+        calls = [{'post_id': '1', 'token': 'SOL'}, {'post_id': '2', 'token': 'BONK'}]
+        self.pipeline.update_snapshot({'forum_calls': calls})
+        self.assertEqual(self.pipeline.dirty_tokens, {'SOL', 'BONK'})
+        
+        self.pipeline.dirty_tokens.clear()
+        self.pipeline.update_snapshot({'forum_calls': [calls[0], {'post_id': '2', 'token': 'WIF'}, {'post_id': '3'}]})
+        self.assertEqual(self.pipeline.dirty_tokens, {'BONK', 'WIF'})
+    
+    def test_failed_cycle_adds_no_sentiment(self):
+        """Test that tweets only reach the rollup once stored, so refetching them does not count them twice."""
+        stored = []
+        
+        def store_tweets(tweets):
+            if not stored:
+                stored.append(None)
+                raise RuntimeError("database down")
+        
+        async def tweet_stage(writer):
+            await writer.put((store_tweets, [{'id': '1'}]))
+            return {'tweets': [{'id': '1'}], 'sentiments': [{'tokens': ['SOL']}], 'rollup': [('SOL', 0.9, 1, None)]}
+        
+        self.pipeline.tweet_stage = tweet_stage
+        with self.assertRaises(RuntimeError):
+            asyncio.run(self.pipeline.run_cycle(['tweets']))
+        self.assertEqual(self.pipeline.sentiment_rollup.windows(), {})
+        self.assertEqual(self.pipeline.clients['x'].committed, [])
+        
+        asyncio.run(self.pipeline.run_cycle(['tweets']))
+        self.assertEqual(self.pipeline.sentiment_rollup.window('SOL')['count'], 1)
+        self.assertEqual(self.pipeline.clients['x'].committed, [['1']])
+        self.assertEqual(set(self.published()), {'SOL'})
+    
+    def test_tweets_wait_for_token_index(self):
+        """Test that tweets naming a token are attributed to it on the first pool refresh."""
+        metric = {
+            'address': BONK, 'symbol': 'BONK', 'name': 'Bonk', 'price_usd': 0.00002,
+            'volume_24h': 100000, 'liquidity_usd': 500000
+        }
+        tweet = {
+            'id': '1', 'text': 'Bonk is mooning, buying more tokens', 'author_id': 'a',
+            'created_at': datetime.now(timezone.utc).isoformat(), 'likes': 5, 'retweets': 1, 'comments': 0
+        }
+        pool = {'id': 'pool', 'mintA': BONK, 'mintB': SOL, 'tvl': 500000, 'price': 0.00002}
+        self.pipeline.clients = {
+            'x': FakeXClient([tweet]),
+            'raydium': FakeRaydiumClient([pool]),
+            'dex_screener': FakeDexScreenerClient([metric])
+        }
+        self.pipeline.validator = DataValidator()
+        self.pipeline.sentiment_analyzer = FakeSentimentAnalyzer()
+        self.pipeline.token_index = TokenIndex()
+        self.pipeline.batch_size = 10
+        
+        asyncio.run(self.pipeline.run_cycle(['tweets', 'pools']))
+        self.assertEqual(self.pipeline.sentiment_rollup.window(BONK)['count'], 1)
+        self.assertEqual(self.pipeline.storage.stored_tweets, [tweet])
+        self.assertEqual(set(self.published()), {BONK})
+    
+    def test_symbol_switches_to_address(self):
+        """Test that a cashtag signal moves to the address once its metrics arrive."""
+        self.pipeline.sentiment_rollup.add('SOL', 0.9, 10)
+        signals, removed = self.cycle({'sentiments': [{'tokens': ['SOL']}]})
+        self.assertEqual([signal['token'] for signal in signals], ['SOL'])
+        self.assertEqual(removed, [])
+        
+        signals, removed = self.cycle({'token_metrics': self.metrics[:1]})
+        self.assertEqual([signal['token'] for signal in signals], [SOL])
+        self.assertEqual(signals[0]['components']['sentiment'], 0.9)
+        self.assertEqual(signals[0]['components']['sentiment_count'], 1)
+        self.assertEqual(removed, ['SOL'])
+        self.assertEqual(set(self.published()), {SOL})
+    
+    def test_shared_symbol_follows_token_index(self):
+        """Test that cashtag sentiment and calls of a shared symbol go to the token tweets name it by."""
+        other = 'BonkFakeMint1111111111111111111111111111111'
+        metrics = [
+            {'address': other, 'symbol': 'BONK', 'price_usd': 5.0, 'liquidity_usd': 1000},
+            self.metrics[1]
+        ]
+        self.pipeline.token_index.add_many(metrics)
+        self.assertEqual(self.pipeline.token_index.extract('bonk is up'), [BONK])
+        
+        self.pipeline.sentiment_rollup.add('BONK', 0.9, 10)
+        self.pipeline.snapshot['forum_calls'] = [{'post_id': '1', 'token': 'BONK', 'entry_price': 0.00001, 'action': 'buy'}]
+        signals, _ = self.cycle({'token_metrics': metrics})
+        by_token = {signal['token']: signal for signal in signals}
+        self.assertEqual(by_token[BONK]['components']['sentiment_count'], 1)
+        self.assertEqual(by_token[BONK]['components']['calls_count'], 1)
+        self.assertEqual(by_token[other]['components']['sentiment_count'], 0)
+    
+    def test_first_publish_replaces_hash(self):
+        """Test that the first write replaces the cached hash and later ones patch it."""
+        self.pipeline.storage.patch_cached_hash('latest_signals', {'STALE': {'token': 'STALE'}})
+        
+        self.cycle({'token_metrics': self.metrics})
+        self.assertEqual(set(self.published()), {SOL, BONK})
+        
+        # Unchanged data regenerates nothing and leaves the hash alone
+        signals, _ = self.cycle({'token_metrics': self.metrics})
+        self.assertEqual(signals, [])
+        self.assertEqual(set(self.published()), {SOL, BONK})
+        
+        # Only the changed token is written, the dropped one is deleted
+        self.cycle({'token_metrics': [dict(self.metrics[0], price_usd=160.0)]})
+        self.assertEqual(self.published()[SOL], self.pipeline.latest_signals[SOL])
+        self.assertEqual(set(self.published()), {SOL})
+        self.assertEqual([sorted(tokens) for tokens in self.pipeline.storage.stored_signals], [sorted([SOL, BONK]), [SOL]])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,31 @@
+import unittest
+from processors.profitability import ProfitabilityCalculator
+
+class TestProfitabilityCalculator(unittest.TestCase):
+    """Test cases for the ProfitabilityCalculator class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.calculator = ProfitabilityCalculator()
+    
+    def test_calculate_calls_profitability(self):
+        """Test returns of buy and sell calls against current prices."""
+        calls = [
+            {'post_id': '1', 'token': 'SOL', 'action': 'buy', 'entry_price': 100.0},
+            {'post_id': '2', 'token': 'SOL', 'action': 'sell', 'entry_price': 200.0},
+            {'post_id': '3', 'token': 'BONK', 'action': 'buy', 'entry_price': 1.0},
+            {'post_id': '4', 'token': None, 'action': 'buy', 'entry_price': 1.0},
+            {'post_id': '5', 'token': 'SOL', 'action': 'buy', 'entry_price': None}
+        ]
+        
+        results = self.calculator.calculate_calls_profitability(calls, {'SOL': 150.0})
+        
+        # Calls without a token, entry price or current price are skipped
+        self.assertEqual([result['post_id'] for result in results], ['1', '2'])
+        self.assertAlmostEqual(results[0]['return_pct'], 50.0)
+        self.assertAlmostEqual(results[1]['return_pct'], 25.0)
+        self.assertEqual(results[1]['current_price'], 150.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
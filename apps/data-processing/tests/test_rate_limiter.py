@@ -0,0 +1,61 @@
+import asyncio
+import time
+import unittest
+from clients.rate_limiter import TokenBucket, create_rate_limiter
+
+class TestTokenBucket(unittest.TestCase):
+    """Test cases for the token bucket rate limiter."""
+    
+    def test_burst_then_spacing(self):
+        """Test that a full bucket allows a burst and then spaces requests."""
+        bucket = TokenBucket(rate=10, burst=3)
+        
+        # The first three requests fit in the burst
+        for _ in range(3):
+            self.assertEqual(bucket._reserve(1), 0.0)
+        
+        # Further requests are queued behind each other
+        self.assertAlmostEqual(bucket._reserve(1), 0.1, delta=0.01)
+        self.assertAlmostEqual(bucket._reserve(1), 0.2, delta=0.01)
+    
+    def test_refill(self):
+        """Test that tokens are refilled over time up to the capacity."""
+        bucket = TokenBucket(rate=100, burst=1)
+        bucket._reserve(1)
+        time.sleep(0.05)
+        self.assertEqual(bucket._reserve(1), 0.0)
+        self.assertLessEqual(bucket.tokens, bucket.capacity)
+    
+    def test_penalize(self):
+        """Test that a penalty makes every caller wait."""
+        bucket = TokenBucket(rate=10, burst=5)
+        bucket.penalize(2.0)
+        self.assertAlmostEqual(bucket._reserve(1), 2.1, delta=0.01)
+    
+    def test_acquire_async(self):
+        """Test that concurrent coroutines respect the configured rate."""
+        bucket = TokenBucket(rate=50, burst=1)
+        
+        async def run():
+            start = time.monotonic()
+            await asyncio.gather(*(bucket.acquire_async() for _ in range(6)))
+            return time.monotonic() - start
+        
+        elapsed = asyncio.run(run())
+        self.assertGreaterEqual(elapsed, 0.09)
+    
+    def test_create_rate_limiter(self):
+        """Test limiter creation from client configuration."""
+        self.assertIsNone(create_rate_limiter('x', {}))
+        
+        limiter = create_rate_limiter('raydium', {'rate_limit': 10, 'burst': 20})
+        self.assertIsInstance(limiter, TokenBucket)
+        self.assertEqual(limiter.capacity, 20)
+        
+        # Falls back to a local bucket without a Redis connection
+        limiter = create_rate_limiter('dex_screener', {'rate_limit': 5}, {'backend': 'redis'})
+        self.assertIsInstance(limiter, TokenBucket)
+        self.assertEqual(limiter.capacity, 5)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,46 @@
+import unittest
+from unittest.mock import MagicMock, patch
+from clients.raydium_client import RaydiumClient
+
+POOL = b'{"id": "pool1", "mintA": "a", "mintB": "b", "tvl": 10.0, "price": 1.5}'
+
+def make_stream(*chunks):
+    """Build a fake streamed response serving the given body chunks."""
+    response = MagicMock()
+    response.__enter__.return_value = response
+    response.iter_content.return_value = iter(chunks)
+    return response
+
+class TestRaydiumClient(unittest.TestCase):
+    """Test cases for streaming the Raydium pools listing."""
+    
+    def setUp(self):
+        """Set up client."""
+        self.client = RaydiumClient({'endpoint': 'https://api.raydium.io/v2'})
+    
+    def test_iter_pools(self):
+        """Test that a complete listing yields its valid pools."""
+        body = make_stream(b'{"success": true, "data": [' + POOL, b', {"id": "broken"}]}')
+        with patch.object(self.client.session, 'get', return_value=body):
+            pools = list(self.client.iter_pools())
+        self.assertEqual([pool['id'] for pool in pools], ['pool1'])
+    
+    def test_iter_pools_truncated(self):
+        """Test that a listing cut off mid-array raises after the complete pools."""
+        body = make_stream(b'{"success": true, "data": [' + POOL, b', {"id": "poo')
+        pools = []
+        with patch.object(self.client.session, 'get', return_value=body):
+            with self.assertRaises(ValueError):
+                for pool in self.client.iter_pools():
+                    pools.append(pool)
+        self.assertEqual([pool['id'] for pool in pools], ['pool1'])
+    
+    def test_iter_pools_reported_failure(self):
+        """Test that a listing with a false success flag raises instead of yielding nothing."""
+        for body in (b'{"success": false, "msg": "busy"}', b'{"success": false, "data": []}'):
+            with patch.object(self.client.session, 'get', return_value=make_stream(body)):
+                with self.assertRaises(ValueError):
+                    list(self.client.iter_pools())
+
+if __name__ == '__main__':
+    unittest.main()
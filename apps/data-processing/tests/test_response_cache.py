@@ -0,0 +1,97 @@
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+from clients.base import BaseClient
+from clients.cache import ResponseCache
+
+class FakeRedis(dict):
+    """Minimal stand-in for the Redis get/set calls, returning bytes like redis-py."""
+    
+    def get(self, key):
+        value = dict.get(self, key)
+        return value.encode('utf-8') if value is not None else None
+    
+    def set(self, key, value, ex=None):
+        self[key] = value
+
+class JSONClient(BaseClient):
+    """Client accepting any JSON object."""
+    
+    def validate_response(self, response):
+        return isinstance(response, dict)
+
+def make_response(status_code, body=None, headers=None):
+    """Build a fake requests response."""
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.json.return_value = body
+    return response
+
+class TestResponseCache(unittest.TestCase):
+    """Test cases for the HTTP response cache."""
+    
+    def setUp(self):
+        """Set up a cache backed by a fake Redis."""
+        self.redis = FakeRedis()
+        self.cache = ResponseCache(redis_client=self.redis, max_body_bytes=1000)
+        self.key = self.cache.make_key('GET', 'https://api.example.com/pairs', {'b': 2, 'a': 1})
+    
+    def test_store_follows_cache_control(self):
+        """Test that max-age wins, no-store skips and no-cache needs validators."""
+        entry = self.cache.store(self.key, {'pairs': []}, {'Cache-Control': 'max-age=60'}, default_ttl=5)
+        self.assertAlmostEqual(entry['expires_at'], time.time() + 60, delta=1)
+        self.assertTrue(ResponseCache.is_fresh(self.cache.get(self.key)))
+        
+        self.assertIsNone(self.cache.store('other', {}, {'Cache-Control': 'no-store'}, default_ttl=60))
+        self.assertIsNone(self.cache.store('other', {}, {'Cache-Control': 'no-cache'}, default_ttl=60))
+        entry = self.cache.store('other', {}, {'Cache-Control': 'no-cache', 'ETag': '"v1"'})
+        self.assertFalse(ResponseCache.is_fresh(entry))
+        self.assertEqual(ResponseCache.conditional_headers(entry), {'If-None-Match': '"v1"'})
+    
+    def test_get_returns_copies(self):
+        """Test that changing a returned body leaves the cached one alone."""
+        self.cache.store(self.key, {'pairs': [1, 2]}, {'Cache-Control': 'max-age=60'})
+        self.cache.get(self.key)['data']['pairs'].append(3)
+        self.assertEqual(self.cache.get(self.key)['data'], {'pairs': [1, 2]})
+        
+        # Entries only in Redis are served and copied the same way
+        other = ResponseCache(redis_client=self.redis)
+        other.get(self.key)['data']['pairs'].clear()
+        self.assertEqual(other.get(self.key)['data'], {'pairs': [1, 2]})
+    
+    def test_skips_oversized_bodies(self):
+        """Test that bodies over the size limit are kept out of memory and Redis."""
+        self.assertIsNone(self.cache.store(self.key, {'pools': ['x' * 1000]}, {'Cache-Control': 'max-age=60'}))
+        self.assertIsNone(self.cache.get(self.key))
+        self.assertEqual(self.redis, {})
+    
+    def test_refresh_renews_entry(self):
+        """Test that a 304 keeps the body and renews freshness and validators."""
+        entry = self.cache.store(self.key, {'pairs': [1]}, {'ETag': '"v1"', 'Last-Modified': 'Mon'})
+        self.assertFalse(ResponseCache.is_fresh(entry))
+        
+        renewed = self.cache.refresh(self.key, self.cache.get(self.key), {'ETag': '"v2"', 'Cache-Control': 'max-age=30'})
+        self.assertEqual(renewed['data'], {'pairs': [1]})
+        self.assertEqual((renewed['etag'], renewed['last_modified']), ('"v2"', 'Mon'))
+        self.assertTrue(ResponseCache.is_fresh(self.cache.get(self.key)))
+    
+    def test_client_revalidates_stale_entry(self):
+        """Test that a client sends validators and serves the cached body on 304."""
+        client = JSONClient({'retry_attempts': 1})
+        url = 'https://api.example.com/pairs'
+        with patch.object(BaseClient, 'response_cache', self.cache):
+            with patch.object(client.session, 'request', return_value=make_response(200, {'pairs': [1]}, {'ETag': '"v1"'})):
+                self.assertEqual(client._make_request('GET', url), {'pairs': [1]})
+            
+            with patch.object(client.session, 'request', return_value=make_response(304, headers={'Cache-Control': 'max-age=60'})) as request:
+                self.assertEqual(client._make_request('GET', url), {'pairs': [1]})
+                self.assertEqual(request.call_args.kwargs['headers'], {'If-None-Match': '"v1"'})
+            
+            # The renewed entry is fresh, so no request is sent
+            with patch.object(client.session, 'request') as request:
+                self.assertEqual(client._make_request('GET', url), {'pairs': [1]})
+                request.assert_not_called()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+import asyncio
+import unittest
+from processors.scheduler import Scheduler
+
+class TestScheduler(unittest.TestCase):
+    """Test cases for the interval job scheduler."""
+    
+    def test_jobs_run_independently(self):
+        """Test that a slow job does not hold back a fast one."""
+        runs = {'fast': 0, 'slow': 0}
+        scheduler = Scheduler()
+        
+        async def fast():
+            runs['fast'] += 1
+        
+        async def slow():
+            runs['slow'] += 1
+            await asyncio.sleep(0.3)
+        
+        async def run():
+            scheduler.add_job('fast', 0.02, fast)
+            scheduler.add_job('slow', 0.02, slow)
+            asyncio.get_running_loop().call_later(0.2, scheduler.stop)
+            await scheduler.run()
+        
+        asyncio.run(run())
+        self.assertGreaterEqual(runs['fast'], 5)
+        self.assertEqual(runs['slow'], 1)
+    
+    def test_failing_job_keeps_running(self):
+        """Test that an exception does not stop the job's schedule."""
+        calls = []
+        scheduler = Scheduler()
+        
+        async def failing():
+            calls.append(1)
+            raise RuntimeError("source unavailable")
+        
+        async def run():
+            scheduler.add_job('failing', 0.01, failing)
+            asyncio.get_running_loop().call_later(0.1, scheduler.stop)
+            await scheduler.run()
+        
+        asyncio.run(run())
+        self.assertGreater(len(calls), 1)
+    
+    def test_invalid_interval(self):
+        """Test that non-positive intervals are rejected."""
+        with self.assertRaises(ValueError):
+            Scheduler().add_job('job', 0, None)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+import importlib.util
+import unittest
+import numpy as np
+from processors.sentiment import (
+    CachedSentimentAnalyzer, CompositeSentimentAnalyzer, KeywordSentimentAnalyzer, LSTMSentimentAnalyzer, ParallelSentimentAnalyzer, SentimentBatch,
+    VaderSentimentAnalyzer, cache_namespace, create_analyzer, register_backend, SENTIMENT_BACKENDS
+)
+from processors.sentiment_cache import SentimentCache
+
+TEXTS = [
+    'bullish on this token, going to the moon',
+    'total scam, dump incoming',
+    'GM everyone',
+    '',
+    'buy the dip, strong hands https://t.co/abc'
+]
+
+class CountingAnalyzer(KeywordSentimentAnalyzer):
+    """Keyword analyzer that records the texts it scores."""
+    
+    def __init__(self):
+        super().__init__()
+        self.scored = []
+        
+    def analyze_batch(self, texts):
+        self.scored.extend(texts)
+        return super().analyze_batch(texts)
+
+class TestSentimentBackends(unittest.TestCase):
+    """Test cases for the sentiment backends and their registry."""
+    
+    def test_batch_matches_single(self):
+        """Test that batch and single-text scoring agree for every light backend."""
+        for analyzer in (KeywordSentimentAnalyzer(), VaderSentimentAnalyzer()):
+            batch = analyzer.analyze_batch(TEXTS)
+            self.assertIsInstance(batch.scores, np.ndarray)
+            self.assertEqual(batch.to_dicts(), [analyzer.analyze(text) for text in TEXTS])
+            
+    def test_keyword_scores(self):
+        """Test keyword weights and labels."""
+        batch = KeywordSentimentAnalyzer().analyze_batch(TEXTS)
+        self.assertEqual(batch.labels.tolist()[:4], ['positive', 'negative', 'neutral', 'neutral'])
+        self.assertAlmostEqual(batch.raw_scores['negative_score'][1], 1.6)
+        self.assertEqual(batch.scores[3], 0.5)
+        
+    @unittest.skipUnless(
+        importlib.util.find_spec('emoji') and importlib.util.find_spec('nltk'),
+        "emoji and nltk are not installed"
+    )
+    def test_lstm_cleanup(self):
+        """Test that live texts get the cleanup of the LSTM training corpus."""
+        analyzer = LSTMSentimentAnalyzer.__new__(LSTMSentimentAnalyzer)
+        analyzer.load_cleanup()
+        self.assertEqual(
+            analyzer.clean('@whale Sooooo #BULLISH on $SOL 100x!!! 🚀 https://t.co/abc'),
+            'soo bullish sol x'
+        )
+        
+        # Stop-words and tokens with digits or underscores left are dropped
+        self.assertEqual(analyzer.clean('I cannot sell_now, 2 moons'), 'moons')
+        
+    def test_concat(self):
+        """Test joining batches in order."""
+        analyzer = KeywordSentimentAnalyzer()
+        joined = SentimentBatch.concat([analyzer.analyze_batch(TEXTS[:2]), analyzer.analyze_batch(TEXTS[2:])])
+        self.assertEqual(joined.to_dicts(), analyzer.analyze_batch(TEXTS).to_dicts())
+        self.assertEqual(len(SentimentBatch.concat([])), 0)
+        
+    def test_parallel_keeps_order(self):
+        """Test that results sharded across worker processes come back in input order."""
+        texts = [TEXTS[i % len(TEXTS)] + f' {i}' for i in range(23)]
+        analyzer = ParallelSentimentAnalyzer({'backend': 'keyword', 'min_shard_size': 4}, workers=3)
+        try:
+            self.assertEqual(analyzer.analyze_batch(texts).to_dicts(), KeywordSentimentAnalyzer().analyze_batch(texts).to_dicts())
+        finally:
+            analyzer.close()
+            
+    def test_cached_analyzer_scores_each_text_once(self):
+        """Test that duplicates and seen texts skip the backend."""
+        backend = CountingAnalyzer()
+        analyzer = CachedSentimentAnalyzer(backend, SentimentCache('keyword:test'))
+        texts = TEXTS + ['buy the dip, strong hands https://t.co/xyz']
+        
+        first = analyzer.analyze_batch(texts)
+        self.assertEqual(len(backend.scored), len(TEXTS))
+        self.assertEqual(first.to_dicts(), KeywordSentimentAnalyzer().analyze_batch(texts).to_dicts())
+        
+        analyzer.analyze_batch(texts)
+        self.assertEqual(len(backend.scored), len(TEXTS))
+        
+    def test_composite_accepts_numpy_metrics(self):
+        """Test that tweets with numpy metrics, e.g. from a DataFrame, are scored."""
+        analyzer = CompositeSentimentAnalyzer({
+            'backend': 'keyword',
+            'weights': {'text': 0.4, 'likes': 0.2, 'retweets': 0.2, 'comments': 0.2},
+            'thresholds': {'strong_positive': 0.6, 'positive': 0.2, 'neutral': -0.2, 'negative': -0.6},
+            'cache': {'enabled': False}
+        })
+        tweets = [
+            {'id': '1', 'text': TEXTS[0], 'likes': np.int64(10), 'retweets': np.float32(2), 'comments': 0},
+            {'id': '2', 'text': TEXTS[1], 'likes': '10', 'retweets': 0, 'comments': 0}
+        ]
+        results = analyzer.analyze_tweets(tweets)
+        self.assertEqual([result['tweet_id'] for result in results], ['1'])
+        self.assertEqual(results[0]['sentiment'], analyzer.analyze_tweet(dict(tweets[0], likes=10, retweets=2.0)))
+        
+    def test_cache_namespace(self):
+        """Test that another model file or vectorizer gets its own cached scores."""
+        config = {'backend': 'lstm', 'model_version': 'v1'}
+        namespaces = {
+            cache_namespace(config),
+            cache_namespace(dict(config, lstm_model_path='models/sentiment/retrained.h5')),
+            cache_namespace(dict(config, lstm_vectorizer_path='data/retrained.pkl')),
+            cache_namespace(dict(config, model_version='v2'))
+        }
+        self.assertEqual(len(namespaces), 4)
+        self.assertEqual(cache_namespace({'backend': 'vader'}), 'vader:v1')
+        self.assertEqual(cache_namespace({'backend': 'onnx', 'model_name': 'sst2'}), 'onnx:v1:sst2')
+    
+    def test_registry(self):
+        """Test backend resolution and fallback."""
+        self.assertIsInstance(create_analyzer({'backend': 'vader'}), VaderSentimentAnalyzer)
+        self.assertIsInstance(create_analyzer({'backend': 'unknown'}), KeywordSentimentAnalyzer)
+        
+        register_backend('counting', f'{__name__}:CountingAnalyzer')
+        try:
+            self.assertIsInstance(create_analyzer({'backend': 'counting'}), CountingAnalyzer)
+        finally:
+            del SENTIMENT_BACKENDS['counting']
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+import unittest
+from processors.sentiment_cache import SentimentCache, normalize_text
+
+class FakeStorage:
+    """Minimal stand-in for the Storage cache methods."""
+    
+    def __init__(self):
+        self.entries = {}
+        
+    def get_cached_many(self, keys):
+        return [self.entries.get(key) for key in keys]
+        
+    def cache_many(self, items, ttl=None):
+        self.entries.update(items)
+
+class TestSentimentCache(unittest.TestCase):
+    """Test cases for the sentiment memoization cache."""
+    
+    def setUp(self):
+        """Set up cache."""
+        self.storage = FakeStorage()
+        self.cache = SentimentCache('vader:v1', max_entries=2, storage=self.storage)
+        
+    def test_normalized_duplicates_share_key(self):
+        """Test that reposts with other links and spacing hit the same entry."""
+        self.assertEqual(
+            self.cache.make_key('moon soon https://t.co/abc'),
+            self.cache.make_key('moon   soon https://t.co/xyz ')
+        )
+        self.assertNotEqual(self.cache.make_key('MOON soon'), self.cache.make_key('moon soon'))
+        self.assertEqual(normalize_text(' gm\n\tgm http://x.io/1'), 'gm gm')
+        
+    def test_namespace_separates_models(self):
+        """Test that another backend or model version never shares entries."""
+        other = SentimentCache('vader:v2')
+        self.assertNotEqual(self.cache.make_key('gm'), other.make_key('gm'))
+        
+    def test_lru_and_redis_tier(self):
+        """Test eviction from the LRU with fallback to the Redis tier."""
+        keys = [self.cache.make_key(text) for text in ('a', 'b', 'c')]
+        self.cache.set_many({key: {'score': index} for index, key in enumerate(keys)})
+        self.assertEqual(len(self.cache._entries), 2)
+        
+        found = self.cache.get_many(keys + [self.cache.make_key('d')])
+        self.assertEqual({key: entry['score'] for key, entry in found.items()}, dict(zip(keys, range(3))))
+        self.assertEqual((self.cache.hits, self.cache.misses), (3, 1))
+        
+    def test_without_storage(self):
+        """Test the in-process cache on its own."""
+        cache = SentimentCache('keyword:v1')
+        key = cache.make_key('gm')
+        self.assertEqual(cache.get_many([key]), {})
+        cache.set_many({key: {'score': 0.5}})
+        self.assertEqual(cache.get_many([key]), {key: {'score': 0.5}})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+from collections import defaultdict
+from processors.sentiment_rollup import SentimentRollup
+from processors.signal_aggregator import SignalAggregator
+
+class FakeStorage:
+    """In-memory stand-in for the Redis hash methods of Storage."""
+    
+    def __init__(self):
+        self.hashes = defaultdict(lambda: defaultdict(float))
+        
+    def increment_hashes(self, increments, ttl=None):
+        for key, fields in increments.items():
+            for field, amount in fields.items():
+                self.hashes[key][field] += amount
+                
+    def get_hashes(self, keys):
+        return [dict(self.hashes.get(key, {})) for key in keys]
+
+class TestSentimentRollup(unittest.TestCase):
+    """Test cases for the bucketed sentiment aggregates."""
+    
+    NOW = 1_700_000_000
+    
+    def test_engagement_weighted_window(self):
+        """Test that the window combines only its buckets, weighted by engagement."""
+        rollup = SentimentRollup(bucket_seconds=60, retention=3600)
+        rollup.add_many([
+            ('SOL', 0.9, 30, self.NOW - 10),
+            ('SOL', 0.3, 10, self.NOW - 100),
+            ('SOL', 0.0, 50, self.NOW - 1800),
+            ('BONK', 0.4, 0, self.NOW - 10),
+            ('BONK', 0.6, 0, self.NOW - 20)
+        ])
+        
+        recent = rollup.window('SOL', 300, now=self.NOW)
+        self.assertEqual(recent['count'], 2)
+        self.assertAlmostEqual(recent['score'], (0.9 * 30 + 0.3 * 10) / 40)
+        self.assertEqual(rollup.window('SOL', now=self.NOW)['count'], 3)
+        
+        # Without engagement the plain mean is used
+        self.assertAlmostEqual(rollup.window('BONK', 300, now=self.NOW)['score'], 0.5)
+        self.assertIsNone(rollup.window('WIF', now=self.NOW)['score'])
+        self.assertEqual(set(rollup.windows(300, now=self.NOW)), {'SOL', 'BONK'})
+        
+    def test_prune(self):
+        """Test that buckets past the retention are dropped."""
+        rollup = SentimentRollup(bucket_seconds=60, retention=600)
+        rollup.add('SOL', 0.5, 1, self.NOW - 3600)
+        rollup.add('BONK', 0.5, 1, self.NOW)
+        self.assertEqual(rollup.prune(now=self.NOW), {'SOL'})
+        self.assertEqual(list(rollup.buckets), ['BONK'])
+        
+    def test_restore_from_redis(self):
+        """Test that another rollup sharing the storage sees the same aggregates."""
+        storage = FakeStorage()
+        writer = SentimentRollup(bucket_seconds=60, retention=3600, storage=storage)
+        writer.add_many([('SOL', 0.8, 10, self.NOW - 30), ('SOL', 0.2, 30, self.NOW - 900)])
+        
+        reader = SentimentRollup(bucket_seconds=60, retention=3600, storage=storage)
+        reader.restore(now=self.NOW)
+        self.assertEqual(reader.window('SOL', now=self.NOW), writer.window('SOL', now=self.NOW))
+        
+    def test_rollup_signal(self):
+        """Test that signals read sentiment from the rollup."""
+        rollup = SentimentRollup(bucket_seconds=60, retention=3600)
+        rollup.add('SOL', 0.9, 100, self.NOW - 10)
+        signal = SignalAggregator().generate_rollup_signal('SOL', rollup, {'price_change_pct': 5}, now=self.NOW)
+        self.assertEqual(signal['components']['sentiment'], 0.9)
+        self.assertEqual(signal['metadata']['sentiment_count'], 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,7 +2,9 @@ import unittest
 import pandas as pd
 import json
 import os
-from signal_aggregator import SignalAggregator
+import yaml
+from processors.sentiment_rollup import SentimentRollup
+from processors.signal_aggregator import SignalAggregator, symbol_addresses
 
 class TestSignalAggregator(unittest.TestCase):
     """Test cases for the SignalAggregator class."""
@@ -227,6 +229,178 @@ class TestSignalAggregator(unittest.TestCase):
         self.assertIn('BTC', asset_ids)
         self.assertIn('ETH', asset_ids)
         
+    def test_generate_signals_frame_matches_per_asset(self):
+        """Test that the columnar engine reproduces the per-asset signals."""
+        texts = ["Bullish on SOL", "Might crash", "Good gains, going up", None, "Bad week", "Moon soon"]
+        sentiment = pd.DataFrame({
+            'asset_id': ['SOL', 'SOL', 'BONK', 'BONK', 'WIF', 'JUP'],
+            'text': texts,
+            'likes': [100, 5, 0, 10, 40, 0],
+            'retweets': [50, 1, 0, 2, 10, 0],
+            'comments': [20, 0, 0, 1, 5, 0]
+        })
+        metrics = pd.DataFrame({
+            'asset_id': ['SOL', 'BONK', 'WIF', 'RAY'],
+            'liquidity': [900000, 2500000, None, 120000],
+            'volume': [25000000, 1000000, 3000000, 0],
+            'average_volume': [20000000, None, 6000000, 100],
+            'price_change_pct': [6.5, -12.0, 1.0, None]
+        })
+        
+        frame = self.aggregator.generate_signals_frame(sentiment, metrics)
+        self.assertEqual(frame['asset_id'].tolist(), ['SOL', 'BONK', 'WIF', 'RAY', 'JUP'])
+        
+        metrics_by_asset = {
+            row['asset_id']: {k: v for k, v in row.items() if k != 'asset_id' and not pd.isna(v)}
+            for row in metrics.to_dict('records')
+        }
+        for signal in self.aggregator.frame_to_signals(frame):
+            asset_id = signal['asset_id']
+            expected = self.aggregator.generate_signal(
+                asset_id,
+                sentiment[sentiment['asset_id'] == asset_id].drop(columns='asset_id').reset_index(drop=True),
+                metrics_by_asset.get(asset_id, {})
+            )
+            expected['timestamp'] = signal['timestamp']
+            self.assertEqual(signal, expected)
+            
+    def test_generate_signals_frame_with_scores(self):
+        """Test the columnar engine on precomputed, engagement-weighted scores."""
+        sentiment = pd.DataFrame({
+            'asset_id': ['SOL', 'SOL', 'BONK'],
+            'sentiment_score': [0.9, 0.2, 1.3],
+            'engagement': [3.0, 1.0, 0.0]
+        })
+        frame = self.aggregator.generate_signals_frame(sentiment, pd.DataFrame({'asset_id': ['SOL']}))
+        
+        for row in frame.itertuples():
+            expected = self.aggregator.generate_signal(
+                row.asset_id,
+                sentiment[sentiment['asset_id'] == row.asset_id].drop(columns='asset_id'),
+                {}
+            )
+            self.assertEqual(row.sentiment, expected['components']['sentiment'])
+            self.assertEqual(row.score, expected['signal']['score'])
+            self.assertEqual(row.category, expected['signal']['category'])
+    
+    def test_generate_signals_joins_sources(self):
+        """Test joining rollup sentiment, token metrics and call profitability per token."""
+        rollup = SentimentRollup(bucket_seconds=60, retention=3600)
+        rollup.add_many([
+            ('SOL', 0.9, 3, None),
+            ('SOL', 0.3, 1, None),
+            ('BONK', 0.3, 1, None),
+            ('WIF', 0.6, 0, None)
+        ])
+        market_metrics = {
+            'So11111111111111111111111111111111111111112': {
+                'address': 'So11111111111111111111111111111111111111112',
+                'symbol': 'SOL',
+                'liquidity_usd': 2000000,
+                'volume_24h': 500000,
+                'price_change_pct': 4.0
+            },
+            'DezXAZ8z7PnrnRJjz3wXBoRgixCa6xjnB7YaB1pPB263': {
+                'address': 'DezXAZ8z7PnrnRJjz3wXBoRgixCa6xjnB7YaB1pPB263',
+                'symbol': 'BONK',
+                'liquidity_usd': 500000
+            }
+        }
+        profitability = {
+            'SOL': [{'token': 'SOL', 'return_pct': 30.0}, {'token': 'SOL', 'return_pct': 10.0}]
+        }
+        
+        signals = self.aggregator.generate_signals(rollup.windows(), market_metrics, profitability)
+        by_token = {signal['token']: signal for signal in signals}
+        self.assertEqual(
+            list(by_token),
+            ['So11111111111111111111111111111111111111112', 'DezXAZ8z7PnrnRJjz3wXBoRgixCa6xjnB7YaB1pPB263', 'WIF']
+        )
+        
+        # Symbols resolve to addresses, the sentiment is engagement weighted
+        sol = by_token['So11111111111111111111111111111111111111112']
+        metrics = self.aggregator.normalize_market_metrics({'liquidity': 2000000, 'volume': 500000, 'price_change_pct': 4.0})
+        base = self.aggregator.calculate_aggregate_score(0.75, metrics)
+        self.assertEqual(sol['components']['sentiment'], 0.75)
+        self.assertEqual(sol['components']['sentiment_count'], 2)
+        self.assertEqual(sol['components']['profitability'], 0.7)
+        self.assertEqual(sol['components']['calls_count'], 2)
+        self.assertEqual(sol['score'], round(0.8 * base + 0.2 * 0.7, 2))
+        
+        # Tokens without market metrics or engagement fall back to neutral metrics and the plain mean
+        wif = by_token['WIF']
+        self.assertEqual(wif['components']['sentiment'], 0.6)
+        self.assertEqual(wif['components']['metrics'], {'liquidity': 0.5, 'volume': 0.5, 'price_action': 0.5})
+        self.assertIsNone(wif['components']['profitability'])
+        
+        for signal in signals:
+            self.assertEqual(set(signal), {'token', 'score', 'category', 'confidence', 'components', 'timestamp'})
+            self.assertIn(signal['category'], self.aggregator.config['categories'])
+    
+    def test_pipeline_config(self):
+        """Test that the shipped pipeline config builds an aggregator that generates signals."""
+        with open(os.path.join(os.path.dirname(__file__), '..', 'config', 'pipeline.yaml')) as f:
+            config = yaml.safe_load(f)
+        aggregator = SignalAggregator(config['signal'])
+        
+        sentiments = {'SOL': {'weighted_sum': 0.9, 'engagement': 1, 'score_sum': 0.9, 'count': 1, 'score': 0.9}}
+        signals = aggregator.generate_signals(sentiments, {'A1': {'symbol': 'SOL', 'liquidity_usd': 2000000}}, {})
+        self.assertEqual([signal['token'] for signal in signals], ['A1'])
+        self.assertIn(signals[0]['category'], aggregator.config['categories'])
+        
+        # Partial categories are merged into the defaults, unusable settings fail up front
+        aggregator = SignalAggregator({'categories': {'buy': {'min_score': 0.65}}})
+        self.assertEqual(aggregator.config['categories']['buy'], {'min_score': 0.65, 'sentiment_min': 0.5, 'price_action_min': 0.4})
+        with self.assertRaises(ValueError):
+            SignalAggregator({'categories': {'strong_buy': 0.6}})
+        with self.assertRaises(ValueError):
+            SignalAggregator({'weights': {'sentiment': 0.3}})
+    
+    def test_generate_signals_for_tokens(self):
+        """Test regenerating the signals of some tokens only."""
+        sentiments = {
+            'SOL': {'weighted_sum': 0.9, 'engagement': 1, 'score_sum': 0.9, 'count': 1, 'score': 0.9},
+            'BONK': {'weighted_sum': 0.2, 'engagement': 1, 'score_sum': 0.2, 'count': 1, 'score': 0.2},
+            'So11111111111111111111111111111111111111112': {
+                'weighted_sum': 0.3, 'engagement': 1, 'score_sum': 0.3, 'count': 1, 'score': 0.3
+            }
+        }
+        market_metrics = {
+            'So11111111111111111111111111111111111111112': {'symbol': 'SOL', 'liquidity_usd': 2000000},
+            'DezXAZ8z7PnrnRJjz3wXBoRgixCa6xjnB7YaB1pPB263': {'symbol': 'BONK', 'liquidity_usd': 500000}
+        }
+        
+        every = self.aggregator.generate_signals(sentiments, market_metrics, {})
+        some = self.aggregator.generate_signals(sentiments, market_metrics, {}, tokens=['SOL', 'GONE'])
+        
+        # Symbols resolve like the sources, tokens without data are left out
+        self.assertEqual([signal['token'] for signal in some], ['So11111111111111111111111111111111111111112'])
+        self.assertEqual(some[0]['components'], every[0]['components'])
+        
+        # Aggregates of a symbol and of its address are merged
+        self.assertEqual(some[0]['components']['sentiment'], 0.6)
+        self.assertEqual(some[0]['components']['sentiment_count'], 2)
+        self.assertEqual(self.aggregator.generate_signals(sentiments, market_metrics, {}, tokens=[]), [])
+    
+    def test_shared_symbol_resolves_to_most_liquid(self):
+        """Test that a symbol shared by two tokens resolves like the token index, whatever their order."""
+        sentiments = {'BONK': {'weighted_sum': 0.9, 'engagement': 1, 'score_sum': 0.9, 'count': 1, 'score': 0.9}}
+        market_metrics = {
+            'Fake2': {'symbol': 'BONK', 'liquidity_usd': 1000},
+            'Bonk1': {'symbol': 'bonk', 'liquidity_usd': 500000},
+            'Fake1': {'symbol': 'BONK', 'liquidity_usd': 1000}
+        }
+        self.assertEqual(symbol_addresses(market_metrics), {'BONK': 'Bonk1'})
+        self.assertEqual(symbol_addresses(dict(reversed(market_metrics.items()))), {'BONK': 'Bonk1'})
+        
+        signals = self.aggregator.generate_signals(sentiments, market_metrics, {}, tokens=['BONK'])
+        self.assertEqual([signal['token'] for signal in signals], ['Bonk1'])
+        self.assertEqual(signals[0]['components']['sentiment'], 0.9)
+        
+        # Given symbols win, e.g. those of the token index
+        signals = self.aggregator.generate_signals(sentiments, market_metrics, {}, tokens=['BONK'], symbols={'BONK': 'Fake1'})
+        self.assertEqual([signal['token'] for signal in signals], ['Fake1'])
+    
     def test_save_signals_to_json(self):
         """Test saving signals to JSON."""
         signals = [
@@ -329,10 +503,6 @@ class TestSignalAggregator(unittest.TestCase):
                 'retweets': [60, 50, 45],
                 'comments': [30, 25, 22]
             }),
-            'metrics': {
-                'liquidity  [60, 50, 45],
-                'comments': [30, 25, 22]
-            }),
             'metrics': {
                 'liquidity': 400000,
                 'volume': 15000000,
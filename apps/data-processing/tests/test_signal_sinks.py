@@ -0,0 +1,94 @@
+import gzip
+import importlib.util
+import json
+import os
+import tempfile
+import unittest
+from processors.signal_sinks import JSONSink, NDJSONSink, ParquetSink, create_sink
+
+class TestSignalSinks(unittest.TestCase):
+    """Test cases for the streaming signal sinks."""
+    
+    def setUp(self):
+        """Set up a scratch directory and sample signals."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.signals = [
+            {'token': f'T{i}', 'score': i / 10, 'category': 'neutral',
+             'components': {'sentiment': 0.5, 'profitability': None}}
+            for i in range(5)
+        ]
+    
+    def tearDown(self):
+        """Remove the scratch directory."""
+        self.directory.cleanup()
+    
+    def _path(self, name):
+        return os.path.join(self.directory.name, 'out', name)
+    
+    def test_json_matches_json_dump(self):
+        """Test that streamed JSON matches json.dump output for generators too."""
+        for indent in (2, None):
+            for signals in (self.signals, [], self.signals[:1]):
+                path = self._path('signals.json')
+                count = JSONSink(path, indent=indent).write(signal for signal in signals)
+                with open(path) as f:
+                    self.assertEqual(f.read(), json.dumps(signals, indent=indent))
+                self.assertEqual(count, len(signals))
+    
+    def test_ndjson_append_compressed(self):
+        """Test appending gzipped NDJSON batches."""
+        path = self._path('signals.ndjson.gz')
+        sink = create_sink(path, append=True)
+        self.assertIsInstance(sink, NDJSONSink)
+        sink.write(iter(self.signals[:2]))
+        sink.write(iter(self.signals[2:]))
+        
+        with gzip.open(path, 'rt') as f:
+            self.assertEqual([json.loads(line) for line in f], self.signals)
+    
+    def test_failed_write_keeps_previous_file(self):
+        """Test that an interrupted write leaves the old output in place."""
+        path = self._path('signals.jsonl')
+        NDJSONSink(path).write(self.signals)
+        
+        def broken():
+            yield self.signals[0]
+            raise RuntimeError("source failed")
+        
+        with self.assertRaises(RuntimeError):
+            NDJSONSink(path).write(broken())
+        with open(path) as f:
+            self.assertEqual(len(f.readlines()), len(self.signals))
+        self.assertEqual(os.listdir(os.path.dirname(path)), ['signals.jsonl'])
+    
+    def test_create_sink(self):
+        """Test choosing sinks by format and extension."""
+        self.assertIsInstance(create_sink(self._path('a.json')), JSONSink)
+        self.assertIsInstance(create_sink(self._path('a.json.gz')), JSONSink)
+        self.assertIsInstance(create_sink(self._path('a.txt'), format='ndjson'), NDJSONSink)
+        with self.assertRaises(ValueError):
+            create_sink(self._path('a.csv'))
+    
+    @unittest.skipUnless(importlib.util.find_spec('pyarrow'), "pyarrow is not installed")
+    def test_parquet(self):
+        """Test writing flattened signals to Parquet in row groups."""
+        import pyarrow.parquet as pq
+        
+        path = self._path('signals.parquet')
+        ParquetSink(path, batch_size=2).write(signal for signal in self.signals)
+        table = pq.read_table(path)
+        self.assertEqual(table.num_rows, len(self.signals))
+        self.assertEqual(table.column('components.sentiment').to_pylist(), [0.5] * len(self.signals))
+    
+    @unittest.skipUnless(importlib.util.find_spec('pyarrow'), "pyarrow is not installed")
+    def test_parquet_schema_drift(self):
+        """Test that columns first appearing after the first batch fail the write."""
+        path = self._path('signals.parquet')
+        signals = self.signals[:2] + [dict(self.signals[2], extra=1.0)]
+        with self.assertRaises(ValueError):
+            ParquetSink(path, batch_size=2).write(signals)
+        self.assertFalse(os.path.exists(path))
+
+
+if __name__ == '__main__':
+    unittest.main()
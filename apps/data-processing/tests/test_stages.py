@@ -0,0 +1,67 @@
+import asyncio
+import unittest
+from processors.stages import chunks, consume, emit, run_stages
+
+class TestStages(unittest.TestCase):
+    """Test cases for the queue helpers connecting pipeline stages."""
+    
+    def test_emit_and_consume(self):
+        """Test that all items pass through a bounded queue in order."""
+        async def run():
+            queue = asyncio.Queue(maxsize=2)
+            
+            async def collect():
+                return [item async for item in consume(queue)]
+            
+            _, items = await run_stages(emit(queue, range(10)), collect())
+            return items
+        
+        self.assertEqual(asyncio.run(run()), list(range(10)))
+    
+    def test_backpressure(self):
+        """Test that a producer never runs more than the queue size ahead."""
+        produced = []
+        lead = []
+        
+        async def source():
+            for item in range(20):
+                produced.append(item)
+                yield item
+        
+        async def run():
+            queue = asyncio.Queue(maxsize=3)
+            
+            async def slow_consumer():
+                consumed = 0
+                async for _ in consume(queue):
+                    consumed += 1
+                    lead.append(len(produced) - consumed)
+                    await asyncio.sleep(0.001)
+            
+            await run_stages(emit(queue, source()), slow_consumer())
+        
+        asyncio.run(run())
+        self.assertEqual(len(produced), 20)
+        self.assertLessEqual(max(lead), 4)
+    
+    def test_failure_cancels_other_stages(self):
+        """Test that a failing stage does not leave the others waiting."""
+        async def run():
+            queue = asyncio.Queue(maxsize=1)
+            
+            async def failing_consumer():
+                await queue.get()
+                raise RuntimeError("stage failed")
+            
+            await run_stages(emit(queue, range(100)), failing_consumer())
+        
+        with self.assertRaises(RuntimeError):
+            asyncio.run(asyncio.wait_for(run(), timeout=1))
+    
+    def test_chunks(self):
+        """Test splitting into fixed-size chunks."""
+        self.assertEqual(list(chunks([1, 2, 3, 4, 5], 2)), [[1, 2], [3, 4], [5]])
+        self.assertEqual(list(chunks([], 2)), [])
+
+if __name__ == '__main__':
+    unittest.main()
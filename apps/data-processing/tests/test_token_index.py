@@ -0,0 +1,93 @@
+import unittest
+import pandas as pd
+from processors.token_index import TokenIndex
+
+SOL = 'So11111111111111111111111111111111111111112'
+BONK = 'DezXAZ8z7PnrnRJjz3wXBoRgixCa6xjnB7YaB1pPB263'
+WIF = 'EKpQGSJtjMFqKZ9KQanSqYXRcF8fBopzLHYxdM65zcjm'
+
+class TestTokenIndex(unittest.TestCase):
+    """Test cases for the TokenIndex class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.index = TokenIndex([
+            {'address': SOL, 'symbol': 'SOL', 'name': 'Wrapped SOL'},
+            {'address': BONK, 'symbol': 'Bonk', 'name': 'Bonk'},
+            {'address': WIF, 'symbol': 'WIF', 'name': 'dogwifhat'},
+            {'address': 'Ab1', 'symbol': 'AI'}
+        ])
+    
+    def test_extract(self):
+        """Test recognizing cashtags, symbols, names and mint addresses."""
+        self.assertEqual(self.index.extract("Loading up on $BONK"), [BONK])
+        self.assertEqual(self.index.extract("sol and dogwifhat pumping"), [SOL, WIF])
+        self.assertEqual(self.index.extract(f"new pool for {WIF} is live"), [WIF])
+        
+        # Short symbols only count as cashtags, unknown cashtags keep their symbol
+        self.assertEqual(self.index.extract("AI is the future"), [])
+        self.assertEqual(self.index.extract("$AI and $NEW"), ['Ab1', 'NEW'])
+        
+        # Symbols inside words are not matches, repeated mentions count once
+        self.assertEqual(self.index.extract("solana bonkers"), [])
+        self.assertEqual(self.index.extract("$SOL SOL Wrapped SOL"), [SOL])
+        self.assertEqual(self.index.extract(None), [])
+    
+    def test_add_rebuilds_matcher(self):
+        """Test that tokens added later are recognized."""
+        self.assertEqual(self.index.extract("popcat to the moon"), [])
+        self.index.add('7GCihgDB8fe6KNjn2MYtkzZcRjQy3t9GHdC8uHYmW2hr', symbol='POPCAT', name='Popcat')
+        self.assertEqual(self.index.extract("popcat to the moon"), ['7GCihgDB8fe6KNjn2MYtkzZcRjQy3t9GHdC8uHYmW2hr'])
+        self.assertEqual(len(self.index), 5)
+        
+        # Batched registration keeps the previous automaton until rebuilt
+        self.index.add_many([{'address': 'Mew1', 'symbol': 'MEW', 'name': 'cat in a dogs world'}], rebuild=False)
+        self.assertEqual(self.index.extract_many(["mew", "popcat"]), [[], ['7GCihgDB8fe6KNjn2MYtkzZcRjQy3t9GHdC8uHYmW2hr']])
+        self.index.rebuild()
+        self.assertEqual(self.index.extract("mew"), ['Mew1'])
+    
+    def test_bare_words_need_liquidity(self):
+        """Test that common words and low-liquidity tokens only match as cashtags."""
+        index = TokenIndex([
+            {'address': 'The1', 'symbol': 'THE', 'name': 'The', 'liquidity_usd': 5000000},
+            {'address': 'Moon1', 'symbol': 'MOON', 'liquidity_usd': 5000000},
+            {'address': SOL, 'symbol': 'SOL', 'liquidity_usd': 5000000},
+            {'address': 'Low1', 'symbol': 'LOWCAP', 'liquidity_usd': 1000}
+        ], min_liquidity=100000)
+        self.assertEqual(index.extract("the market is going to the moon"), [])
+        self.assertEqual(index.extract("$MOON and $lowcap"), ['Moon1', 'Low1'])
+        self.assertEqual(index.extract("lowcap or sol"), [SOL])
+        
+        # Liquidity updates take effect on the next rebuild
+        index.add('Low1', liquidity_usd=200000)
+        self.assertEqual(index.extract("lowcap or sol"), ['Low1', SOL])
+    
+    def test_shared_symbol_goes_to_most_liquid(self):
+        """Test that symbol ties are broken by liquidity, whatever the registration order."""
+        tokens = [
+            {'address': 'PepeSmall', 'symbol': 'PEPE', 'liquidity_usd': 1000},
+            {'address': 'PepeBig', 'symbol': 'PEPE', 'liquidity_usd': 900000}
+        ]
+        for ordered in (tokens, tokens[::-1]):
+            index = TokenIndex(ordered)
+            self.assertEqual(index.extract("$PEPE"), ['PepeBig'])
+            self.assertEqual(index.extract("pepe"), ['PepeBig'])
+    
+    def test_index_and_slices(self):
+        """Test the inverted index and per-token DataFrame slices."""
+        tweets = [
+            {'id': '1', 'text': "$SOL looking strong"},
+            {'id': '2', 'text': "bonk and sol both up"},
+            {'id': '3', 'text': "nothing here"}
+        ]
+        self.assertEqual(self.index.index_tweets(tweets), {SOL: ['1', '2'], BONK: ['2']})
+        
+        frame = pd.DataFrame(tweets, index=[10, 20, 30])
+        slices = self.index.slices(frame)
+        self.assertEqual(set(slices), {SOL, BONK})
+        self.assertEqual(slices[SOL]['id'].tolist(), ['1', '2'])
+        self.assertEqual(slices[BONK].index.tolist(), [20])
+
+
+if __name__ == '__main__':
+    unittest.main()
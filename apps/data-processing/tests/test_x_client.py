@@ -0,0 +1,118 @@
+import unittest
+from unittest.mock import patch
+from clients.x_client import XClient
+
+def make_page(ids, next_token=None):
+    """Build a recent search response page for the given tweet ids."""
+    page = {'meta': {'result_count': len(ids)}}
+    if ids:
+        page['data'] = [
+            {
+                'id': tweet_id,
+                'text': f'tweet {tweet_id}',
+                'author_id': 'user',
+                'created_at': '2024-01-01T00:00:00.000Z',
+                'public_metrics': {'like_count': 1, 'retweet_count': 0, 'reply_count': 0}
+            }
+            for tweet_id in ids
+        ]
+        page['includes'] = {'users': [{'id': 'user', 'name': 'User', 'username': 'user'}]}
+    if next_token:
+        page['meta']['next_token'] = next_token
+    return page
+
+class FakeRedis(dict):
+    """Minimal stand-in for the Redis get/set calls."""
+    
+    def get(self, key):
+        return dict.get(self, key)
+    
+    def set(self, key, value):
+        self[key] = value
+    
+    def delete(self, key):
+        self.pop(key, None)
+
+class TestXClient(unittest.TestCase):
+    """Test cases for X client pagination and incremental polling."""
+    
+    def setUp(self):
+        """Set up client."""
+        self.store = FakeRedis()
+        self.client = XClient({
+            'bearer_token': 'token',
+            'endpoint': 'https://api.x.com/2/tweets/search/recent',
+            'query': 'crypto',
+            'max_results': 2
+        }, state_store=self.store)
+    
+    def test_follows_next_token(self):
+        """Test that all result pages are fetched."""
+        pages = [make_page(['105', '104'], 'p2'), make_page(['103', '102'], 'p3'), make_page(['101'])]
+        with patch.object(XClient, '_make_request', side_effect=pages) as request:
+            tweets = self.client.get_tweets()
+        
+        self.assertEqual([tweet['id'] for tweet in tweets], ['105', '104', '103', '102', '101'])
+        self.assertEqual(request.call_count, 3)
+        self.assertNotIn('next_token', request.call_args_list[0].kwargs['params'])
+        self.assertEqual(request.call_args_list[2].kwargs['params']['next_token'], 'p3')
+    
+    def test_max_pages(self):
+        """Test that pagination stops at the configured page limit."""
+        self.client.max_pages = 1
+        with patch.object(XClient, '_make_request', return_value=make_page(['102', '101'], 'p2')) as request:
+            tweets = self.client.get_tweets()
+        
+        self.assertEqual(len(tweets), 2)
+        self.assertEqual(request.call_count, 1)
+        self.assertEqual(self.client.next_token, 'p2')
+    
+    def test_truncated_poll_resumes(self):
+        """Test that a poll cut short by max_pages keeps the high-water mark until the older tweets are fetched."""
+        self.client.commit_since_id(make_page(['100'])['data'])
+        self.client.max_pages = 1
+        with patch.object(XClient, '_make_request', return_value=make_page(['110', '109'], 'p2')):
+            self.client.commit_since_id(self.client.poll_tweets())
+        self.assertEqual(self.client.get_since_id(), '100')
+        
+        # The next poll fetches the tweets between the high-water mark and the oldest one fetched
+        with patch.object(XClient, '_make_request', return_value=make_page(['108', '107'])) as request:
+            self.client.commit_since_id(self.client.poll_tweets())
+            params = request.call_args.kwargs['params']
+            self.assertEqual(params['since_id'], '100')
+            self.assertEqual(params['until_id'], '109')
+        self.assertEqual(self.client.get_since_id(), '110')
+        self.assertIsNone(self.client.get_backlog())
+        
+        with patch.object(XClient, '_make_request', return_value=make_page([])) as request:
+            self.client.poll_tweets()
+            self.assertNotIn('until_id', request.call_args.kwargs['params'])
+    
+    def test_polls_with_since_id(self):
+        """Test that polls after a commit only ask for newer tweets."""
+        with patch.object(XClient, '_make_request', return_value=make_page(['9', '10'])) as request:
+            tweets = self.client.poll_tweets()
+            self.assertIn('start_time', request.call_args.kwargs['params'])
+        
+        self.client.commit_since_id(tweets)
+        self.assertEqual(self.store['x:since_id'], '10')
+        
+        with patch.object(XClient, '_make_request', return_value=make_page([])) as request:
+            self.assertEqual(self.client.poll_tweets(), [])
+            params = request.call_args.kwargs['params']
+            self.assertEqual(params['since_id'], '10')
+            self.assertNotIn('start_time', params)
+    
+    def test_commit_never_moves_back(self):
+        """Test that an older batch does not lower the high-water mark."""
+        self.client.commit_since_id(make_page(['200'])['data'])
+        self.client.commit_since_id(make_page(['150'])['data'])
+        self.assertEqual(self.client.get_since_id(), '200')
+    
+    def test_empty_result_is_valid(self):
+        """Test that a search without matches passes validation."""
+        self.assertTrue(self.client.validate_response({'meta': {'result_count': 0}}))
+        self.assertFalse(self.client.validate_response({'meta': {'result_count': 3}}))
+
+if __name__ == '__main__':
+    unittest.main()